@@ -1,19 +1,28 @@
 #!/usr/bin/env python3
 import os
+import array
+import atexit
 import binascii
+import collections
 import secrets
 import time
 import json
 import socket
 import base64
+import copy
 import datetime
+import functools
+import gzip
+import hashlib
 import io
+import itertools
 import csv
 import subprocess
-import html
+import shutil
+import tempfile
 import threading
 import urllib.parse
-from flask import Flask, request, render_template_string, url_for, send_file, redirect, jsonify, session, has_request_context
+from flask import Flask, request, url_for, send_file, redirect, session, has_request_context
 from flask_login import (
     LoginManager,
     UserMixin,
@@ -22,15 +31,33 @@ from flask_login import (
     login_user,
     logout_user,
 )
+from jinja2 import ChoiceLoader, DictLoader, FileSystemBytecodeCache
+from markupsafe import escape as markupsafe_escape
 from werkzeug.middleware.proxy_fix import ProxyFix
 from werkzeug.security import check_password_hash, generate_password_hash
 from werkzeug.utils import secure_filename
 import make_test_log
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    from Crypto.Cipher import AES
+except ImportError:
+    AES = None
+
 app = Flask(__name__)
 app.secret_key = os.environ.get("SECRET_KEY", "dev-secret-change-me")
 MAX_CONTENT_MB = int(os.environ.get("MAX_CONTENT_MB", "50"))
 app.config["MAX_CONTENT_LENGTH"] = MAX_CONTENT_MB * 1024 * 1024
+UPLOAD_CHUNK_SIZE = 1024 * 1024
 
 
 def env_flag(name, default=False):
@@ -52,9 +79,11 @@ AUDIT_LOG_BACKUPS = int(os.environ.get("AUDIT_LOG_BACKUPS", "5"))
 SESSION_COOKIE_SECURE = env_flag("SESSION_COOKIE_SECURE", PUBLIC_MODE)
 SESSION_COOKIE_SAMESITE = os.environ.get("SESSION_COOKIE_SAMESITE", "Lax")
 TRUST_PROXY = env_flag("TRUST_PROXY", False)
+X_ACCEL_REDIRECT_PREFIX = os.environ.get("X_ACCEL_REDIRECT_PREFIX", "").strip()
 RATE_LIMIT_STATE = {}
 RATE_LIMITS = {
     "scan": (int(os.environ.get("RATE_LIMIT_SCAN_PER_MIN", "12")), 60),
+    "upload": (int(os.environ.get("RATE_LIMIT_UPLOAD_PER_MIN", "12")), 60),
     "replay": (int(os.environ.get("RATE_LIMIT_REPLAY_PER_MIN", "6")), 60),
     "decode": (int(os.environ.get("RATE_LIMIT_DECODE_PER_MIN", "6")), 60),
     "generate": (int(os.environ.get("RATE_LIMIT_GENERATE_PER_MIN", "6")), 60),
@@ -65,11 +94,21 @@ login_manager.login_view = "login"
 login_manager.init_app(app)
 SCAN_CACHE = {}
 SCAN_CACHE_TTL = 30 * 60
+SCAN_CACHE_MAX_ENTRIES = int(os.environ.get("SCAN_CACHE_MAX_ENTRIES", "64"))
+STORED_SCAN_TOKENS = {}
 DECODE_CACHE = {}
 DECODE_CACHE_TTL = 30 * 60
+DECODE_CACHE_MAX_ENTRIES = int(os.environ.get("DECODE_CACHE_MAX_ENTRIES", "64"))
+CACHE_LOCK = threading.Lock()
 REPLAY_CACHE = {}
 REPLAY_CACHE_TTL = 30 * 60
+REPLAY_CACHE_MAX_ENTRIES = int(os.environ.get("REPLAY_CACHE_MAX_ENTRIES", "256"))
 REPLAY_LOCK = threading.Lock()
+REPLAY_LOG_MAX_LINES = int(os.environ.get("REPLAY_LOG_MAX_LINES", "10000"))
+REPLAY_EVENTS_KEEPALIVE_SECONDS = 10
+REPLAY_EVENTS_MAX_SECONDS = 30
+REPLAY_EVENTS_MAX_STREAMS = int(os.environ.get("REPLAY_EVENTS_MAX_STREAMS", "2"))
+REPLAY_EVENTS_SLOTS = threading.BoundedSemaphore(max(REPLAY_EVENTS_MAX_STREAMS, 1))
 REPLAY_RXPK_OVERRIDES = {
     "freq": 868.1,
     "chan": 0,
@@ -93,6 +132,7 @@ DECODE_RESULTS_INDEX_PATH = os.path.join(DATA_DIR, "decoded_results.json")
 DECODE_PROGRESS = {}
 AUTH_PATH = os.path.join(DATA_DIR, "auth.json")
 AUDIT_LOG_PATH = os.path.join(DATA_DIR, "audit.log")
+JINJA_CACHE_DIR = os.path.join(DATA_DIR, ".jinja_cache")
 CSRF_SESSION_KEY = "_csrf_token"
 
 app.config["SESSION_COOKIE_HTTPONLY"] = True
@@ -114,8 +154,12 @@ def get_csrf_token():
     return token
 
 
+def escape_html(value):
+    return str(markupsafe_escape(value))
+
+
 def get_csrf_input():
-    token = html.escape(get_csrf_token())
+    token = escape_html(get_csrf_token())
     return f"<input type=\"hidden\" name=\"csrf_token\" value=\"{token}\">"
 
 
@@ -129,7 +173,7 @@ def validate_csrf():
 
 @app.before_request
 def enforce_csrf():
-    if request.method != "POST":
+    if request.method not in ("POST", "PUT", "DELETE"):
         return None
     if request.endpoint == "static":
         return None
@@ -182,12 +226,10 @@ def get_user_log_usage(user_id):
         count += 1
         size = entry.get("size")
         if size is None:
-            path = entry.get("path", "")
-            if path and os.path.exists(path):
-                try:
-                    size = os.path.getsize(path)
-                except OSError:
-                    size = 0
+            try:
+                size = os.path.getsize(entry.get("path", ""))
+            except OSError:
+                size = 0
         total_bytes += int(size or 0)
     return count, total_bytes
 
@@ -218,9 +260,18 @@ def enforce_user_log_quota_after_store(user_id, entry):
     return True, ""
 
 
+@functools.lru_cache(maxsize=64)
+def format_utc_seconds(seconds):
+    return datetime.datetime.fromtimestamp(seconds, datetime.timezone.utc).strftime("%Y-%m-%d %H:%M:%S UTC")
+
+
+def utc_now_text():
+    return format_utc_seconds(int(time.time()))
+
+
 def audit_log(event, details=None):
     entry = {
-        "ts": datetime.datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S UTC"),
+        "ts": utc_now_text(),
         "event": event,
         "user": get_user_id(),
     }
@@ -248,8 +299,8 @@ def audit_log(event, details=None):
                     else:
                         os.replace(src, dst)
             os.replace(AUDIT_LOG_PATH, f"{AUDIT_LOG_PATH}.1")
-        with open(AUDIT_LOG_PATH, "a", encoding="utf-8") as handle:
-            handle.write(json.dumps(entry, ensure_ascii=True) + "\n")
+        with open(AUDIT_LOG_PATH, "ab") as handle:
+            handle.write(json_dumps(entry) + b"\n")
     except OSError:
         pass
 
@@ -264,7 +315,7 @@ def get_auth_config():
             config["username"]: {
                 "password_hash": config["password_hash"],
                 "must_change": config.get("must_change", False),
-                "created_at": datetime.datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S UTC"),
+                "created_at": utc_now_text(),
             }
         }
         config = {"users": users}
@@ -275,7 +326,7 @@ def get_auth_config():
             "admin": {
                 "password_hash": generate_password_hash("admin"),
                 "must_change": True,
-                "created_at": datetime.datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S UTC"),
+                "created_at": utc_now_text(),
             }
         }
     }
@@ -293,2990 +344,134 @@ def save_users(users):
     save_json_file(AUTH_PATH, config)
 
 
-def set_auth_password(username, password):
-    users = get_users()
-    entry = users.get(username)
-    if not entry:
-        return False
-    entry["password_hash"] = generate_password_hash(password)
-    entry["must_change"] = False
-    users[username] = entry
-    save_users(users)
-    return True
-
-
-def verify_credentials(username, password):
-    config = get_auth_config()
-    users = config.get("users", {})
-    entry = users.get(username)
-    if not entry:
-        return False
-    return check_password_hash(entry["password_hash"], password)
-
-
-@login_manager.user_loader
-def load_user(user_id):
-    config = get_auth_config()
-    if user_id in config.get("users", {}):
-        return AppUser(user_id)
-    return None
-
-
-STYLE_BLOCK = """
-  <link rel="stylesheet" href="https://fonts.googleapis.com/icon?family=Material+Icons">
-  <style>
-    :root {
-      color-scheme: light;
-      font-family: "Inter", "Segoe UI", system-ui, -apple-system, BlinkMacSystemFont, sans-serif;
-      --bg: linear-gradient(135deg, #eef2ff, #fdf2f8);
-      --card-bg: #fff;
-      --card-shadow: rgba(15, 23, 42, 0.08);
-      --accent: #2563eb;
-      --accent-hover: #1d4ed8;
-      --text-muted: #6b7280;
-      --border: #e5e7eb;
-    }
-
-    * {
-      box-sizing: border-box;
-    }
-
-    body {
-      margin: 0;
-      background: var(--bg);
-      min-height: 100vh;
-      display: flex;
-      align-items: stretch;
-      justify-content: stretch;
-      padding: 1.5rem 2.5rem;
-      color: #0f172a;
-    }
-
-    .outer-column {
-      width: 100%;
-      max-width: 1200px;
-      display: flex;
-      flex-direction: column;
-      gap: 0.375rem;
-      align-items: stretch;
-      margin: 0 auto;
-      position: relative;
-    }
-
-    .top-bar {
-      display: flex;
-      align-items: center;
-      justify-content: space-between;
-      gap: 1rem;
-      padding: 0.5rem 0.25rem 0;
-    }
-
-    .brand {
-      display: flex;
-      align-items: center;
-      gap: 0.75rem;
-    }
-
-    .brand img {
-      width: 52px;
-      height: auto;
-    }
-
-    .brand-title {
-      font-weight: 700;
-      font-size: 1.05rem;
-      letter-spacing: 0.01em;
-    }
-
-    .brand-subtitle {
-      font-size: 0.85rem;
-      color: var(--text-muted);
-    }
-
-    .menu-toggle {
-      display: inline-flex;
-      align-items: center;
-      justify-content: center;
-      width: 40px;
-      height: 40px;
-      border: 1px solid var(--border);
-      background: #fff;
-      border-radius: 12px;
-      padding: 0;
-      cursor: pointer;
-      font-weight: 600;
-      color: var(--accent);
-      transition: border-color 0.2s, background 0.2s;
-    }
-
-    .menu-toggle:hover {
-      background: #f8fafc;
-      border-color: var(--accent);
-    }
-
-    .top-actions {
-      display: inline-flex;
-      align-items: center;
-      gap: 0.6rem;
-    }
-
-    .user-pill {
-      display: inline-flex;
-      align-items: center;
-      border-radius: 999px;
-      padding: 0.35rem 0.8rem;
-      background: #f1f5f9;
-      color: #475569;
-      font-size: 0.85rem;
-      font-weight: 600;
-    }
-
-    .menu-toggle span {
-      display: block;
-    }
-
-    .menu-toggle .menu-label {
-      display: none;
-    }
-
-    .menu-toggle .bar {
-      width: 18px;
-      height: 2px;
-      background: #0f172a;
-      border-radius: 999px;
-      transition: transform 0.2s, opacity 0.2s;
-    }
-
-    .menu-toggle .bars {
-      display: inline-flex;
-      flex-direction: column;
-      gap: 3px;
-    }
-
-    .menu-toggle.open .bar:nth-child(1) {
-      transform: translateY(5px) rotate(45deg);
-    }
-
-    .menu-toggle.open .bar:nth-child(2) {
-      opacity: 0;
-    }
-
-    .menu-toggle.open .bar:nth-child(3) {
-      transform: translateY(-5px) rotate(-45deg);
-    }
-
-    .menu-panel {
-      position: absolute;
-      top: 4.5rem;
-      right: 1.5rem;
-      z-index: 50;
-      max-width: 520px;
-      background: #fff;
-      border: 1px solid var(--border);
-      border-radius: 16px;
-      box-shadow: 0 20px 50px rgba(15, 23, 42, 0.12);
-      padding: 0.75rem;
-      display: grid;
-      grid-template-columns: repeat(auto-fit, minmax(160px, 1fr));
-      gap: 0.35rem;
-    }
-
-    .menu-panel[hidden] {
-      display: none;
-    }
-
-    .menu-link {
-      display: flex;
-      align-items: center;
-      justify-content: center;
-      padding: 0.5rem 0.75rem;
-      border-radius: 12px;
-      text-decoration: none;
-      color: #0f172a;
-      font-weight: 600;
-      border: 1px solid transparent;
-      transition: border-color 0.2s, color 0.2s, background 0.2s;
-      gap: 0.4rem;
-    }
-
-    .menu-link .material-icons {
-      font-size: 18px;
-      line-height: 1;
-    }
-
-    .menu-toggle .material-icons {
-      font-size: 18px;
-      line-height: 1;
-    }
-
-    .page-title {
-      display: inline-flex;
-      align-items: center;
-      gap: 0.5rem;
-    }
-
-    .page-title .material-icons {
-      font-size: 24px;
-      line-height: 1;
-      color: var(--accent);
-    }
-
-    .menu-link:hover {
-      border-color: rgba(37, 99, 235, 0.4);
-      background: rgba(37, 99, 235, 0.08);
-      color: var(--accent-hover);
-    }
-
-    .menu-link.active {
-      border-color: rgba(37, 99, 235, 0.6);
-      background: rgba(37, 99, 235, 0.15);
-      color: var(--accent);
-    }
-
-    .logo-card {
-      width: 100%;
-      background: transparent;
-      border-radius: 24px;
-      box-shadow: none;
-      border: none;
-      padding: 0.375rem;
-      text-align: center;
-    }
-
-    .logo-card img {
-      max-width: 120px;
-      width: 25%;
-      height: auto;
-    }
-
-    .card {
-      width: 100%;
-      background: var(--card-bg);
-      border-radius: 24px;
-      box-shadow: 0 24px 70px var(--card-shadow);
-      padding: 3rem;
-      border: 1px solid var(--border);
-    }
-
-    h1 {
-      margin: 0 0 0.4rem;
-      font-size: 2.05rem;
-    }
-
-    .subtitle {
-      margin: 0 0 2rem;
-      color: var(--text-muted);
-      font-size: 1rem;
-    }
-
-    form {
-      display: flex;
-      flex-direction: column;
-      gap: 1.5rem;
-    }
-
-    label {
-      font-weight: 600;
-      margin-bottom: 0.4rem;
-    }
-
-    label + input,
-    label + select {
-      margin-top: 0.35rem;
-    }
-
-    .field-group {
-      display: flex;
-      flex-direction: column;
-      gap: 0.35rem;
-    }
-
-    .field-header {
-      font-weight: 600;
-    }
-
-    .devaddr-label {
-      color: var(--accent);
-    }
-
-    .field-controls {
-      position: relative;
-      display: flex;
-      align-items: center;
-      min-width: 0;
-    }
-
-    .input-with-actions {
-      flex: 1;
-      min-width: 0;
-    }
-
-    .field-tools {
-      position: absolute;
-      right: 0.4rem;
-      display: inline-flex;
-      gap: 0.3rem;
-      background: #fff;
-      padding-left: 0.3rem;
-    }
-
-    .icon-button {
-      border: 1px solid var(--border);
-      background: #fff;
-      border-radius: 8px;
-      width: 32px;
-      height: 32px;
-      display: inline-flex;
-      align-items: center;
-      justify-content: center;
-      font-size: 0.85rem;
-      color: var(--accent);
-      cursor: pointer;
-      transition: border-color 0.2s, color 0.2s, background 0.2s;
-    }
-
-    .icon-button .material-icons {
-      font-size: 18px;
-      line-height: 1;
-    }
-
-    .icon-button:hover {
-      border-color: var(--accent);
-      background: rgba(37, 99, 235, 0.05);
-    }
-
-    .toggle-visibility {
-      position: absolute;
-      right: 0.4rem;
-      border: 1px solid var(--border);
-      background: #fff;
-      border-radius: 8px;
-      width: 32px;
-      height: 32px;
-      display: inline-flex;
-      align-items: center;
-      justify-content: center;
-      font-size: 0.9rem;
-      color: var(--accent);
-      cursor: pointer;
-      transition: border-color 0.2s, color 0.2s, background 0.2s;
-    }
-
-    .toggle-visibility .material-icons {
-      font-size: 18px;
-      line-height: 1;
-    }
-
-    .toggle-visibility:hover {
-      border-color: var(--accent);
-      background: rgba(37, 99, 235, 0.05);
-    }
-
-    .inline-action {
-      display: inline-flex;
-      align-items: center;
-      gap: 0.35rem;
-      padding: 0.35rem 0.75rem;
-      border-radius: 999px;
-      background: rgba(37, 99, 235, 0.12);
-      color: var(--accent);
-      font-size: 0.85rem;
-      text-decoration: none;
-      border: 1px solid rgba(37, 99, 235, 0.25);
-      transition: background 0.2s, color 0.2s, border-color 0.2s;
-    }
-
-    .inline-action:hover {
-      background: rgba(37, 99, 235, 0.18);
-      color: var(--accent-hover);
-      border-color: rgba(37, 99, 235, 0.4);
-    }
-
-    .inline-action span {
-      font-weight: 600;
-    }
-
-    .inline-action-row {
-      margin-bottom: 0.5rem;
-    }
-
-    .logfile-options {
-      display: grid;
-      grid-template-columns: repeat(auto-fit, minmax(260px, 1fr));
-      gap: 0.85rem;
-      margin-top: 0.25rem;
-    }
-
-    .logfile-option {
-      border: 1px solid var(--border);
-      border-radius: 14px;
-      padding: 1rem;
-      background: #f8fafc;
-      display: flex;
-      flex-direction: column;
-      gap: 0.5rem;
-      height: 100%;
-    }
-
-    .logfile-option h3 {
-      margin: 0;
-      font-size: 1.05rem;
-    }
-
-    .logfile-option .hint {
-      margin: 0;
-    }
-
-    .option-actions {
-      margin-top: auto;
-      display: flex;
-      gap: 0.5rem;
-      flex-wrap: wrap;
-    }
-
-    .option-actions .secondary-button {
-      width: 100%;
-      justify-content: center;
-      text-align: center;
-    }
-
-    .next-steps {
-      margin-top: 1.5rem;
-      padding: 1.25rem;
-      border: 1px solid var(--border);
-      border-radius: 16px;
-      background: #f8fafc;
-    }
-
-    .next-steps h2 {
-      margin: 0 0 0.6rem;
-      font-size: 1.1rem;
-    }
-
-    .action-grid {
-      display: grid;
-      grid-template-columns: repeat(auto-fit, minmax(180px, 1fr));
-      gap: 0.75rem;
-    }
-
-    input[type=text],
-    input[type=number],
-    input[type=file],
-    input[type=datetime-local],
-    input[type=password],
-    select {
-      width: 100%;
-      border: 1px solid var(--border);
-      border-radius: 10px;
-      padding: 0.65rem 0.75rem;
-      font-size: 1rem;
-      transition: border-color 0.2s, box-shadow 0.2s;
-    }
-
-    input[type=text]:focus,
-    input[type=number]:focus,
-    input[type=file]:focus,
-    input[type=datetime-local]:focus,
-    input[type=password]:focus,
-    select:focus {
-      outline: none;
-      border-color: var(--accent);
-      box-shadow: 0 0 0 3px rgba(37, 99, 235, 0.15);
-    }
-
-    input[type=password] {
-      font-family: inherit;
-      letter-spacing: normal;
-    }
-
-    .key-input {
-      font-family: "IBM Plex Mono", "SFMono-Regular", "Menlo", monospace;
-      font-size: 0.72rem;
-      letter-spacing: -0.01em;
-      font-variant-ligatures: none;
-    }
-
-    .hint {
-      font-size: 0.9rem;
-      color: var(--text-muted);
-      margin-top: 0.35rem;
-    }
-
-    .simple-list {
-      margin: 0.5rem 0 0;
-      padding-left: 1.2rem;
-      color: #0f172a;
-    }
-
-    .simple-list li {
-      margin: 0.25rem 0;
-    }
-
-    .decoder-list {
-      list-style: none;
-      padding: 0;
-      margin: 0.75rem 0 0;
-      display: flex;
-      flex-direction: column;
-      gap: 0.6rem;
-    }
-
-    .file-list {
-      display: flex;
-      flex-direction: column;
-      gap: 0.7rem;
-      margin-top: 0.6rem;
-    }
-
-    .file-entry {
-      border: 1px solid var(--border);
-      border-radius: 12px;
-      background: #f8fafc;
-      overflow: hidden;
-    }
-
-    .file-entry summary {
-      list-style: none;
-      cursor: pointer;
-      padding: 0.75rem 0.9rem;
-      display: flex;
-      align-items: center;
-      justify-content: space-between;
-      gap: 0.75rem;
-      font-weight: 600;
-      color: #0f172a;
-    }
-
-    .file-entry summary::-webkit-details-marker {
-      display: none;
-    }
-
-    .file-entry[open] summary {
-      border-bottom: 1px solid var(--border);
-      background: #fff;
-    }
-
-    .file-summary {
-      display: flex;
-      align-items: center;
-      gap: 0.6rem;
-      flex-wrap: wrap;
-    }
-
-    .file-meta {
-      font-size: 0.85rem;
-      color: var(--text-muted);
-      font-weight: 500;
-    }
-
-    .file-body {
-      padding: 0.75rem 0.9rem;
-      display: flex;
-      flex-direction: column;
-      gap: 0.6rem;
-    }
-
-    .file-controls {
-      display: grid;
-      grid-template-columns: repeat(auto-fit, minmax(180px, 1fr));
-      gap: 0.6rem;
-      align-items: center;
-      margin-top: 0.5rem;
-    }
-
-    .decoder-item {
-      display: flex;
-      align-items: center;
-      justify-content: space-between;
-      gap: 0.75rem;
-      padding: 0.6rem 0.75rem;
-      border: 1px solid var(--border);
-      border-radius: 12px;
-      background: #f8fafc;
-    }
-
-    .decoder-link {
-      color: #0f172a;
-      text-decoration: none;
-      font-weight: 600;
-      word-break: break-all;
-    }
-
-    .decoder-link:hover {
-      color: var(--accent-hover);
-    }
-
-    .decoder-meta {
-      color: var(--text-muted);
-      font-size: 0.85rem;
-      margin-left: 0.5rem;
-    }
-
-    .decoder-actions {
-      display: inline-flex;
-      align-items: center;
-      gap: 0.4rem;
-    }
-
-    .file-actions {
-      display: inline-flex;
-      align-items: center;
-      flex-wrap: wrap;
-      gap: 0.4rem;
-    }
-
-    .file-actions-stack {
-      display: flex;
-      flex-direction: column;
-      align-items: flex-end;
-      gap: 0.5rem;
-    }
-
-    .saved-results {
-      display: flex;
-      flex-direction: column;
-      gap: 0.4rem;
-      margin-top: 0.5rem;
-    }
-
-    .saved-entry {
-      display: inline-flex;
-      align-items: center;
-      flex-wrap: wrap;
-      gap: 0.4rem;
-    }
-
-    .saved-label {
-      font-size: 0.85rem;
-      color: var(--text-muted);
-      font-weight: 600;
-    }
-
-    .code-block {
-      background: #0f172a;
-      color: #e2e8f0;
-      padding: 1rem;
-      border-radius: 12px;
-      font-family: "IBM Plex Mono", "SFMono-Regular", "Menlo", monospace;
-      font-size: 0.85rem;
-      line-height: 1.4;
-      overflow: auto;
-      max-height: 420px;
-    }
-
-    .scan-overlay {
-      position: fixed;
-      inset: 0;
-      background: rgba(15, 23, 42, 0.55);
-      display: flex;
-      align-items: center;
-      justify-content: center;
-      padding: 1.5rem;
-      z-index: 80;
-    }
-
-    .scan-overlay[hidden] {
-      display: none;
-    }
-
-    .scan-card {
-      background: #fff;
-      border-radius: 18px;
-      padding: 1.75rem;
-      width: min(560px, 95vw);
-      box-shadow: 0 25px 70px rgba(15, 23, 42, 0.18);
-      border: 1px solid var(--border);
-    }
-
-    .scan-card h2 {
-      margin: 0 0 0.75rem;
-      font-size: 1.3rem;
-    }
-
-    .scan-card .form-actions {
-      margin-top: 1rem;
-    }
-
-    button {
-      padding: 0.9rem 1.4rem;
-      border-radius: 12px;
-      border: none;
-      font-size: 1rem;
-      font-weight: 600;
-      background: var(--accent);
-      color: white;
-      cursor: pointer;
-      transition: background 0.2s, transform 0.1s;
-    }
-
-    button:hover {
-      background: var(--accent-hover);
-    }
-
-    button:active {
-      transform: translateY(1px);
-    }
-
-    button:disabled {
-      background: #94a3b8;
-      cursor: not-allowed;
-      transform: none;
-    }
-
-    .form-actions {
-      display: flex;
-      flex-wrap: wrap;
-      gap: 0.8rem;
-      align-items: center;
-    }
-
-    .secondary-button {
-      display: inline-flex;
-      align-items: center;
-      justify-content: center;
-      padding: 0.85rem 1.2rem;
-      border-radius: 12px;
-      border: 1px solid var(--border);
-      background: #fff;
-      color: var(--accent);
-      font-weight: 600;
-      text-decoration: none;
-      gap: 0.45rem;
-      transition: border-color 0.2s, color 0.2s;
-    }
-
-    .secondary-button:hover {
-      background: #f8fafc;
-      border-color: var(--accent);
-      color: var(--accent-hover);
-    }
-
-    .secondary-button.icon-only {
-      width: 40px;
-      height: 40px;
-      padding: 0;
-      border-radius: 12px;
-    }
-
-    .danger-button {
-      display: inline-flex;
-      align-items: center;
-      justify-content: center;
-      width: 32px;
-      height: 32px;
-      border-radius: 8px;
-      border: 1px solid #fecaca;
-      background: #fee2e2;
-      color: #b91c1c;
-      cursor: pointer;
-      transition: background 0.2s, border-color 0.2s;
-    }
-
-    .danger-button:hover {
-      background: #fecaca;
-      border-color: #fca5a5;
-    }
-
-    .danger-button.danger-text {
-      width: auto;
-      height: auto;
-      padding: 0.85rem 1.2rem;
-      font-size: 0.9rem;
-      font-weight: 600;
-      gap: 0.35rem;
-    }
-
-    .danger-button svg {
-      width: 18px;
-      height: 18px;
-      display: block;
-      fill: currentColor;
-    }
-
-    .stop-replay-button {
-      background: #dc2626;
-    }
-
-    .stop-replay-button:hover {
-      background: #b91c1c;
-    }
-
-    .start-replay-button,
-    .resume-replay-button {
-      background: #16a34a;
-    }
-
-    .start-replay-button:hover,
-    .resume-replay-button:hover {
-      background: #15803d;
-    }
-
-    .restart-replay-button {
-      background: #f97316;
-    }
-
-    .restart-replay-button:hover {
-      background: #ea580c;
-    }
-
-    .is-hidden {
-      display: none;
-    }
-
-    .field-controls.key-controls {
-      gap: 0.5rem;
-    }
-
-    .field-controls.key-controls .toggle-visibility {
-      position: static;
-    }
-
-    .primary-button {
-      display: inline-flex;
-      align-items: center;
-      justify-content: center;
-      padding: 0.85rem 1.4rem;
-      border-radius: 12px;
-      background: var(--accent);
-      color: #fff;
-      font-weight: 600;
-      text-decoration: none;
-      border: 1px solid transparent;
-      gap: 0.45rem;
-      transition: background 0.2s, transform 0.2s;
-    }
-
-    .primary-button .material-icons,
-    .secondary-button .material-icons,
-    .danger-button.danger-text .material-icons {
-      font-size: 18px;
-      line-height: 1;
-    }
-
-    .danger-button .material-icons {
-      font-size: 18px;
-      line-height: 1;
-    }
-
-    .primary-button:hover {
-      background: var(--accent-hover);
-      transform: translateY(-1px);
-    }
-
-    .form-actions button,
-    .form-actions .secondary-button {
-      flex: 1;
-      min-width: 180px;
-      justify-content: center;
-      text-align: center;
-    }
-
-    .payload-examples {
-      margin-top: 0.7rem;
-      padding: 0.9rem;
-      border: 1px solid var(--border);
-      border-radius: 12px;
-      background: #f8fafc;
-      display: flex;
-      flex-direction: column;
-      gap: 0.5rem;
-    }
-
-    .payload-examples label {
-      margin: 0;
-      font-weight: 600;
-      font-size: 0.95rem;
-      color: #0f172a;
-    }
-
-    .card-header {
-      display: flex;
-      justify-content: space-between;
-      align-items: flex-start;
-      gap: 1rem;
-      margin-bottom: 1rem;
-    }
-
-    .file-drop {
-      border: 1px dashed var(--accent);
-      border-radius: 14px;
-      padding: 1.1rem;
-      background: linear-gradient(135deg, rgba(37, 99, 235, 0.08), rgba(37, 99, 235, 0.16));
-      display: flex;
-      align-items: center;
-      justify-content: space-between;
-      gap: 0.75rem;
-      cursor: pointer;
-      transition: border-color 0.2s, box-shadow 0.2s, background 0.2s;
-    }
-
-    .file-drop:hover {
-      border-color: var(--accent);
-      box-shadow: 0 14px 34px rgba(37, 99, 235, 0.14);
-      background: linear-gradient(135deg, rgba(37, 99, 235, 0.12), rgba(37, 99, 235, 0.2));
-    }
-
-    .file-drop.dragover {
-      border-color: var(--accent);
-      background: linear-gradient(135deg, rgba(37, 99, 235, 0.16), rgba(37, 99, 235, 0.24));
-    }
-
-    .file-drop .file-text {
-      display: flex;
-      flex-direction: column;
-      gap: 0.2rem;
-    }
-
-    .file-drop .file-text strong {
-      font-size: 1rem;
-      color: var(--accent);
-    }
-
-    .file-drop .file-selected {
-      color: var(--text-muted);
-      font-size: 0.9rem;
-      word-break: break-all;
-    }
-
-    .file-drop .choose-button {
-      padding: 0.65rem 1rem;
-      border-radius: 10px;
-      border: 1px solid var(--border);
-      background: #fff;
-      font-weight: 600;
-      color: var(--accent);
-      transition: border-color 0.2s, color 0.2s;
-    }
-
-    .file-drop .choose-button:hover {
-      border-color: var(--accent);
-      color: var(--accent-hover);
-    }
-
-    @media (max-width: 540px) {
-      body {
-        padding: 1rem;
-      }
-
-      .card {
-        padding: 2rem 1.5rem;
-      }
-
-      .card-header {
-        flex-direction: column;
-        align-items: flex-start;
-      }
-    }
-
-    .result {
-      border-radius: 12px;
-      padding: 0.9rem 1.1rem;
-      font-size: 0.95rem;
-      line-height: 1.4;
-    }
-
-    .result.success {
-      background: #ecfdf5;
-      border: 1px solid #34d399;
-      color: #065f46;
-    }
-
-    .result.error {
-      background: #fef2f2;
-      border: 1px solid #f87171;
-      color: #7f1d1d;
-    }
-
-    .result.info {
-      background: #eff6ff;
-      border: 1px solid #93c5fd;
-      color: #1e3a8a;
-    }
-
-    .replay-status {
-      margin-top: 1rem;
-    }
-
-    .log-wrapper {
-      width: 100%;
-    }
-
-    .loading-overlay {
-      position: fixed;
-      inset: 0;
-      background: rgba(255, 255, 255, 0.7);
-      display: flex;
-      align-items: center;
-      justify-content: center;
-      z-index: 50;
-    }
-
-    .loading-overlay[hidden] {
-      display: none;
-    }
-
-    .loading-card {
-      background: #fff;
-      border-radius: 18px;
-      box-shadow: 0 20px 60px rgba(15, 23, 42, 0.18);
-      padding: 24px 28px;
-      display: flex;
-      align-items: center;
-      gap: 16px;
-      color: #0f172a;
-      font-weight: 600;
-    }
-
-    [data-decode-overlay] .loading-card {
-      flex-direction: column;
-      align-items: stretch;
-      gap: 14px;
-      width: min(520px, 90vw);
-      padding: 28px 30px;
-    }
-
-    [data-decode-overlay] .progress-track {
-      height: 14px;
-      margin-top: 0;
-      background: #e2e8f0;
-    }
-
-    [data-decode-overlay] .progress-fill {
-      transition: width 0.25s ease-out, background 0.25s ease-out;
-    }
-
-    [data-decode-overlay] .progress-meta {
-      font-size: 0.95rem;
-      color: #334155;
-    }
-
-    [data-decode-overlay] .progress-percent {
-      font-weight: 700;
-      color: #1d4ed8;
-    }
-
-    .spinner {
-      width: 32px;
-      height: 32px;
-      border: 4px solid rgba(15, 23, 42, 0.2);
-      border-top-color: #2563eb;
-      border-radius: 50%;
-      animation: spin 0.8s linear infinite;
-    }
-
-    @keyframes spin {
-      to {
-        transform: rotate(360deg);
-      }
-    }
-
-    .log-block {
-      border-radius: 20px;
-      border: 1px solid var(--border);
-      background: #fff;
-      box-shadow: 0 12px 40px rgba(15, 23, 42, 0.08);
-      padding: 1.2rem 1.4rem;
-      width: 100%;
-    }
-
-    .log-block summary {
-      cursor: pointer;
-      font-weight: 600;
-      color: var(--accent);
-      outline: none;
-      font-size: 1.05rem;
-    }
-
-    .log-controls {
-      display: flex;
-      justify-content: flex-end;
-      margin-bottom: 0.6rem;
-      gap: 0.6rem;
-      flex-wrap: wrap;
-      font-size: 0.9rem;
-    }
-
-    .log-controls select {
-      width: auto;
-      padding: 0.35rem 0.6rem;
-      border-radius: 8px;
-      border: 1px solid var(--border);
-      font-size: 0.9rem;
-    }
-
-    .log-table {
-      width: 100%;
-      border-collapse: collapse;
-      margin-top: 1rem;
-      font-size: 0.9rem;
-    }
-
-    .log-table th,
-    .log-table td {
-      text-align: left;
-      padding: 0.55rem;
-      border-bottom: 1px solid var(--border);
-    }
-
-    .log-table.users-table th,
-    .log-table.users-table td {
-      white-space: nowrap;
-      vertical-align: middle;
-    }
-
-    .key-grid.user-grid {
-      grid-template-columns: minmax(200px, 1fr) minmax(200px, 1fr) minmax(220px, 1fr) 140px;
-      align-items: end;
-    }
-
-    .users-password-row {
-      display: flex;
-      align-items: center;
-      gap: 0.5rem;
-      margin-top: 0.35rem;
-    }
-
-    .users-password-row .secondary-button {
-      width: auto;
-      min-width: 0;
-      padding: 0.85rem 1.2rem;
-    }
-
-    .log-table th {
-      font-weight: 600;
-      color: var(--text-muted);
-      font-size: 0.85rem;
-    }
-
-    .log-table th button {
-      background: none;
-      border: none;
-      color: inherit;
-      font: inherit;
-      cursor: pointer;
-      display: inline-flex;
-      align-items: center;
-      gap: 0.2rem;
-      padding: 0;
-    }
-
-    .log-table th button.sorted-asc::after {
-      content: "▲";
-      font-size: 0.7rem;
-      color: var(--accent);
-    }
-
-    .log-table th button.sorted-desc::after {
-      content: "▼";
-      font-size: 0.7rem;
-      color: var(--accent);
-    }
-
-    .modal-overlay {
-      position: fixed;
-      inset: 0;
-      background: rgba(15, 23, 42, 0.55);
-      display: flex;
-      align-items: center;
-      justify-content: center;
-      padding: 1.5rem;
-      z-index: 90;
-    }
-
-    .modal-overlay[hidden] {
-      display: none;
-    }
-
-    .modal-card {
-      background: #fff;
-      border-radius: 18px;
-      padding: 1.75rem;
-      width: min(520px, 92vw);
-      box-shadow: 0 25px 70px rgba(15, 23, 42, 0.18);
-      border: 1px solid var(--border);
-    }
-
-    .modal-card h2 {
-      margin: 0 0 0.75rem;
-      font-size: 1.3rem;
-    }
-
-    .modal-actions {
-      display: flex;
-      flex-wrap: wrap;
-      gap: 0.6rem;
-      margin-top: 1rem;
-      align-items: center;
-    }
-
-    .user-name {
-      font-weight: 700;
-    }
-
-    .log-table tbody tr.ok td {
-      color: #047857;
-    }
-
-    .log-table tbody tr.err td {
-      color: #b91c1c;
-    }
-
-    .truncate-cell {
-      max-width: 320px;
-      white-space: nowrap;
-      overflow: hidden;
-      text-overflow: ellipsis;
-      cursor: pointer;
-    }
-
-    .truncate-cell.expanded {
-      white-space: pre-wrap;
-      overflow: visible;
-      text-overflow: unset;
-      max-width: none;
-      cursor: zoom-out;
-    }
-
-    .truncate-cell::after {
-      content: " ⤢";
-      color: var(--text-muted);
-      font-size: 0.75rem;
-    }
-
-    .truncate-cell.expanded::after {
-      content: " ⤡";
-    }
-
-    .cell-action {
-      display: inline-flex;
-      align-items: center;
-      gap: 0.35rem;
-      padding: 0.3rem 0.6rem;
-      border-radius: 999px;
-      border: 1px solid var(--border);
-      background: #fff;
-      color: var(--accent);
-      font-weight: 600;
-      font-size: 0.85rem;
-      cursor: pointer;
-    }
-
-    .cell-action:hover {
-      border-color: var(--accent);
-      color: var(--accent-hover);
-    }
-
-    .detail-overlay {
-      position: fixed;
-      inset: 0;
-      background: rgba(15, 23, 42, 0.4);
-      display: flex;
-      align-items: center;
-      justify-content: center;
-      padding: 1.5rem;
-      z-index: 80;
-    }
-
-    .detail-overlay[hidden] {
-      display: none;
-    }
-
-    .detail-card {
-      width: min(900px, 100%);
-      max-height: 85vh;
-      background: #fff;
-      border-radius: 18px;
-      border: 1px solid var(--border);
-      box-shadow: 0 18px 50px rgba(15, 23, 42, 0.2);
-      padding: 1.5rem;
-      display: flex;
-      flex-direction: column;
-      gap: 1rem;
-    }
-
-    .detail-card h2 {
-      margin: 0;
-      font-size: 1.35rem;
-    }
-
-    .detail-grid {
-      display: grid;
-      grid-template-columns: repeat(auto-fit, minmax(220px, 1fr));
-      gap: 0.75rem;
-      font-size: 0.95rem;
-    }
-
-    .detail-block {
-      background: #f8fafc;
-      border: 1px solid var(--border);
-      border-radius: 12px;
-      padding: 0.9rem;
-      font-size: 0.9rem;
-      max-height: 30vh;
-      overflow: auto;
-      white-space: pre-wrap;
-      word-break: break-word;
-    }
-
-    .detail-block pre {
-      margin: 0;
-      white-space: pre-wrap;
-      word-break: break-word;
-      font-family: "SFMono-Regular", "Menlo", "Consolas", "Liberation Mono", monospace;
-      font-size: 0.85rem;
-    }
-
-    .detail-collapsible summary {
-      cursor: pointer;
-      font-weight: 600;
-      color: var(--accent);
-    }
-
-    .detail-actions {
-      display: flex;
-      justify-content: flex-end;
-      gap: 0.6rem;
-    }
-
-    .detail-actions button {
-      width: auto;
-    }
-
-    .section-divider {
-      margin: 2rem 0;
-      border-top: 1px solid var(--border);
-    }
-
-    .key-grid {
-      display: grid;
-      grid-template-columns: repeat(auto-fit, minmax(240px, 1fr));
-      gap: 0.85rem;
-    }
-
-    .key-grid.add-device-grid {
-      grid-template-columns: minmax(140px, 0.6fr) minmax(260px, 1.4fr) minmax(280px, 1.7fr) minmax(280px, 1.7fr);
-      align-items: end;
-    }
-
-    .key-grid.user-add-grid {
-      grid-template-columns: minmax(200px, 0.8fr) minmax(520px, 2fr);
-      align-items: end;
-    }
-
-    .key-grid.device-grid {
-      grid-template-columns: minmax(200px, 1fr) minmax(200px, 1fr) minmax(200px, 1fr) 52px;
-      align-items: end;
-    }
-
-    .missing-keys-block {
-      background: #f8fafc;
-      border: 1px solid #e2e8f0;
-      border-radius: 16px;
-      padding: 1rem 1.2rem;
-      box-shadow: 0 10px 30px rgba(15, 23, 42, 0.04);
-    }
-
-    .integration-block {
-      background: #f8fafc;
-      border-color: #e2e8f0;
-      opacity: 0.7;
-    }
-
-    .integration-block .secondary-button,
-    .integration-block button {
-      background: #f1f5f9;
-      border-color: #e2e8f0;
-      color: #94a3b8;
-      cursor: not-allowed;
-      pointer-events: none;
-    }
-
-    .hint-divider {
-      margin: 0.6rem 0 0.9rem;
-      border-top: 1px dashed #cbd5f5;
-    }
-
-    .remove-cell {
-      display: flex;
-      justify-content: flex-end;
-      align-items: flex-start;
-      padding-top: 1.55rem;
-      padding-bottom: 0;
-    }
-
-    .remove-cell .danger-button {
-      width: 42px;
-      height: 42px;
-    }
-
-    @media (max-width: 1100px) {
-      .key-grid.user-grid {
-        grid-template-columns: repeat(auto-fit, minmax(220px, 1fr));
-      }
-
-      .key-grid.user-grid .remove-cell {
-        justify-content: flex-start;
-        padding-bottom: 0;
-      }
-    }
-
-    @media (max-width: 900px) {
-      .key-grid.add-device-grid {
-        grid-template-columns: repeat(auto-fit, minmax(220px, 1fr));
-      }
-
-      .key-grid.user-add-grid {
-        grid-template-columns: repeat(auto-fit, minmax(240px, 1fr));
-      }
-
-      .key-grid.device-grid {
-        grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
-      }
-
-      .remove-cell {
-        justify-content: flex-start;
-      }
-    }
-
-    .device-rows {
-      display: flex;
-      flex-direction: column;
-      gap: 1rem;
-    }
-
-    .device-row {
-      border: 1px solid var(--border);
-      border-radius: 14px;
-      padding: 1rem;
-      background: #f8fafc;
-    }
-
-    .table-actions {
-      display: flex;
-      flex-wrap: wrap;
-      gap: 0.6rem;
-      margin-top: 0.75rem;
-    }
-
-    .table-actions form {
-      margin: 0;
-    }
-
-    .table-actions.decode-actions {
-      margin-bottom: 0.8rem;
-    }
-
-    .analyze-summary {
-      display: grid;
-      grid-template-columns: repeat(auto-fit, minmax(180px, 1fr));
-      gap: 0.8rem;
-      margin: 0.8rem 0 1.2rem;
-    }
-
-    .stat-card {
-      padding: 1rem;
-      border-radius: 14px;
-      border: 1px solid var(--border);
-      background: #f8fafc;
-    }
-
-    .stat-card h3 {
-      margin: 0 0 0.4rem;
-      font-size: 0.95rem;
-      color: var(--text-muted);
-      font-weight: 600;
-      text-transform: uppercase;
-      letter-spacing: 0.06em;
-    }
-
-    .stat-card .stat-value {
-      font-size: 1.5rem;
-      font-weight: 700;
-      color: #0f172a;
-    }
-
-    .analyze-grid {
-      display: grid;
-      grid-template-columns: repeat(auto-fit, minmax(260px, 1fr));
-      gap: 1rem;
-    }
-
-    .chart-card {
-      border: 1px solid var(--border);
-      border-radius: 16px;
-      padding: 1rem;
-      background: #fff;
-      box-shadow: 0 12px 30px rgba(15, 23, 42, 0.06);
-      margin-bottom: 1rem;
-    }
-
-    .chart-card summary {
-      display: flex;
-      align-items: center;
-      gap: 0.4rem;
-      cursor: pointer;
-      font-weight: 700;
-      margin-bottom: 0.6rem;
-      list-style: none;
-    }
-
-    .chart-card summary::-webkit-details-marker {
-      display: none;
-    }
-
-    .chart-card summary::after {
-      content: "▸";
-      margin-left: auto;
-      transition: transform 0.15s ease;
-      opacity: 0.7;
-    }
-
-    .chart-card[open] summary::after {
-      transform: rotate(90deg);
-    }
-
-    .chart-card h3 {
-      margin: 0 0 0.6rem;
-      font-size: 1.05rem;
-    }
-
-    .bar-chart {
-      display: flex;
-      flex-direction: column;
-      gap: 0.4rem;
-    }
-
-    .bar-row {
-      display: grid;
-      grid-template-columns: minmax(70px, 1fr) 4fr minmax(36px, 64px);
-      align-items: center;
-      gap: 0.6rem;
-      font-size: 0.9rem;
-    }
-
-    .bar-track {
-      height: 10px;
-      border-radius: 999px;
-      background: #e2e8f0;
-      overflow: hidden;
-    }
-
-    .bar-fill {
-      height: 100%;
-      border-radius: 999px;
-      background: var(--accent);
-    }
-
-    .map-panel {
-      width: 100%;
-      height: 260px;
-      min-height: 260px;
-      border-radius: 14px;
-      border: 1px solid var(--border);
-      background: #f8fafc;
-      position: relative;
-      overflow: hidden;
-      margin-top: 0.8rem;
-    }
-
-    .map-panel.map-expanded {
-      position: fixed;
-      top: 2.5rem;
-      left: 1.5rem;
-      right: 1.5rem;
-      bottom: 1.5rem;
-      width: auto;
-      height: auto;
-      min-height: 0;
-      border-radius: 18px;
-      margin-top: 0;
-      z-index: 2000;
-      background: #e2e8f0;
-      box-shadow: 0 24px 60px rgba(15, 23, 42, 0.35);
-    }
-
-    .map-panel .map-svg {
-      width: 100%;
-      height: 100%;
-      position: absolute;
-      inset: 0;
-      pointer-events: none;
-    }
-
-    .map-panel iframe {
-      width: 100%;
-      height: 100%;
-      border: 0;
-      position: absolute;
-      inset: 0;
-    }
-
-    .leaflet-container {
-      position: relative;
-      overflow: hidden;
-      outline: 0;
-      background: #e2e8f0;
-    }
-
-    .leaflet-pane,
-    .leaflet-tile,
-    .leaflet-marker-icon,
-    .leaflet-marker-shadow,
-    .leaflet-tile-container,
-    .leaflet-pane > svg,
-    .leaflet-pane > canvas {
-      position: absolute;
-      left: 0;
-      top: 0;
-    }
-
-    .leaflet-pane {
-      z-index: 400;
-    }
-
-    .leaflet-tile-pane {
-      z-index: 200;
-    }
-
-    .leaflet-overlay-pane {
-      z-index: 400;
-    }
-
-    .leaflet-shadow-pane {
-      z-index: 500;
-    }
-
-    .leaflet-marker-pane {
-      z-index: 600;
-    }
-
-    .leaflet-tooltip-pane {
-      z-index: 650;
-    }
-
-    .leaflet-popup-pane {
-      z-index: 700;
-    }
-
-    .leaflet-tile-container {
-      z-index: 200;
-    }
-
-    .leaflet-tile {
-      width: 256px;
-      height: 256px;
-    }
-
-    .leaflet-overlay-pane svg {
-      overflow: visible;
-    }
-
-    .map-toggle-button {
-      width: 36px;
-      height: 36px;
-      border-radius: 8px;
-      border: 0;
-      background: transparent;
-      color: #0f172a;
-      font-size: 1rem;
-      cursor: pointer;
-      display: inline-flex;
-      align-items: center;
-      justify-content: center;
-    }
-
-    .map-toggle-button:hover {
-      background: rgba(37, 99, 235, 0.12);
-    }
-
-    .map-toggle-button.is-active {
-      background: rgba(37, 99, 235, 0.18);
-      color: #1d4ed8;
-    }
-
-    .map-toggle-button .material-icons {
-      font-size: 20px;
-      line-height: 1;
-    }
-
-    .map-button-row {
-      display: flex;
-      gap: 0.6rem;
-      padding: 0.25rem 0.35rem;
-      border-radius: 12px;
-      border: 1px solid rgba(15, 23, 42, 0.2);
-      background: rgba(255, 255, 255, 0.95);
-      box-shadow: 0 6px 16px rgba(15, 23, 42, 0.18);
-      pointer-events: auto;
-      z-index: 2;
-    }
-
-    .map-panel .leaflet-bottom.leaflet-left {
-      left: 50%;
-      right: auto;
-      transform: translateX(-50%);
-    }
-
-    .leaflet-zoom-animated {
-      transform-origin: 0 0;
-    }
-
-    .leaflet-zoom-hide {
-      visibility: hidden;
-    }
-
-    .leaflet-control-container {
-      position: absolute;
-      inset: 0;
-      z-index: 1000;
-      pointer-events: none;
-    }
-
-    .leaflet-top,
-    .leaflet-bottom {
-      position: absolute;
-      z-index: 1000;
-      pointer-events: none;
-    }
-
-    .leaflet-top {
-      top: 0;
-    }
-
-    .leaflet-bottom {
-      bottom: 0;
-    }
-
-    .leaflet-left {
-      left: 0;
-    }
-
-    .leaflet-right {
-      right: 0;
-    }
-
-    .leaflet-control {
-      margin: 10px;
-      pointer-events: auto;
-    }
-
-    .leaflet-bar {
-      border-radius: 8px;
-      box-shadow: 0 2px 12px rgba(15, 23, 42, 0.18);
-      overflow: hidden;
-      background: rgba(255, 255, 255, 0.95);
-      border: 1px solid rgba(15, 23, 42, 0.2);
-      display: inline-block;
-    }
-
-    .map-point {
-      fill: #0f172a;
-      opacity: 0.8;
-    }
-
-    .map-legend {
-      position: absolute;
-      bottom: 0.7rem;
-      right: 0.7rem;
-      background: rgba(255, 255, 255, 0.9);
-      border-radius: 10px;
-      padding: 0.35rem 0.6rem;
-      font-size: 0.75rem;
-      color: #0f172a;
-      border: 1px solid rgba(148, 163, 184, 0.4);
-    }
-
-    .table-scroll {
-      overflow-x: auto;
-    }
-
-    .analytics-controls {
-      display: grid;
-      grid-template-columns: repeat(auto-fit, minmax(220px, 1fr));
-      gap: 0.8rem;
-      margin-top: 0.8rem;
-    }
-
-    .analytics-controls .full-row {
-      grid-column: 1 / -1;
-    }
-
-    .analytics-controls .control-row {
-      display: flex;
-      flex-direction: column;
-      gap: 0.35rem;
-    }
-
-    .analytics-inline {
-      display: flex;
-      align-items: center;
-      gap: 0.5rem;
-    }
-
-    .analytics-inline input {
-      min-width: 0;
-    }
-
-    .analytics-hint {
-      font-size: 0.8rem;
-      color: var(--text-muted);
-    }
-
-    .chart-canvas {
-      width: 100%;
-      height: calc(100% - 2.75rem);
-      border: 1px solid var(--border);
-      border-radius: 12px;
-      background: #f8fafc;
-      display: block;
-    }
-
-    .chart-wrapper {
-      height: 360px;
-      width: 100%;
-      margin-top: 0.8rem;
-      position: relative;
-      background: #fff;
-      border: 1px solid var(--border);
-      border-radius: 16px;
-      padding: 1rem 1rem 3.75rem;
-      box-sizing: border-box;
-    }
-
-    .chart-wrapper.chart-expanded {
-      position: fixed;
-      top: 2.5rem;
-      left: 1rem;
-      right: 1rem;
-      bottom: 1.5rem;
-      height: auto;
-      width: calc(100% - 2rem);
-      z-index: 1900;
-      margin-top: 0;
-      border-radius: 18px;
-      box-shadow: 0 24px 60px rgba(15, 23, 42, 0.35);
-    }
-
-    .chart-button-row {
-      position: absolute;
-      bottom: 0.75rem;
-      left: 50%;
-      transform: translateX(-50%);
-      display: flex;
-      gap: 0.6rem;
-      z-index: 2;
-    }
-
-    .chart-toggle-button {
-      position: static;
-      width: 36px;
-      height: 36px;
-      border-radius: 10px;
-      border: 1px solid rgba(15, 23, 42, 0.2);
-      background: rgba(255, 255, 255, 0.95);
-      color: #0f172a;
-      font-size: 1rem;
-      cursor: pointer;
-      display: inline-flex;
-      align-items: center;
-      justify-content: center;
-      box-shadow: 0 6px 16px rgba(15, 23, 42, 0.18);
-    }
-
-    .chart-toggle-button.is-active {
-      background: rgba(37, 99, 235, 0.18);
-      color: #1d4ed8;
-    }
-
-    .chart-toggle-button:hover {
-      background: #ffffff;
-    }
-
-    .chart-toggle-button .material-icons {
-      font-size: 20px;
-      line-height: 1;
-    }
-
-    #stats_panel {
-      margin: 0.6rem 0 0.8rem;
-    }
-
-    .stats-card summary {
-      display: flex;
-      align-items: center;
-      gap: 0.4rem;
-      cursor: pointer;
-      font-weight: 600;
-      list-style: none;
-    }
-
-    .stats-card summary::-webkit-details-marker {
-      display: none;
-    }
-
-    .stats-card summary::after {
-      content: "▸";
-      margin-left: auto;
-      transition: transform 0.15s ease;
-      opacity: 0.7;
-    }
-
-    .stats-card[open] summary::after {
-      transform: rotate(90deg);
-    }
-
-    #stats_box {
-      margin-top: 0.4rem;
-    }
-
-    .stats-table {
-      border-collapse: collapse;
-      width: 100%;
-      max-width: 520px;
-      font-size: 0.9rem;
-    }
-
-    .stats-table td {
-      padding: 0.35rem 0.5rem;
-      border-bottom: 1px solid #e2e8f0;
-    }
-
-    .analysis-table {
-      width: 100%;
-      border-collapse: collapse;
-      font-size: 0.9rem;
-    }
-
-    .analysis-table th,
-    .analysis-table td {
-      padding: 0.4rem 0.5rem;
-      border-bottom: 1px solid #e2e8f0;
-      text-align: left;
-    }
-
-    .analysis-table-wrapper {
-      max-height: 360px;
-      overflow: auto;
-      border: 1px solid var(--border);
-      border-radius: 12px;
-      background: #fff;
-    }
-
-    .map-controls {
-      display: grid;
-      grid-template-columns: repeat(auto-fit, minmax(220px, 1fr));
-      gap: 0.8rem;
-      margin-top: 0.6rem;
-    }
-
-    .map-controls .control-row {
-      display: flex;
-      flex-direction: column;
-      gap: 0.35rem;
-    }
-
-    .map-controls .full-row {
-      grid-column: 1 / -1;
-    }
-
-    .map-svg {
-      width: 100%;
-      height: 100%;
-    }
-
-    .tag {
-      display: inline-flex;
-      align-items: center;
-      padding: 0.2rem 0.6rem;
-      border-radius: 999px;
-      font-size: 0.75rem;
-      font-weight: 600;
-      background: rgba(37, 99, 235, 0.12);
-      color: var(--accent);
-      border: 1px solid rgba(37, 99, 235, 0.2);
-      margin-left: 0.4rem;
-    }
-
-    .brand-note {
-      font-size: 0.95rem;
-      color: #475569;
-      text-align: center;
-      line-height: 1.4;
-    }
-
-    .brand-note a {
-      color: var(--accent);
-      font-weight: 600;
-      text-decoration: none;
-    }
+def set_auth_password(username, password):
+    users = get_users()
+    entry = users.get(username)
+    if not entry:
+        return False
+    entry["password_hash"] = generate_password_hash(password)
+    entry["must_change"] = False
+    users[username] = entry
+    save_users(users)
+    return True
 
-    .brand-note a:hover {
-      text-decoration: underline;
-    }
 
-    .progress-bar {
-      width: 220px;
-      height: 10px;
-      border-radius: 999px;
-      background: #e2e8f0;
-      overflow: hidden;
-      position: relative;
-    }
+def verify_credentials(username, password):
+    config = get_auth_config()
+    users = config.get("users", {})
+    entry = users.get(username)
+    if not entry:
+        return False
+    return check_password_hash(entry["password_hash"], password)
 
-    .progress-bar::after {
-      content: "";
-      position: absolute;
-      inset: 0;
-      width: 40%;
-      background: linear-gradient(90deg, rgba(37, 99, 235, 0.2), rgba(37, 99, 235, 0.9), rgba(37, 99, 235, 0.2));
-      animation: progress-slide 1.1s ease-in-out infinite;
-    }
 
-    @keyframes progress-slide {
-      0% { transform: translateX(-60%); }
-      100% { transform: translateX(160%); }
-    }
+@login_manager.user_loader
+def load_user(user_id):
+    config = get_auth_config()
+    if user_id in config.get("users", {}):
+        return AppUser(user_id)
+    return None
 
-    .progress-track {
-      width: 100%;
-      height: 10px;
-      border-radius: 999px;
-      background: #e2e8f0;
-      overflow: hidden;
-      margin-top: 0.5rem;
-    }
 
-    .progress-fill {
-      height: 100%;
-      background: linear-gradient(90deg, #1d4ed8, #3b82f6);
-      width: 0%;
-      transition: width 0.2s ease-out;
-    }
+STATIC_ASSET_VERSIONS = {}
+GZIP_MIN_BYTES = 1024
+GZIP_MIMETYPES = {"text/html", "application/json", "text/plain"}
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 5
+PRECOMPRESS_STATIC_FILES = {"app.css", "app.js"}
+PRECOMPRESSED_STATIC = {}
 
-    .progress-meta {
-      display: flex;
-      justify-content: space-between;
-      align-items: center;
-      font-size: 0.9rem;
-      color: #475569;
-      margin-top: 0.5rem;
-      gap: 1rem;
-      flex-wrap: wrap;
-    }
-  </style>
-"""
 
-SCRIPT_BLOCK = """
-  <script>
-    function randomHex(byteLength) {
-      const array = new Uint8Array(byteLength);
-      if (window.crypto && window.crypto.getRandomValues) {
-        window.crypto.getRandomValues(array);
-      } else {
-        for (let i = 0; i < array.length; i++) {
-          array[i] = Math.floor(Math.random() * 256);
-        }
-      }
-      return Array.from(array, (byte) =>
-        byte.toString(16).padStart(2, "0")
-      ).join("").toUpperCase();
-    }
+def static_asset_version(filename):
+    version = STATIC_ASSET_VERSIONS.get(filename)
+    if version is None:
+        with open(os.path.join(app.static_folder, filename), "rb") as handle:
+            version = hashlib.sha1(handle.read()).hexdigest()[:12]
+        STATIC_ASSET_VERSIONS[filename] = version
+    return version
 
-    function generateField(fieldId, type) {
-      let value = "";
-      switch (type) {
-        case "gateway_eui":
-          value = randomHex(8);
-          break;
-        case "devaddr":
-          value = randomHex(4);
-          break;
-        case "skey":
-          value = randomHex(16);
-          break;
-        default:
-          return;
-      }
-      const input = document.getElementById(fieldId);
-      if (input) {
-        input.value = value;
-      }
-    }
 
-    function generatePassword(length = 16) {
-      const chars = "ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz23456789!@#$%";
-      const array = new Uint8Array(length);
-      if (window.crypto && window.crypto.getRandomValues) {
-        window.crypto.getRandomValues(array);
-      } else {
-        for (let i = 0; i < array.length; i++) {
-          array[i] = Math.floor(Math.random() * chars.length);
-        }
-      }
-      let out = "";
-      for (let i = 0; i < array.length; i++) {
-        out += chars[array[i] % chars.length];
-      }
-      return out;
-    }
-    function copyField(fieldId) {
-      const input = document.getElementById(fieldId);
-      if (!input) return;
-      input.select();
-      input.setSelectionRange(0, 99999);
-    if (navigator.clipboard && navigator.clipboard.writeText) {
-      navigator.clipboard.writeText(input.value || "");
-    } else {
-      document.execCommand("copy");
-    }
-    }
+def static_asset_url(filename):
+    return url_for("static", filename=filename, v=static_asset_version(filename))
 
-    function initSortableTable(section) {
-      if (!section) return;
-      const table = section.querySelector("[data-sortable-table]");
-      if (!table) return;
-      const tbody = table.querySelector("tbody");
-      const originalRows = Array.from(tbody.rows);
-      const rowData = originalRows.map((row) => {
-        const data = {};
-        Object.keys(row.dataset || {}).forEach((key) => {
-          data[key] = (row.dataset[key] || "").toLowerCase();
-        });
-        return { element: row.cloneNode(true), data };
-      });
-
-      const numericColumns = new Set(
-        (table.dataset.numericKeys || "").split(",").filter(Boolean)
-      );
-      let sortKey = table.dataset.defaultSortKey || null;
-      let sortDir = 1;
-
-      const limitSelect = section.querySelector("[data-table-limit]");
-
-      function apply() {
-        let rows = rowData.slice();
-
-        if (sortKey) {
-          rows = rows.sort((a, b) => {
-            const aVal = a.data[sortKey] || "";
-            const bVal = b.data[sortKey] || "";
-            if (numericColumns.has(sortKey)) {
-              const aNum = parseFloat(aVal) || 0;
-              const bNum = parseFloat(bVal) || 0;
-              return sortDir * (aNum - bNum);
-            }
-            return (
-              sortDir *
-              aVal.localeCompare(bVal, undefined, { sensitivity: "base" })
-            );
-          });
-        }
 
-        let limit = rows.length;
-        if (limitSelect && limitSelect.value !== "all") {
-          const parsed = parseInt(limitSelect.value, 10);
-          if (!isNaN(parsed)) {
-            limit = parsed;
-          }
-        }
+def page_static_urls():
+    return build_page_static_urls(request.script_root)
 
-        const fragment = document.createDocumentFragment();
-        rows.slice(0, limit).forEach((row) => {
-          fragment.appendChild(row.element.cloneNode(true));
-        });
-        tbody.innerHTML = "";
-        tbody.appendChild(fragment);
-      }
-
-      section.querySelectorAll("[data-sort-key]").forEach((button) => {
-        button.addEventListener("click", () => {
-          const key = button.dataset.sortKey;
-          if (sortKey === key) {
-            sortDir *= -1;
-          } else {
-            sortKey = key;
-            sortDir = 1;
-          }
-          section
-            .querySelectorAll("[data-sort-key]")
-            .forEach((btn) => btn.classList.remove("sorted-asc", "sorted-desc"));
-          button.classList.add(sortDir === 1 ? "sorted-asc" : "sorted-desc");
-          apply();
-        });
-      });
-
-      if (limitSelect) {
-        limitSelect.addEventListener("change", apply);
-      }
-
-      apply();
-    }
 
-    function initTruncation(section) {
-      if (!section) return;
-      section.querySelectorAll("[data-truncate]").forEach((cell) => {
-        const full = cell.dataset.full || "";
-        if (!full || full.length <= 80) {
-          cell.textContent = full;
-          return;
-        }
-        const preview = full.slice(0, 80) + "…";
-        cell.textContent = preview;
-        cell.classList.add("truncate-cell");
-        cell.addEventListener("click", () => {
-          const isExpanded = cell.classList.toggle("expanded");
-          cell.textContent = isExpanded ? full : preview;
-        });
-      });
+@functools.lru_cache(maxsize=16)
+def build_page_static_urls(script_root):
+    return {
+        "app_css_url": static_asset_url("app.css"),
+        "app_js_url": static_asset_url("app.js"),
+        "favicon_url": url_for("static", filename="favicon.ico"),
+        "logo_url": url_for("static", filename="company_logo.png"),
     }
 
-    function initDetailOverlay(section) {
-      if (!section) return;
-      const overlay = document.querySelector("[data-detail-overlay]");
-      if (!overlay) return;
-      const title = overlay.querySelector("[data-detail-title]");
-      const meta = overlay.querySelector("[data-detail-meta]");
-      const payload = overlay.querySelector("[data-detail-payload]");
-      const decoded = overlay.querySelector("[data-detail-decoded]");
-      const closeBtn = overlay.querySelector("[data-detail-close]");
-
-      const close = () => {
-        overlay.hidden = true;
-      };
-      closeBtn?.addEventListener("click", close);
-      overlay.addEventListener("click", (event) => {
-        if (event.target === overlay) {
-          close();
-        }
-      });
-
-      section.addEventListener("click", (event) => {
-        const btn = event.target.closest("[data-detail-trigger]");
-        if (!btn) return;
-        const row = btn.closest("tr");
-        if (!row) return;
-        title.textContent = `Packet #${row.dataset.index || "?"}`;
-        meta.innerHTML = `
-          <div><strong>Status:</strong> ${row.dataset.status || "-"}</div>
-          <div><strong>DevAddr:</strong> ${row.dataset.devaddr || "-"}</div>
-          <div><strong>FCnt:</strong> ${row.dataset.fcnt || "-"}</div>
-          <div><strong>FPort:</strong> ${row.dataset.fport || "-"}</div>
-          <div><strong>Time parsed:</strong> ${row.dataset.time || "-"}</div>
-          <div><strong>Timestamp:</strong> ${row.dataset.timeUnix || "-"}</div>
-          <div><strong>Time (UTC):</strong> ${row.dataset.timeUtc || "-"}</div>
-        `;
-        payload.textContent = row.dataset.payload || "";
-        const decodedRaw = row.dataset.decoded || "";
-        let formatted = decodedRaw;
-        try {
-          const parsed = JSON.parse(decodedRaw);
-          formatted = JSON.stringify(parsed, null, 2);
-        } catch (_) {
-          formatted = decodedRaw;
-        }
-        decoded.textContent = formatted || "";
-        overlay.hidden = false;
-      });
-    }
 
-    function initFileList() {
-      const list = document.querySelector("[data-file-list]");
-      if (!list) return;
-      const items = Array.from(list.querySelectorAll("[data-file-item]"));
-      const searchInput = document.querySelector("[data-file-search]");
-      const sortSelect = document.querySelector("[data-file-sort]");
-      let emptyState = list.querySelector("[data-file-empty]");
-
-      const parseDate = (value) => {
-        if (!value) return 0;
-        const cleaned = value.replace(" UTC", "Z").replace(" ", "T");
-        const parsed = Date.parse(cleaned);
-        return Number.isFinite(parsed) ? parsed : 0;
-      };
-
-      const getName = (item) => (item.dataset.fileName || "").toLowerCase();
-      const getDate = (item) => parseDate(item.dataset.fileDate || "");
-
-      const applyList = () => {
-        const term = (searchInput?.value || "").toLowerCase().trim();
-        const sortValue = sortSelect?.value || "date_desc";
-        let filtered = items.filter((item) => {
-          if (!term) return true;
-          return getName(item).includes(term);
-        });
-
-        filtered = filtered.sort((a, b) => {
-          if (sortValue === "name_asc") {
-            return getName(a).localeCompare(getName(b));
-          }
-          if (sortValue === "name_desc") {
-            return getName(b).localeCompare(getName(a));
-          }
-          if (sortValue === "date_asc") {
-            return getDate(a) - getDate(b);
-          }
-          return getDate(b) - getDate(a);
-        });
-
-        const fragment = document.createDocumentFragment();
-        filtered.forEach((item) => fragment.appendChild(item));
-        list.innerHTML = "";
-        list.appendChild(fragment);
-
-        if (!filtered.length) {
-          if (!emptyState) {
-            emptyState = document.createElement("div");
-            emptyState.className = "hint";
-            emptyState.dataset.fileEmpty = "true";
-            emptyState.textContent = "No matching files.";
-          }
-          list.appendChild(emptyState);
-        }
-      };
+@app.after_request
+def set_static_cache_headers(response):
+    if request.endpoint == "static" and request.args.get("v") and response.status_code in (200, 304):
+        response.headers["Cache-Control"] = "public, max-age=31536000, immutable"
+    return response
 
-      searchInput?.addEventListener("input", applyList);
-      sortSelect?.addEventListener("change", applyList);
-      applyList();
-    }
 
-    function formatTimeParts(value, length) {
-      return String(value).padStart(length, "0");
-    }
+def choose_content_encoding():
+    accepted = request.accept_encodings
+    if brotli is not None and accepted.quality("br") > 0:
+        return "br"
+    if accepted.quality("gzip") > 0:
+        return "gzip"
+    return None
 
-    function formatSendTime(msValue) {
-      if (msValue === undefined || msValue === null || msValue === "") {
-        return "-";
-      }
-      const msNumber = Number(msValue);
-      if (!Number.isFinite(msNumber)) {
-        return "-";
-      }
-      const date = new Date(msNumber);
-      if (Number.isNaN(date.getTime())) {
-        return "-";
-      }
-      return (
-        `${formatTimeParts(date.getHours(), 2)}:` +
-        `${formatTimeParts(date.getMinutes(), 2)}:` +
-        `${formatTimeParts(date.getSeconds(), 2)}.` +
-        `${formatTimeParts(date.getMilliseconds(), 3)}`
-      );
-    }
 
-    function formatReplaySendTimes(section) {
-      if (!section) return;
-      section.querySelectorAll("tr[data-send-time-ms]").forEach((row) => {
-        const cell = row.querySelector(".send-time-cell");
-        if (!cell) return;
-        cell.textContent = formatSendTime(row.dataset.sendTimeMs || "");
-      });
-    }
+def compress_body(body, encoding, static=False):
+    if encoding == "br":
+        return brotli.compress(body, quality=11 if static else BROTLI_QUALITY)
+    return gzip.compress(body, compresslevel=9 if static else GZIP_LEVEL)
 
-    function initReplayStream() {
-      const container = document.querySelector("[data-replay-stream]");
-      if (!container) return;
-      const token = container.dataset.replayToken || "";
-      const statusUrl = container.dataset.replayStatusUrl || "";
-      if (!token || !statusUrl) return;
-
-      const statusBlock = container.querySelector("[data-replay-status]");
-      const progressFill = container.querySelector("[data-replay-progress]");
-      const progressText = container.querySelector("[data-replay-progress-text]");
-      const metaTarget = container.querySelector("[data-replay-target]");
-      const etaText = container.querySelector("[data-replay-eta]");
-      const logBody = document.querySelector("[data-replay-log-body]");
-      const stopButton = document.querySelector("[data-stop-replay]");
-      const resumeButton = document.querySelector("[data-resume-replay]");
-      const restartButton = document.querySelector("[data-restart-replay]");
-      let etaTimer = null;
-
-      let received = 0;
-      let done = false;
-
-      const formatDuration = (ms) => {
-        const totalSeconds = Math.max(0, Math.ceil(ms / 1000));
-        const hours = Math.floor(totalSeconds / 3600);
-        const minutes = Math.floor((totalSeconds % 3600) / 60);
-        const seconds = totalSeconds % 60;
-        if (hours > 0) {
-          return `${hours}:${formatTimeParts(minutes, 2)}:${formatTimeParts(seconds, 2)}`;
-        }
-        return `${minutes}:${formatTimeParts(seconds, 2)}`;
-      };
-
-      const updateEta = (data) => {
-        if (!etaText) return;
-        if (etaTimer) {
-          clearInterval(etaTimer);
-          etaTimer = null;
-        }
-        if (data.status !== "running") {
-          etaText.textContent = "ETA 0:00";
-          return;
-        }
-        const delayMs = Number(data.delay_ms) || 0;
-        const total = data.total || 0;
-        const processed = (data.sent || 0) + (data.errors || 0);
-        const remaining = Math.max(0, total - processed);
-        if (!delayMs || remaining === 0) {
-          etaText.textContent = "ETA 0:00";
-          return;
-        }
-        const targetTime = Date.now() + remaining * delayMs;
-        const render = () => {
-          const remainingMs = targetTime - Date.now();
-          etaText.textContent = `ETA ${formatDuration(remainingMs)}`;
-        };
-        render();
-        etaTimer = window.setInterval(render, 250);
-      };
-
-      const updateStatus = (data) => {
-        const total = data.total || 0;
-        const sent = data.sent || 0;
-        const errors = data.errors || 0;
-        const processed = sent + errors;
-        const percent = total ? Math.min(100, Math.round((processed / total) * 100)) : 0;
-
-        if (progressFill) {
-          progressFill.style.width = `${percent}%`;
-        }
-        if (progressText) {
-          progressText.textContent = `Sent ${sent} of ${total} · Errors ${errors}`;
-        }
-        if (metaTarget) {
-          metaTarget.textContent = `Target ${data.host || "?"}:${data.port || "?"} · Delay ${data.delay_ms || 0} ms`;
-        }
-        if (statusBlock) {
-          statusBlock.classList.remove("info", "success", "error");
-          if (data.status === "done") {
-            statusBlock.classList.add(errors === 0 ? "success" : "error");
-            statusBlock.textContent = `Replay done. Sent ${sent}, errors ${errors}.`;
-          } else if (data.status === "stopped") {
-            statusBlock.classList.add("error");
-            statusBlock.textContent = `Replay stopped. Sent ${sent}, errors ${errors}.`;
-          } else {
-            statusBlock.classList.add("info");
-            statusBlock.textContent = `Replaying... Sent ${sent} of ${total}.`;
-          }
-        }
 
-        if (stopButton) {
-          const isRunning = data.status === "running";
-          stopButton.disabled = !isRunning;
-          stopButton.classList.toggle("is-hidden", !isRunning);
-        }
-        if (resumeButton) {
-          const isStopped = data.status === "stopped";
-          resumeButton.disabled = !isStopped;
-          resumeButton.classList.toggle("is-hidden", !isStopped);
-        }
-        if (restartButton) {
-          const showRestart = data.status === "stopped" || data.status === "done";
-          restartButton.disabled = !showRestart;
-          restartButton.classList.toggle("is-hidden", !showRestart);
-        }
-        updateEta(data);
-      };
-
-      const appendLines = (lines) => {
-        if (!logBody || !Array.isArray(lines) || lines.length === 0) return;
-        const fragment = document.createDocumentFragment();
-        lines.forEach((line) => {
-          const row = document.createElement("tr");
-          row.className = line.css || "";
-          row.dataset.index = line.index ?? "";
-          row.dataset.status = line.status ?? "";
-          row.dataset.sendTimeMs = line.send_time_ms ?? "";
-          row.dataset.gateway = line.gateway ?? "";
-          row.dataset.fcnt = line.fcnt ?? "";
-          row.dataset.freq = line.freq ?? "";
-          row.dataset.size = line.size ?? "";
-          row.dataset.message = line.message ?? "";
-
-          const cells = [
-            { value: line.index },
-            { value: line.status },
-            { value: formatSendTime(line.send_time_ms), className: "send-time-cell" },
-            { value: line.gateway },
-            { value: line.fcnt },
-            { value: line.freq },
-            { value: line.size },
-            { value: line.message },
-          ];
-          cells.forEach((cellData) => {
-            const cell = document.createElement("td");
-            if (cellData.className) {
-              cell.className = cellData.className;
-            }
-            const value = cellData.value;
-            cell.textContent = value === undefined || value === null || value === "" ? "-" : value;
-            row.appendChild(cell);
-          });
-          fragment.appendChild(row);
-        });
-        logBody.appendChild(fragment);
-      };
-
-      const poll = () => {
-        if (done) return;
-        const url = new URL(statusUrl, window.location.origin);
-        url.searchParams.set("token", token);
-        url.searchParams.set("since", String(received));
-        fetch(url.toString(), { cache: "no-store" })
-          .then((response) => {
-            if (!response.ok) {
-              throw new Error("Replay status request failed.");
-            }
-            return response.json();
-          })
-          .then((data) => {
-            if (data.error) {
-              throw new Error(data.error);
-            }
-            if (Array.isArray(data.lines)) {
-              appendLines(data.lines);
-            }
-            if (typeof data.count === "number") {
-              received = data.count;
-            }
-            updateStatus(data);
-            if (data.status === "done" || data.status === "stopped") {
-              done = true;
-              return;
-            }
-            window.setTimeout(poll, 600);
-          })
-          .catch(() => {
-            if (!done) {
-              window.setTimeout(poll, 1200);
-            }
-          });
-      };
+def precompressed_static(filename, encoding):
+    key = (filename, encoding)
+    body = PRECOMPRESSED_STATIC.get(key)
+    if body is None:
+        with open(os.path.join(app.static_folder, filename), "rb") as handle:
+            body = compress_body(handle.read(), encoding, static=True)
+        PRECOMPRESSED_STATIC[key] = body
+    return body
 
-      poll();
-    }
 
-    document.addEventListener("DOMContentLoaded", () => {
-      const logSection = document.querySelector("[data-log-section]");
-      formatReplaySendTimes(logSection);
-      if (logSection && !logSection.dataset.liveReplay) {
-        initSortableTable(logSection);
-        initTruncation(logSection);
-      }
-      initSortableTable(document.querySelector("[data-decode-section]"));
-      initTruncation(document.querySelector("[data-decode-section]"));
-      initDetailOverlay(document.querySelector("[data-decode-section]"));
-      initFileList();
-      initReplayStream();
-      document.querySelectorAll("[data-toggle-visibility]").forEach((button) => {
-        button.addEventListener("click", () => {
-          const targetId = button.dataset.toggleVisibility;
-          const input = document.getElementById(targetId);
-          if (!input) return;
-          const isHidden = input.type === "password";
-          input.type = isHidden ? "text" : "password";
-          button.setAttribute("aria-pressed", isHidden ? "true" : "false");
-          button.title = isHidden ? "Hide key" : "Show key";
-        });
-      });
-      const drop = document.querySelector("[data-file-drop]");
-      const form = drop?.closest("form");
-      const overlay = document.querySelector("[data-loading-overlay]");
-      const input = document.getElementById("logfile");
-      const selected = document.querySelector("[data-file-selected]");
-      const payloadSelect = document.querySelector("[data-payload-example]");
-      const payloadInput = document.getElementById("app_payload_hex");
-      const fportInput = document.getElementById("fport");
-
-      if (payloadSelect && payloadInput && fportInput) {
-        payloadSelect.addEventListener("change", () => {
-          const opt = payloadSelect.selectedOptions[0];
-          const payload = opt?.value;
-          const port = opt?.dataset.port;
-          if (payload) {
-            payloadInput.value = payload;
-          }
-          if (port) {
-            fportInput.value = port;
-          }
-        });
-      }
-
-      if (drop && input && selected) {
-        const updateLabel = () => {
-          if (input.files && input.files.length > 0) {
-            selected.textContent = input.files.length === 1 ? input.files[0].name : `${input.files.length} files selected`;
-          }
-        };
-        const autoScan = () => {
-          if (!input.files || input.files.length === 0) {
-            return;
-          }
-          const scanUrl = form?.dataset.scanUrl;
-          if (form && scanUrl) {
-            form.action = scanUrl;
-            form.submit();
-          }
-        };
-
-        drop.addEventListener("click", () => input.click());
-
-        ["dragenter", "dragover"].forEach((evt) =>
-          drop.addEventListener(evt, (e) => {
-            e.preventDefault();
-            e.stopPropagation();
-            drop.classList.add("dragover");
-          })
-        );
-        ["dragleave", "drop"].forEach((evt) =>
-          drop.addEventListener(evt, (e) => {
-            e.preventDefault();
-            e.stopPropagation();
-            if (evt === "drop" && e.dataTransfer?.files?.length) {
-              const dt = new DataTransfer();
-              Array.from(e.dataTransfer.files).forEach((file) => dt.items.add(file));
-              input.files = dt.files;
-              updateLabel();
-              autoScan();
-            }
-            drop.classList.remove("dragover");
-          })
-        );
-
-        input.addEventListener("change", () => {
-          updateLabel();
-          autoScan();
-        });
-        updateLabel();
-      }
-
-      if (overlay) {
-        document.querySelectorAll("form").forEach((formEl) => {
-          formEl.addEventListener("submit", (event) => {
-            const submitter = event.submitter;
-            if (submitter && submitter.dataset.showLoader === "true") {
-              overlay.hidden = false;
-            }
-          });
-        });
-      }
-
-      const decodeOverlay = document.querySelector("[data-decode-overlay]");
-      if (decodeOverlay) {
-        const progressUrl = decodeOverlay.dataset.decodeProgressUrl || "";
-        const progressFill = decodeOverlay.querySelector("[data-decode-progress]");
-        const progressText = decodeOverlay.querySelector("[data-decode-progress-text]");
-        const progressPercent = decodeOverlay.querySelector("[data-decode-progress-percent]");
-        const makeProgressId = () => {
-          if (window.crypto?.randomUUID) return window.crypto.randomUUID();
-          return `p_${Date.now()}_${Math.random().toString(16).slice(2)}`;
-        };
-        let decodePollTimer = null;
-        const stopDecodePoll = () => {
-          if (decodePollTimer) {
-            clearInterval(decodePollTimer);
-            decodePollTimer = null;
-          }
-        };
-        const startDecodePoll = (progressId) => {
-          if (!progressUrl || !progressId) return;
-          const poll = async () => {
-            try {
-              const response = await fetch(`${progressUrl}?progress_id=${encodeURIComponent(progressId)}`, {
-                credentials: "same-origin",
-                cache: "no-store"
-              });
-              if (!response.ok) return;
-              const data = await response.json();
-              const total = Number(data.total) || 0;
-              const completed = Number(data.completed) || 0;
-              const percent = total ? Math.min(100, Math.max(0, Math.round((completed / total) * 100))) : 0;
-              if (progressFill) {
-                const hue = Math.max(140, 215 - Math.round(percent * 0.6));
-                progressFill.style.width = `${percent}%`;
-                progressFill.style.background = `linear-gradient(90deg, hsl(${hue}, 85%, 45%), hsl(${hue + 15}, 85%, 55%))`;
-              }
-              if (progressPercent) progressPercent.textContent = `${percent}%`;
-              if (progressText) {
-                progressText.textContent = total
-                  ? `Decoding ${completed} of ${total}`
-                  : "Decoding…";
-              }
-            } catch (err) {
-              stopDecodePoll();
-            }
-          };
-          stopDecodePoll();
-          decodePollTimer = window.setInterval(poll, 500);
-          poll();
-        };
-        document.querySelectorAll("form").forEach((formEl) => {
-          formEl.addEventListener("submit", (event) => {
-            const submitter = event.submitter;
-            if (submitter && submitter.dataset.showDecodeLoader === "true") {
-              event.preventDefault();
-              const progressId = makeProgressId();
-              const progressInput = formEl.querySelector("[data-decode-progress-id]");
-              if (progressInput) progressInput.value = progressId;
-              if (progressFill) progressFill.style.width = "0%";
-              if (progressText) progressText.textContent = "Decoding…";
-              if (progressPercent) progressPercent.textContent = "0%";
-              decodeOverlay.hidden = false;
-              startDecodePoll(progressId);
-              const actionUrl = formEl.getAttribute("action") || window.location.href;
-              fetch(actionUrl, {
-                method: formEl.method || "POST",
-                body: new FormData(formEl),
-                credentials: "same-origin"
-              }).then((response) => response.text())
-                .then((html) => {
-                  stopDecodePoll();
-                  document.open();
-                  document.write(html);
-                  document.close();
-                })
-                .catch(() => {
-                  stopDecodePoll();
-                  if (progressText) progressText.textContent = "Decode failed. Please retry.";
-                });
-            }
-          });
-        });
-      }
-
-      const scanOverlay = document.querySelector("[data-scan-overlay]");
-      if (scanOverlay) {
-        const closeBtn = scanOverlay.querySelector("[data-scan-close]");
-        const close = () => {
-          scanOverlay.hidden = true;
-        };
-        closeBtn?.addEventListener("click", close);
-        scanOverlay.addEventListener("click", (event) => {
-          if (event.target === scanOverlay) {
-            close();
-          }
-        });
-      }
-
-      const generatedOverlay = document.querySelector("[data-generated-overlay]");
-      if (generatedOverlay) {
-        const downloadUrl = generatedOverlay.dataset.generatedDownloadUrl || "";
-        const downloadName = generatedOverlay.dataset.generatedFilename || "";
-        if (downloadUrl) {
-          const directLink = document.createElement("a");
-          directLink.href = downloadUrl;
-          if (downloadName) {
-            directLink.download = downloadName;
-          }
-          directLink.click();
-        }
-        const closeBtn = generatedOverlay.querySelector("[data-generated-close]");
-        const close = () => {
-          generatedOverlay.hidden = true;
-        };
-        closeBtn?.addEventListener("click", close);
-        generatedOverlay.addEventListener("click", (event) => {
-          if (event.target === generatedOverlay) {
-            close();
-          }
-        });
-      }
-
-      const passwordModal = document.querySelector("[data-password-modal]");
-      if (passwordModal) {
-        const openButtons = document.querySelectorAll("[data-password-reset]");
-        const closeBtn = passwordModal.querySelector("[data-password-close]");
-        const usernameField = passwordModal.querySelector("[data-password-username]");
-        const userLabel = passwordModal.querySelector("[data-password-user]");
-        const passwordInput = passwordModal.querySelector("[data-password-input]");
-        const generateBtn = passwordModal.querySelector("[data-password-generate]");
-        const copyBtn = passwordModal.querySelector("[data-password-copy]");
-
-        const open = (username) => {
-          if (usernameField) usernameField.value = username;
-          if (userLabel) userLabel.textContent = username;
-          if (passwordInput) passwordInput.value = "";
-          passwordModal.hidden = false;
-        };
-
-        const close = () => {
-          passwordModal.hidden = true;
-        };
-
-        openButtons.forEach((button) => {
-          button.addEventListener("click", () => {
-            const username = button.dataset.passwordReset || "";
-            if (!username) return;
-            open(username);
-          });
-        });
-
-        generateBtn?.addEventListener("click", () => {
-          if (!passwordInput) return;
-          passwordInput.value = generatePassword(16);
-        });
-
-        copyBtn?.addEventListener("click", () => {
-          if (!passwordInput) return;
-          passwordInput.select();
-          passwordInput.setSelectionRange(0, 99999);
-          if (navigator.clipboard && navigator.clipboard.writeText) {
-            navigator.clipboard.writeText(passwordInput.value || "");
-          } else {
-            document.execCommand("copy");
-          }
-        });
-
-        closeBtn?.addEventListener("click", close);
-        passwordModal.addEventListener("click", (event) => {
-          if (event.target === passwordModal) {
-            close();
-          }
-        });
-      }
-
-      document.querySelectorAll(".field-controls").forEach((controls) => {
-        if (passwordModal && passwordModal.contains(controls)) {
-          return;
-        }
-        const input = controls.querySelector("[data-password-input]");
-        if (!input) return;
-        const generateBtn = controls.querySelector("[data-password-generate]");
-        const copyBtn = controls.querySelector("[data-password-copy]");
-        generateBtn?.addEventListener("click", () => {
-          input.value = generatePassword(16);
-        });
-        copyBtn?.addEventListener("click", () => {
-          input.select();
-          input.setSelectionRange(0, 99999);
-          if (navigator.clipboard && navigator.clipboard.writeText) {
-            navigator.clipboard.writeText(input.value || "");
-          } else {
-            document.execCommand("copy");
-          }
-        });
-      });
-
-      document.querySelectorAll("[data-user-name]").forEach((el) => {
-        const name = el.dataset.userName || "";
-        let hash = 0;
-        for (let i = 0; i < name.length; i++) {
-          hash = ((hash << 5) - hash) + name.charCodeAt(i);
-          hash |= 0;
-        }
-        const hue = Math.abs(hash) % 360;
-        el.style.color = `hsl(${hue}, 68%, 36%)`;
-      });
-
-      const tempPasswordInput = document.querySelector("[data-temp-password]");
-      const tempGenerateBtn = document.querySelector("[data-temp-generate]");
-      const tempCopyBtn = document.querySelector("[data-temp-copy]");
-      if (tempPasswordInput && tempGenerateBtn) {
-        tempGenerateBtn.addEventListener("click", () => {
-          tempPasswordInput.value = generatePassword(16);
-        });
-      }
-      if (tempPasswordInput && tempCopyBtn) {
-        tempCopyBtn.addEventListener("click", () => {
-          tempPasswordInput.select();
-          tempPasswordInput.setSelectionRange(0, 99999);
-          if (navigator.clipboard && navigator.clipboard.writeText) {
-            navigator.clipboard.writeText(tempPasswordInput.value || "");
-          } else {
-            document.execCommand("copy");
-          }
-        });
-      }
-
-      const deleteForm = document.querySelector("[data-delete-form]");
-      if (deleteForm) {
-        const deleteInput = deleteForm.querySelector("[data-delete-input]");
-        document.querySelectorAll("[data-delete-devaddr]").forEach((button) => {
-          button.addEventListener("click", () => {
-            const devaddr = button.dataset.deleteDevaddr || "";
-            if (!devaddr) return;
-            if (!confirm(`Remove device ${devaddr}?`)) {
-              return;
-            }
-            if (deleteInput) {
-              deleteInput.value = devaddr;
-            }
-            deleteForm.submit();
-          });
-        });
-      }
-
-      const decoderDeleteForm = document.querySelector("[data-decoder-delete-form]");
-      if (decoderDeleteForm) {
-        const decoderInput = decoderDeleteForm.querySelector("[data-decoder-delete-input]");
-        document.querySelectorAll("[data-delete-decoder]").forEach((button) => {
-          button.addEventListener("click", () => {
-            const decoderId = button.dataset.deleteDecoder || "";
-            if (!decoderId) return;
-            if (!confirm("Remove this decoder?")) {
-              return;
-            }
-            if (decoderInput) {
-              decoderInput.value = decoderId;
-            }
-            decoderDeleteForm.submit();
-          });
-        });
-      }
-
-      const fileDeleteForm = document.querySelector("[data-file-delete-form]");
-      if (fileDeleteForm) {
-        const fileInput = fileDeleteForm.querySelector("[data-file-delete-input]");
-        document.querySelectorAll("[data-delete-file]").forEach((button) => {
-          button.addEventListener("click", () => {
-            const fileId = button.dataset.deleteFile || "";
-            if (!fileId) return;
-            if (!confirm("Remove this log file?")) {
-              return;
-            }
-            if (fileInput) {
-              fileInput.value = fileId;
-            }
-            fileDeleteForm.submit();
-          });
-        });
-      }
-
-      const menuToggle = document.querySelector("[data-menu-toggle]");
-      const menuPanel = document.querySelector("[data-menu-panel]");
-      if (menuToggle && menuPanel) {
-        const closeMenu = () => {
-          menuPanel.hidden = true;
-          menuToggle.classList.remove("open");
-          menuToggle.setAttribute("aria-expanded", "false");
-        };
-        const openMenu = () => {
-          menuPanel.hidden = false;
-          menuToggle.classList.add("open");
-          menuToggle.setAttribute("aria-expanded", "true");
-        };
-        menuToggle.addEventListener("click", () => {
-          if (menuPanel.hidden) {
-            openMenu();
-          } else {
-            closeMenu();
-          }
-        });
-        menuPanel.querySelectorAll("a").forEach((link) => {
-          link.addEventListener("click", () => closeMenu());
-        });
-        document.addEventListener("click", (event) => {
-          if (menuPanel.hidden) return;
-          if (menuPanel.contains(event.target) || menuToggle.contains(event.target)) {
-            return;
-          }
-          closeMenu();
-        });
-      }
-    });
-  </script>
-"""
+@app.after_request
+def compress_response(response):
+    if response.status_code != 200 or "Content-Encoding" in response.headers:
+        return response
+    if request.endpoint == "static":
+        filename = (request.view_args or {}).get("filename")
+        if filename not in PRECOMPRESS_STATIC_FILES:
+            return response
+        encoding = choose_content_encoding()
+        if encoding is None:
+            return response
+        if hasattr(response.response, "close"):
+            response.response.close()
+        response.direct_passthrough = False
+        response.set_data(precompressed_static(filename, encoding))
+    else:
+        if response.direct_passthrough or response.is_streamed or response.mimetype not in GZIP_MIMETYPES:
+            return response
+        encoding = choose_content_encoding()
+        if encoding is None:
+            return response
+        body = response.get_data()
+        if len(body) < GZIP_MIN_BYTES:
+            return response
+        response.set_data(compress_body(body, encoding))
+    response.headers["Content-Encoding"] = encoding
+    response.vary.add("Accept-Encoding")
+    etag, weak = response.get_etag()
+    if etag and not weak:
+        response.set_etag(etag, weak=True)
+    return response
 
 NAV_HTML = """
   <header class="top-bar">
@@ -3316,34 +511,52 @@ NAV_HTML = """
   {% endif %}
 """
 
-HTML = """
+BASE_HTML = """
 <!doctype html>
 <html>
 <head>
   <meta charset="utf-8">
-  <title>OpenCollar LP0 Replay tool</title>
+  <title>{% block title %}OpenCollar LP0 Replay tool{% endblock %}</title>
   <link rel="icon" type="image/x-icon" href="{{ favicon_url }}">
-  {{ style_block|safe }}
+  <link rel="stylesheet" href="https://fonts.googleapis.com/icon?family=Material+Icons">
+  <link rel="stylesheet" href="{{ app_css_url }}">
 </head>
 <body>
   <div class="outer-column">
     {{ nav_html|safe }}
+{% block content %}{% endblock %}
+{% block brand_note %}
+    <p class="brand-note">
+      A Smart Parks tool to Protect Wildlife with Passion and Technology.
+      <a href="https://www.smartparks.org" target="_blank" rel="noopener">www.smartparks.org</a>
+    </p>
+{% endblock %}
+  </div>
+{% block overlays %}{% endblock %}
+  <script src="{{ app_js_url }}"></script>
+</body>
+</html>
+"""
 
+HTML = """
+{% extends "base.html" %}
+{% block title %}OpenCollar LP0 Replay tool{% endblock %}
+{% block content %}
     <div class="card">
       <h1 class="page-title"><span class="material-icons" aria-hidden="true">home</span>Start</h1>
       <p class="subtitle">Upload a log file or pick a stored log file to scan and continue.</p>
 
-      <form method="POST" action="{{ scan_url }}" enctype="multipart/form-data" data-scan-url="{{ scan_url }}">
+      <form method="POST" action="{{ scan_url }}" enctype="multipart/form-data" data-scan-url="{{ scan_url }}" data-upload-url="{{ upload_url }}">
         <input type="hidden" name="csrf_token" value="{{ csrf_token }}">
         <div>
           <div class="logfile-options">
             <div class="logfile-option">
               <h3>Upload a log file</h3>
               <input id="logfile" type="file" name="logfile" style="display: none;" aria-hidden="true">
-              <div class="file-drop" data-file-drop>
+              <div id="file_drop" class="file-drop" data-file-drop>
                 <div class="file-text">
                   <strong>Click to choose or drag & drop</strong>
-                  <div class="file-selected" data-file-selected>{{ selected_filename or "No file selected" }}</div>
+                  <div id="file_selected" class="file-selected" data-file-selected>{{ selected_filename or "No file selected" }}</div>
                   <div class="hint">Upload a JSON Lines file you captured earlier.</div>
                 </div>
               </div>
@@ -3384,31 +597,13 @@ HTML = """
       </div>
       {% endif %}
     </div>
-
-    <p class="brand-note">
-      A Smart Parks tool to Protect Wildlife with Passion and Technology.
-      <a href="https://www.smartparks.org" target="_blank" rel="noopener">www.smartparks.org</a>
-    </p>
-
-  </div>
-  {{ script_block|safe }}
-</body>
-</html>
+{% endblock %}
 """
 
 REPLAY_HTML = """
-<!doctype html>
-<html>
-<head>
-  <meta charset="utf-8">
-  <title>Replay LoRaWAN Log</title>
-  <link rel="icon" type="image/x-icon" href="{{ favicon_url }}">
-  {{ style_block|safe }}
-</head>
-<body>
-  <div class="outer-column">
-    {{ nav_html|safe }}
-
+{% extends "base.html" %}
+{% block title %}Replay LoRaWAN Log{% endblock %}
+{% block content %}
     <div class="card">
       <div class="card-header">
         <div>
@@ -3469,17 +664,17 @@ REPLAY_HTML = """
         {% endif %}
         <div class="form-actions">
           {% if replay_token %}
-          <button type="submit" class="stop-replay-button{% if replay_status != "running" %} is-hidden{% endif %}"
+          <button id="stop_replay" type="submit" class="stop-replay-button{% if replay_status != "running" %} is-hidden{% endif %}"
                   data-stop-replay formaction="{{ replay_stop_url }}"
                   {% if replay_status != "running" %}disabled{% endif %}>
             Stop Replay
           </button>
-          <button type="submit" class="resume-replay-button{% if replay_status != "stopped" %} is-hidden{% endif %}"
+          <button id="resume_replay" type="submit" class="resume-replay-button{% if replay_status != "stopped" %} is-hidden{% endif %}"
                   data-resume-replay formaction="{{ replay_resume_url }}"
                   {% if replay_status != "stopped" %}disabled{% endif %}>
             Resume Replay
           </button>
-          <button type="submit" class="restart-replay-button{% if replay_status not in ["stopped", "done"] %} is-hidden{% endif %}"
+          <button id="restart_replay" type="submit" class="restart-replay-button{% if replay_status not in ["stopped", "done"] %} is-hidden{% endif %}"
                   data-restart-replay formaction="{{ replay_url }}"
                   {% if replay_status not in ["stopped", "done"] %}disabled{% endif %}>
             Restart Replay
@@ -3494,22 +689,22 @@ REPLAY_HTML = """
       </form>
 
       {% if replay_token %}
-      <div data-replay-stream data-replay-token="{{ replay_token }}" data-replay-status-url="{{ replay_status_url }}">
-        <div class="result info replay-status" data-replay-status>Starting replay…</div>
+      <div id="replay_stream" data-replay-stream data-replay-token="{{ replay_token }}" data-replay-status-url="{{ replay_status_url }}" data-replay-events-url="{{ replay_events_url }}">
+        <div id="replay_status_text" class="result info replay-status" data-replay-status>Starting replay…</div>
         <div class="progress-track" aria-hidden="true">
-          <div class="progress-fill" data-replay-progress></div>
+          <div id="replay_progress" class="progress-fill" data-replay-progress></div>
         </div>
         <div class="progress-meta">
-          <span data-replay-progress-text>Sent 0 of {{ replay_total }}</span>
-          <span data-replay-target>Target -</span>
-          <span data-replay-eta>ETA -</span>
+          <span id="replay_progress_text" data-replay-progress-text>Sent 0 of {{ replay_total }}</span>
+          <span id="replay_target" data-replay-target>Target -</span>
+          <span id="replay_eta" data-replay-eta>ETA -</span>
         </div>
       </div>
       {% endif %}
     </div>
 
     {% if log_lines or replay_token %}
-    <div class="log-wrapper" data-log-section {% if replay_token %}data-live-replay="true"{% endif %}>
+    <div id="log_section" class="log-wrapper" data-log-section {% if replay_token %}data-live-replay="true"{% endif %}>
       <details class="log-block" open>
         <summary>Replay log</summary>
         {% if not replay_token %}
@@ -3532,7 +727,7 @@ REPLAY_HTML = """
                 {% if replay_token %}
                 <th>#</th>
                 <th>Status</th>
-                <th>Sent at</th>
+                <th>Sent at (UTC)</th>
                 <th>Gateway EUI</th>
                 <th>FCnt</th>
                 <th>Frequency</th>
@@ -3541,7 +736,7 @@ REPLAY_HTML = """
                 {% else %}
                 <th><button type="button" data-sort-key="index">#</button></th>
                 <th><button type="button" data-sort-key="status">Status</button></th>
-                <th><button type="button" data-sort-key="sendTimeMs">Sent at</button></th>
+                <th><button type="button" data-sort-key="sendTimeMs">Sent at (UTC)</button></th>
                 <th><button type="button" data-sort-key="gateway">Gateway EUI</button></th>
                 <th><button type="button" data-sort-key="fcnt">FCnt</button></th>
                 <th><button type="button" data-sort-key="freq">Frequency</button></th>
@@ -3550,7 +745,7 @@ REPLAY_HTML = """
                 {% endif %}
               </tr>
             </thead>
-            <tbody data-replay-log-body>
+            <tbody id="replay_log_body" data-replay-log-body>
               {% for log_line in log_lines %}
               <tr class="{{ log_line.css }}"
                   data-index="{{ log_line.index }}"
@@ -3563,7 +758,7 @@ REPLAY_HTML = """
                   data-message="{{ (log_line.message or '') | e }}">
                 <td>{{ log_line.index }}</td>
                 <td>{{ log_line.status }}</td>
-                <td class="send-time-cell">-</td>
+                <td class="send-time-cell">{{ log_line.send_time_str or "-" }}</td>
                 <td>{{ log_line.gateway or "-" }}</td>
                 <td>{{ log_line.fcnt or "-" }}</td>
                 <td>{{ log_line.freq or "-" }}</td>
@@ -3577,36 +772,21 @@ REPLAY_HTML = """
       </details>
     </div>
     {% endif %}
-
-    <p class="brand-note">
-      A Smart Parks tool to Protect Wildlife with Passion and Technology.
-      <a href="https://www.smartparks.org" target="_blank" rel="noopener">www.smartparks.org</a>
-    </p>
-  </div>
-  <div class="loading-overlay" data-loading-overlay hidden>
+{% endblock %}
+{% block overlays %}
+  <div id="loading_overlay" class="loading-overlay" data-loading-overlay hidden>
     <div class="loading-card">
       <div class="spinner" aria-hidden="true"></div>
       <div>Replaying uplinks…</div>
     </div>
   </div>
-  {{ script_block|safe }}
-</body>
-</html>
+{% endblock %}
 """
 
 SIMPLE_PAGE_HTML = """
-<!doctype html>
-<html>
-<head>
-  <meta charset="utf-8">
-  <title>{{ page_title }}</title>
-  <link rel="icon" type="image/x-icon" href="{{ favicon_url }}">
-  {{ style_block|safe }}
-</head>
-<body>
-  <div class="outer-column">
-    {{ nav_html|safe }}
-
+{% extends "base.html" %}
+{% block title %}{{ page_title }}{% endblock %}
+{% block content %}
     <div class="card">
       <div class="card-header">
         <div>
@@ -3615,32 +795,154 @@ SIMPLE_PAGE_HTML = """
         </div>
         <a class="secondary-button" href="{{ back_url }}"><span class="material-icons" aria-hidden="true">arrow_back</span>Back</a>
       </div>
-      {{ body_html|safe }}
+      {% block body %}{{ body_html|safe }}{% endblock %}
     </div>
+{% endblock %}
+"""
 
-    <p class="brand-note">
-      A Smart Parks tool to Protect Wildlife with Passion and Technology.
-      <a href="https://www.smartparks.org" target="_blank" rel="noopener">www.smartparks.org</a>
-    </p>
-  </div>
-  {{ script_block|safe }}
-</body>
-</html>
+DECODERS_PAGE_HTML = """
+{% extends "simple_page.html" %}
+{% block body %}
+      {% if summary_lines %}
+      <div class="result {{ result_class }}">{% for line in summary_lines %}<div>{{ line }}</div>{% endfor %}</div>
+      {% endif %}
+      <form method="POST" action="{{ decoders_url }}" data-decoder-delete-form>
+        <input type="hidden" name="csrf_token" value="{{ csrf_token }}">
+        <input type="hidden" name="action" value="delete_decoder">
+        <input type="hidden" name="delete_decoder_id" value="" data-decoder-delete-input>
+      </form>
+      <div class="field-group">
+        <div class="field-header">
+          <label>Available decoders</label>
+        </div>
+        <div class="hint">Click a decoder to review its JavaScript.</div>
+        {% if not file_execution_enabled %}
+        <div class="hint">Uploaded decoders are disabled for this deployment.</div>
+        {% endif %}
+        {% if decoders %}
+        <ul class="decoder-list">
+          {% for decoder in decoders %}
+          {% set view_url = view_decoder_url ~ "?decoder_id=" ~ (decoder.id|urlencode) %}
+          <li class="decoder-item">
+            <div>
+              {% if decoder.id == "raw" %}
+              <span class="decoder-link">{{ decoder.label }}</span>
+              {% else %}
+              <a class="decoder-link" href="{{ view_url }}">{{ decoder.label }}</a>
+              {% endif %}
+              <span class="decoder-meta">({{ decoder.source }})</span>
+            </div>
+            {% if decoder.id != "raw" %}
+            <div class="decoder-actions">
+              <a class="secondary-button" href="{{ view_url }}"><span class="material-icons" aria-hidden="true">visibility</span>View</a>
+              {% if uploads_enabled and decoder.id.startswith("file:") %}
+              <button type="button" class="danger-button danger-text" data-delete-decoder="{{ decoder.id }}" title="Remove decoder" aria-label="Remove decoder"><span class="material-icons" aria-hidden="true">delete</span><span>Remove</span></button>
+              {% endif %}
+            </div>
+            {% endif %}
+          </li>
+          {% endfor %}
+        </ul>
+        {% else %}
+        <div class="hint">No decoders available yet.</div>
+        {% endif %}
+      </div>
+      <div class="section-divider"></div>
+      {% if uploads_enabled %}
+      <form method="POST" action="{{ decoders_url }}" enctype="multipart/form-data">
+        <input type="hidden" name="csrf_token" value="{{ csrf_token }}">
+        <input type="hidden" name="action" value="upload_decoder">
+        <div class="field-group">
+          <div class="field-header">
+            <label for="decoder_file">Add a decoder</label>
+          </div>
+          <input id="decoder_file" name="decoder_file" type="file" accept=".js">
+          <div class="hint">JS decoders should define <code>Decoder(bytes, port)</code> or <code>decodeUplink({ bytes, fPort })</code>.</div>
+        </div>
+        <div class="form-actions">
+          <button type="submit" class="primary-button"><span class="material-icons" aria-hidden="true">upload</span>Upload decoder</button>
+        </div>
+      </form>
+      {% else %}
+      <div class="hint">Decoder uploads are disabled for this deployment.</div>
+      {% endif %}
+{% endblock %}
 """
 
-LOGIN_HTML = """
-<!doctype html>
-<html>
-<head>
-  <meta charset="utf-8">
-  <title>Sign in</title>
-  <link rel="icon" type="image/x-icon" href="{{ favicon_url }}">
-  {{ style_block|safe }}
-</head>
-<body>
-  <div class="outer-column">
-    {{ nav_html|safe }}
+FILE_VIEWER_HTML = """
+{% extends "simple_page.html" %}
+{% block body %}
+      <div class="field-group">
+        <div class="field-header">
+          <label>{{ file_label }}</label>
+        </div>
+        {% if truncated_note %}
+        <div class="hint">{{ truncated_note }}{% if full_url %} <a href="{{ full_url }}" target="_blank" rel="noopener">View full file</a>{% endif %}</div>
+        {% endif %}
+        <pre class="code-block">{{ content }}</pre>
+      </div>
+      <div class="form-actions">
+        <a class="secondary-button" href="{{ list_url }}"><span class="material-icons" aria-hidden="true">arrow_back</span>{{ list_label }}</a>
+      </div>
+{% endblock %}
+"""
+
+INTEGRATIONS_PAGE_HTML = """
+      <div class="logfile-options">
+        <div class="logfile-option integration-block">
+          <h3>EarthRanger (HTTP)</h3>
+          <div class="hint">Send decoded uplinks to EarthRanger via HTTP integration.</div>
+          <div class="option-actions">
+            <button type="button" class="secondary-button"><span class="material-icons" aria-hidden="true">add</span>Add integration</button>
+            <button type="button" class="secondary-button"><span class="material-icons" aria-hidden="true">settings</span>Manage</button>
+          </div>
+        </div>
+        <div class="logfile-option integration-block">
+          <h3>InfluxDB</h3>
+          <div class="hint">Stream decoded uplinks into an InfluxDB bucket.</div>
+          <div class="option-actions">
+            <button type="button" class="secondary-button"><span class="material-icons" aria-hidden="true">add</span>Add integration</button>
+            <button type="button" class="secondary-button"><span class="material-icons" aria-hidden="true">settings</span>Manage</button>
+          </div>
+        </div>
+        <div class="logfile-option integration-block">
+          <h3>MQTT</h3>
+          <div class="hint">Publish decoded uplinks to an MQTT broker.</div>
+          <div class="option-actions">
+            <button type="button" class="secondary-button"><span class="material-icons" aria-hidden="true">add</span>Add integration</button>
+            <button type="button" class="secondary-button"><span class="material-icons" aria-hidden="true">settings</span>Manage</button>
+          </div>
+        </div>
+      </div>
+"""
+
+ABOUT_PAGE_HTML = """
+      <div class="logfile-options">
+        <div class="logfile-option">
+          <h3>About Smart Parks</h3>
+          <div style="display: flex; align-items: center; gap: 0.8rem; margin: 0.6rem 0;">
+            <img src="{{ logo_url }}" alt="Smart Parks logo" style="width: 52px; height: auto;">
+            <div class="hint">Protect Wildlife with Passion and Technology.</div>
+          </div>
+          <div class="hint">Smart Parks is a conservation technology organization focused on protecting wildlife and empowering rangers with resilient field tools.</div>
+          <div class="hint">Their solutions combine on-animal sensors, ranger communications, and real-time monitoring to support anti-poaching and animal welfare across protected areas.</div>
+          <div class="option-actions">
+            <a class="secondary-button" href="https://www.smartparks.org" target="_blank" rel="noopener"><span class="material-icons" aria-hidden="true">open_in_new</span>www.smartparks.org</a>
+          </div>
+        </div>
+        <div class="logfile-option">
+          <h3>About the App</h3>
+          <div class="hint">OpenCollar LP0 Replay tool helps replay, decrypt, and decode LoRaWAN uplinks captured as Semtech UDP JSONL logs.</div>
+          <div class="hint">Use it to validate uplink pipelines, tune forwarders, and inspect payloads during field tests.</div>
+        </div>
+      </div>
+"""
 
+LOGIN_HTML = """
+{% extends "base.html" %}
+{% block title %}Sign in{% endblock %}
+{% block brand_note %}{% endblock %}
+{% block content %}
     <div class="card">
       <div class="card-header">
         <div>
@@ -3669,27 +971,16 @@ LOGIN_HTML = """
         <div class="form-actions">
           <button type="submit">Sign in</button>
         </div>
-      </form>
-    </div>
-  </div>
-  {{ script_block|safe }}
-</body>
-</html>
+      </form>
+    </div>
+{% endblock %}
 """
 
 CHANGE_PASSWORD_HTML = """
-<!doctype html>
-<html>
-<head>
-  <meta charset="utf-8">
-  <title>Change password</title>
-  <link rel="icon" type="image/x-icon" href="{{ favicon_url }}">
-  {{ style_block|safe }}
-</head>
-<body>
-  <div class="outer-column">
-    {{ nav_html|safe }}
-
+{% extends "base.html" %}
+{% block title %}Change password{% endblock %}
+{% block brand_note %}{% endblock %}
+{% block content %}
     <div class="card">
       <div class="card-header">
         <div>
@@ -3731,25 +1022,13 @@ CHANGE_PASSWORD_HTML = """
         </div>
       </form>
     </div>
-  </div>
-  {{ script_block|safe }}
-</body>
-</html>
+{% endblock %}
 """
 
 DECODE_HTML = """
-<!doctype html>
-<html>
-<head>
-  <meta charset="utf-8">
-  <title>Decrypt & Decode LoRaWAN Log</title>
-  <link rel="icon" type="image/x-icon" href="{{ favicon_url }}">
-  {{ style_block|safe }}
-</head>
-<body>
-  <div class="outer-column">
-    {{ nav_html|safe }}
-
+{% extends "base.html" %}
+{% block title %}Decrypt & Decode LoRaWAN Log{% endblock %}
+{% block content %}
     <div class="card">
       <div class="card-header">
         <div>
@@ -3870,7 +1149,7 @@ DECODE_HTML = """
 
       {% if decode_results %}
       <div class="section-divider"></div>
-      <div class="log-wrapper" data-decode-section>
+      <div id="decode_section" class="log-wrapper" data-decode-section>
         <div class="table-actions decode-actions">
           <form method="POST" action="{{ decode_url }}">
             <input type="hidden" name="csrf_token" value="{{ csrf_token }}">
@@ -3923,41 +1202,7 @@ DECODE_HTML = """
                 </tr>
               </thead>
               <tbody>
-                {% for row in decode_results %}
-                <tr class="{{ row.css }}"
-                    data-index="{{ row.index }}"
-                    data-status="{{ row.status }}"
-                    data-devaddr="{{ row.devaddr }}"
-                    data-fcnt="{{ row.fcnt }}"
-                    data-fport="{{ row.fport }}"
-                    data-time="{{ row.time }}"
-                    data-time-unix="{{ row.time_unix }}"
-                    data-time-utc="{{ row.time_utc }}"
-                    data-payload="{{ row.payload_hex | e }}"
-                    data-decoded="{{ row.decoded_preview | e }}">
-                  <td>{{ row.index }}</td>
-                  <td>{{ row.status }}</td>
-                  <td>{{ row.devaddr }}</td>
-                  <td>{{ row.fcnt }}</td>
-                  <td>{{ row.fport }}</td>
-                  <td>{{ row.time }}</td>
-                  <td>{{ row.time_unix }}</td>
-                  <td>{{ row.time_utc }}</td>
-                  {% for column in decode_columns %}
-                  <td>{{ row.decoded_flat.get(column.key, "") }}</td>
-                  {% endfor %}
-                  <td>
-                    <button type="button" class="cell-action" data-detail-trigger>
-                      Payload ({{ row.payload_hex|length }} bytes)
-                    </button>
-                  </td>
-                  <td>
-                    <button type="button" class="cell-action" data-detail-trigger>
-                      Decoded view
-                    </button>
-                  </td>
-                </tr>
-                {% endfor %}
+                {{ decode_tbody_html|safe }}
               </tbody>
             </table>
           </div>
@@ -3966,62 +1211,45 @@ DECODE_HTML = """
       {% endif %}
     </div>
 
-    <div class="detail-overlay" data-detail-overlay hidden>
+    <div id="detail_overlay" class="detail-overlay" data-detail-overlay hidden>
       <div class="detail-card">
-        <h2 data-detail-title>Packet details</h2>
-        <div class="detail-grid" data-detail-meta></div>
+        <h2 id="detail_title" data-detail-title>Packet details</h2>
+        <div id="detail_meta" class="detail-grid" data-detail-meta></div>
         <div class="detail-collapsible">
           <details open>
             <summary>Payload</summary>
-            <div class="detail-block"><pre data-detail-payload></pre></div>
+            <div class="detail-block"><pre id="detail_payload" data-detail-payload></pre></div>
           </details>
         </div>
         <div class="detail-collapsible">
           <details open>
             <summary>Decoded (JSON)</summary>
-            <div class="detail-block"><pre data-detail-decoded></pre></div>
+            <div class="detail-block"><pre id="detail_decoded" data-detail-decoded></pre></div>
           </details>
         </div>
         <div class="detail-actions">
-          <button type="button" data-detail-close>Close</button>
+          <button id="detail_close" type="button" data-detail-close>Close</button>
         </div>
       </div>
     </div>
-    <div class="loading-overlay" data-decode-overlay data-decode-progress-url="{{ decode_progress_url }}" hidden>
+    <div id="decode_overlay" class="loading-overlay" data-decode-overlay data-decode-progress-url="{{ decode_progress_url }}" hidden>
       <div class="loading-card">
         <div class="progress-track" aria-hidden="true">
-          <div class="progress-fill" data-decode-progress></div>
+          <div id="decode_progress" class="progress-fill" data-decode-progress></div>
         </div>
         <div class="progress-meta">
-          <span data-decode-progress-text>Preparing decode…</span>
-          <span class="progress-percent" data-decode-progress-percent>0%</span>
+          <span id="decode_progress_text" data-decode-progress-text>Preparing decode…</span>
+          <span id="decode_progress_percent" class="progress-percent" data-decode-progress-percent>0%</span>
         </div>
       </div>
     </div>
-
-    <p class="brand-note">
-      A Smart Parks tool to Protect Wildlife with Passion and Technology.
-      <a href="https://www.smartparks.org" target="_blank" rel="noopener">www.smartparks.org</a>
-    </p>
-  </div>
-  {{ script_block|safe }}
-</body>
-</html>
+{% endblock %}
 """
 
 DEVICE_KEYS_HTML = """
-<!doctype html>
-<html>
-<head>
-  <meta charset="utf-8">
-  <title>Device Session Keys</title>
-  <link rel="icon" type="image/x-icon" href="{{ favicon_url }}">
-  {{ style_block|safe }}
-</head>
-<body>
-  <div class="outer-column">
-    {{ nav_html|safe }}
-
+{% extends "base.html" %}
+{% block title %}Device Session Keys{% endblock %}
+{% block content %}
     <div class="card">
       <div class="card-header">
         <div>
@@ -4136,12 +1364,8 @@ DEVICE_KEYS_HTML = """
         </div>
       </form>
     </div>
-
-    <p class="brand-note">
-      A Smart Parks tool to Protect Wildlife with Passion and Technology.
-      <a href="https://www.smartparks.org" target="_blank" rel="noopener">www.smartparks.org</a>
-    </p>
-  </div>
+{% endblock %}
+{% block overlays %}
   {% if scan_summary_lines %}
   <div class="scan-overlay" data-scan-overlay>
     <div class="scan-card">
@@ -4157,24 +1381,13 @@ DEVICE_KEYS_HTML = """
     </div>
   </div>
   {% endif %}
-  {{ script_block|safe }}
-</body>
-</html>
+{% endblock %}
 """
 
 GENERATOR_HTML = """
-<!doctype html>
-<html>
-<head>
-  <meta charset="utf-8">
-  <title>Generate LoRaWAN Test Log</title>
-  <link rel="icon" type="image/x-icon" href="{{ favicon_url }}">
-  {{ style_block|safe }}
-</head>
-<body>
-  <div class="outer-column">
-    {{ nav_html|safe }}
-
+{% extends "base.html" %}
+{% block title %}Generate LoRaWAN Test Log{% endblock %}
+{% block content %}
     <div class="card">
       <div class="card-header">
         <div>
@@ -4252,9 +1465,7 @@ GENERATOR_HTML = """
             <label for="payload_example">Example payloads (optional)</label>
             <select id="payload_example" data-payload-example>
               <option value="">Choose an example payload...</option>
-              {% for example in payload_examples %}
-              <option value="{{ example.payload }}" data-port="{{ example.port }}">{{ example.label }}</option>
-              {% endfor %}
+              {{ payload_example_options_html|safe }}
             </select>
             <div class="hint">Selecting an example fills both payload and matching FPort.</div>
           </div>
@@ -4273,27 +1484,21 @@ GENERATOR_HTML = """
         <div>
           <label for="freq_mhz">Frequency (MHz)</label>
           <select id="freq_mhz" name="freq_mhz" required>
-            {% for freq in freq_options %}
-            <option value="{{ freq }}" {% if form_values.freq_mhz == freq %}selected{% endif %}>{{ freq }} MHz</option>
-            {% endfor %}
+            {{ freq_options_html|safe }}
           </select>
         </div>
 
         <div>
           <label for="datarate">Data rate</label>
           <select id="datarate" name="datarate" required>
-            {% for dr in datarate_options %}
-            <option value="{{ dr }}" {% if form_values.datarate == dr %}selected{% endif %}>{{ dr }}</option>
-            {% endfor %}
+            {{ datarate_options_html|safe }}
           </select>
         </div>
 
         <div>
           <label for="coding_rate">Coding rate</label>
           <select id="coding_rate" name="coding_rate" required>
-            {% for cr in coding_rate_options %}
-            <option value="{{ cr }}" {% if form_values.coding_rate == cr %}selected{% endif %}>{{ cr }}</option>
-            {% endfor %}
+            {{ coding_rate_options_html|safe }}
           </select>
         </div>
 
@@ -4322,12 +1527,8 @@ GENERATOR_HTML = """
         </div>
       </form>
     </div>
-
-    <p class="brand-note">
-      A Smart Parks tool to Protect Wildlife with Passion and Technology.
-      <a href="https://www.smartparks.org" target="_blank" rel="noopener">www.smartparks.org</a>
-    </p>
-  </div>
+{% endblock %}
+{% block overlays %}
   {% if generated_entry %}
   <div class="scan-overlay" data-generated-overlay data-generated-download-url="{{ generated_download_url }}" data-generated-filename="{{ generated_filename }}">
     <div class="scan-card">
@@ -4351,9 +1552,7 @@ GENERATOR_HTML = """
     </div>
   </div>
   {% endif %}
-  {{ script_block|safe }}
-</body>
-</html>
+{% endblock %}
 """
 
 LOG_GENERATOR_DEFAULTS = {
@@ -4415,6 +1614,33 @@ EU868_DATARATE_OPTIONS = [
 EU868_CODING_RATE_OPTIONS = ["4/5", "4/6", "4/7", "4/8"]
 
 
+def build_select_options(values, suffix=""):
+    options = []
+    for value in values:
+        escaped = escape_html(value)
+        options.append(
+            (
+                value,
+                f'<option value="{escaped}">{escaped}{suffix}</option>',
+                f'<option value="{escaped}" selected>{escaped}{suffix}</option>',
+            )
+        )
+    return tuple(options)
+
+
+def render_select_options(options, selected):
+    return "\n".join(selected_html if value == selected else html for value, html, selected_html in options)
+
+
+EU868_FREQ_OPTIONS_HTML = build_select_options(EU868_FREQ_OPTIONS, " MHz")
+EU868_DATARATE_OPTIONS_HTML = build_select_options(EU868_DATARATE_OPTIONS)
+EU868_CODING_RATE_OPTIONS_HTML = build_select_options(EU868_CODING_RATE_OPTIONS)
+PAYLOAD_EXAMPLE_OPTIONS_HTML = "\n".join(
+    f'<option value="{escape_html(example["payload"])}" data-port="{escape_html(example["port"])}">{escape_html(example["label"])}</option>'
+    for example in PAYLOAD_EXAMPLES
+)
+
+
 def get_generator_form_values(overrides=None):
     values = dict(LOG_GENERATOR_DEFAULTS)
     if overrides:
@@ -4424,8 +1650,18 @@ def get_generator_form_values(overrides=None):
     return values
 
 
+CLEAN_HEX_TABLE = str.maketrans("", "", " :-")
+
+
+CLEAN_HEX_UPPER_TABLE = str.maketrans("abcdef", "ABCDEF", " :-")
+
+
 def clean_hex(value: str) -> str:
-    return value.replace(" ", "").replace(":", "").replace("-", "").strip()
+    return value.translate(CLEAN_HEX_TABLE).strip()
+
+
+def clean_hex_upper(value: str) -> str:
+    return value.translate(CLEAN_HEX_UPPER_TABLE).strip()
 
 
 def ensure_data_dirs():
@@ -4436,33 +1672,187 @@ def ensure_data_dirs():
     os.makedirs(BUILTIN_DECODER_DIR, exist_ok=True)
 
 
-def load_json_file(path, default):
+def json_dumps(data, indent=False):
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(data, option=option)
+    if indent:
+        return json.dumps(data, indent=2).encode("utf-8")
+    return json.dumps(data, separators=(",", ":")).encode("utf-8")
+
+
+def json_loads(data):
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_response(data, status=200, conditional=False):
+    body = json_dumps(data)
+    response = app.response_class(body, status=status, mimetype="application/json")
+    if conditional:
+        response.set_etag(hashlib.md5(body).hexdigest())
+        response.headers["Cache-Control"] = "no-cache"
+        return response.make_conditional(request)
+    return response
+
+
+def read_json_file(path, default):
     try:
-        with open(path, "r", encoding="utf-8") as handle:
-            return json.load(handle)
+        with open(path, "rb") as handle:
+            return json_loads(handle.read())
     except FileNotFoundError:
         return default
     except json.JSONDecodeError:
         return default
 
 
-def save_json_file(path, data):
+def write_json_file(path, data):
     ensure_data_dirs()
     tmp_path = f"{path}.tmp"
-    with open(tmp_path, "w", encoding="utf-8") as handle:
-        json.dump(data, handle, indent=2)
+    payload = memoryview(json_dumps(data, indent=True))
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        while payload:
+            payload = payload[os.write(fd, payload):]
+    finally:
+        os.close(fd)
     os.replace(tmp_path, path)
 
 
-def list_stored_logs():
-    entries = load_json_file(UPLOAD_INDEX_PATH, [])
+class JsonStore:
+    def __init__(self, path):
+        self.path = path
+        self.data = None
+        self.loaded = False
+        self.dirty = False
+        self.version = 0
+        self.lock = threading.RLock()
+
+    def load(self, default):
+        with self.lock:
+            if not self.loaded:
+                self.data = read_json_file(self.path, None)
+                self.loaded = True
+            if self.data is None:
+                return default
+            return copy.deepcopy(self.data)
+
+    def save(self, data):
+        with self.lock:
+            self.data = copy.deepcopy(data)
+            self.loaded = True
+            self.dirty = True
+            self.version += 1
+        JSON_FLUSH_EVENT.set()
+        start_json_flusher()
+
+    def flush(self):
+        with self.lock:
+            if not self.dirty:
+                return
+            write_json_file(self.path, self.data)
+            self.dirty = False
+
+
+JSON_STORES = {
+    CREDENTIALS_PATH: JsonStore(CREDENTIALS_PATH),
+    UPLOAD_INDEX_PATH: JsonStore(UPLOAD_INDEX_PATH),
+    DECODE_RESULTS_INDEX_PATH: JsonStore(DECODE_RESULTS_INDEX_PATH),
+}
+JSON_FLUSH_INTERVAL = 0.5
+JSON_FLUSH_EVENT = threading.Event()
+JSON_FLUSHER_LOCK = threading.Lock()
+JSON_FLUSHER = None
+
+
+def flush_json_stores():
+    for store in JSON_STORES.values():
+        try:
+            store.flush()
+        except OSError as exc:
+            app.logger.warning("Failed to write %s: %s", store.path, exc)
+
+
+def run_json_flusher():
+    while True:
+        JSON_FLUSH_EVENT.wait()
+        time.sleep(JSON_FLUSH_INTERVAL)
+        JSON_FLUSH_EVENT.clear()
+        flush_json_stores()
+
+
+def start_json_flusher():
+    global JSON_FLUSHER
+    if JSON_FLUSHER is not None:
+        return
+    with JSON_FLUSHER_LOCK:
+        if JSON_FLUSHER is None:
+            JSON_FLUSHER = threading.Thread(target=run_json_flusher, name="json-flusher", daemon=True)
+            JSON_FLUSHER.start()
+
+
+atexit.register(flush_json_stores)
+
+
+def load_json_file(path, default):
+    store = JSON_STORES.get(path)
+    if store is not None:
+        return store.load(default)
+    return read_json_file(path, default)
+
+
+def save_json_file(path, data):
+    store = JSON_STORES.get(path)
+    if store is not None:
+        store.save(data)
+        return
+    write_json_file(path, data)
+
+
+def list_dir_files(directory):
+    files = {}
+    try:
+        with os.scandir(directory) as items:
+            for item in items:
+                if item.is_file():
+                    files[item.name] = item
+    except FileNotFoundError:
+        pass
+    return files
+
+
+def filter_existing_entries(entries, directory):
+    existing = list_dir_files(directory)
     available = []
     for entry in entries:
-        if os.path.exists(entry.get("path", "")):
+        path = entry.get("path", "")
+        parent, name = os.path.split(path)
+        if parent == directory:
+            if name in existing:
+                available.append(entry)
+        elif path and os.path.exists(path):
             available.append(entry)
     return available
 
 
+STORED_LOGS_CACHE = {}
+
+
+def list_stored_logs():
+    try:
+        dir_mtime = os.stat(UPLOAD_DIR).st_mtime_ns
+    except OSError:
+        dir_mtime = None
+    key = (JSON_STORES[UPLOAD_INDEX_PATH].version, dir_mtime)
+    cached = STORED_LOGS_CACHE.get("entries")
+    if cached and cached[0] == key:
+        return list(cached[1])
+    entries = filter_existing_entries(load_json_file(UPLOAD_INDEX_PATH, []), UPLOAD_DIR)
+    STORED_LOGS_CACHE["entries"] = (key, entries)
+    return list(entries)
+
+
 def get_stored_log_entry(log_id):
     for entry in list_stored_logs():
         if entry.get("id") == log_id:
@@ -4470,13 +1860,12 @@ def get_stored_log_entry(log_id):
     return None
 
 
-def store_uploaded_log(logfile, owner):
-    ensure_data_dirs()
-    token = secrets.token_urlsafe(8)
-    filename = secure_filename(logfile.filename or "log.jsonl") or "log.jsonl"
-    stored_name = f"{token}_{filename}"
-    path = os.path.join(UPLOAD_DIR, stored_name)
-    logfile.save(path)
+@functools.lru_cache(maxsize=1024)
+def safe_filename(filename):
+    return secure_filename(filename)
+
+
+def register_stored_log(token, filename, path, owner):
     size = 0
     try:
         size = os.path.getsize(path)
@@ -4488,7 +1877,7 @@ def store_uploaded_log(logfile, owner):
         "path": path,
         "size": size,
         "owner": owner,
-        "uploaded_at": datetime.datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S UTC"),
+        "uploaded_at": utc_now_text(),
     }
     entries = load_json_file(UPLOAD_INDEX_PATH, [])
     entries.insert(0, entry)
@@ -4496,31 +1885,46 @@ def store_uploaded_log(logfile, owner):
     return entry
 
 
-def store_generated_log(buffer, filename, owner):
+def store_uploaded_log(logfile, owner):
     ensure_data_dirs()
     token = secrets.token_urlsafe(8)
-    filename = secure_filename(filename or "log.jsonl") or "log.jsonl"
+    filename = safe_filename(logfile.filename or "log.jsonl") or "log.jsonl"
     stored_name = f"{token}_{filename}"
     path = os.path.join(UPLOAD_DIR, stored_name)
-    with open(path, "wb") as handle:
-        handle.write(buffer.getvalue())
-    size = 0
+    logfile.save(path)
+    return register_stored_log(token, filename, path, owner)
+
+
+def store_uploaded_stream(stream, filename, owner):
+    ensure_data_dirs()
+    token = secrets.token_urlsafe(8)
+    filename = safe_filename(filename or "log.jsonl") or "log.jsonl"
+    stored_name = f"{token}_{filename}"
+    path = os.path.join(UPLOAD_DIR, stored_name)
+    handle = tempfile.NamedTemporaryFile(dir=UPLOAD_DIR, prefix=".upload-", delete=False)
     try:
-        size = os.path.getsize(path)
-    except OSError:
-        size = 0
-    entry = {
-        "id": token,
-        "filename": filename,
-        "path": path,
-        "size": size,
-        "owner": owner,
-        "uploaded_at": datetime.datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S UTC"),
-    }
-    entries = load_json_file(UPLOAD_INDEX_PATH, [])
-    entries.insert(0, entry)
-    save_json_file(UPLOAD_INDEX_PATH, entries[:200])
-    return entry
+        with handle:
+            shutil.copyfileobj(stream, handle, UPLOAD_CHUNK_SIZE)
+        os.replace(handle.name, path)
+    except Exception:
+        try:
+            os.remove(handle.name)
+        except OSError:
+            pass
+        raise
+    return register_stored_log(token, filename, path, owner)
+
+
+def store_generated_log(frames, filename, owner):
+    ensure_data_dirs()
+    token = secrets.token_urlsafe(8)
+    filename = safe_filename(filename or "log.jsonl") or "log.jsonl"
+    stored_name = f"{token}_{filename}"
+    path = os.path.join(UPLOAD_DIR, stored_name)
+    with open(path, "wb", buffering=UPLOAD_CHUNK_SIZE) as handle:
+        for frame in frames:
+            handle.write(frame)
+    return register_stored_log(token, filename, path, owner)
 
 
 def delete_stored_log(log_id):
@@ -4539,12 +1943,7 @@ def delete_stored_log(log_id):
 
 
 def list_saved_decode_results():
-    entries = load_json_file(DECODE_RESULTS_INDEX_PATH, [])
-    available = []
-    for entry in entries:
-        if os.path.exists(entry.get("path", "")):
-            available.append(entry)
-    return available
+    return filter_existing_entries(load_json_file(DECODE_RESULTS_INDEX_PATH, []), DECODE_RESULTS_DIR)
 
 
 def get_saved_decode_result_entry(saved_id):
@@ -4559,8 +1958,8 @@ def load_saved_decode_rows(saved_id):
     if not entry:
         return None, None
     try:
-        with open(entry["path"], "r", encoding="utf-8") as handle:
-            rows = json.load(handle)
+        with open(entry["path"], "rb") as handle:
+            rows = json_loads(handle.read())
     except (OSError, json.JSONDecodeError):
         return entry, None
     return entry, rows
@@ -4571,8 +1970,8 @@ def store_saved_decode_result(rows, log_id, filename, decoder_id, owner):
     token = secrets.token_urlsafe(8)
     stored_name = f"{token}_decoded.json"
     path = os.path.join(DECODE_RESULTS_DIR, stored_name)
-    with open(path, "w", encoding="utf-8") as handle:
-        json.dump(rows, handle, indent=2, ensure_ascii=True)
+    with open(path, "wb") as handle:
+        handle.write(json_dumps(rows, indent=True))
     size = 0
     try:
         size = os.path.getsize(path)
@@ -4586,7 +1985,7 @@ def store_saved_decode_result(rows, log_id, filename, decoder_id, owner):
         "size": size,
         "decoder_id": decoder_id,
         "owner": owner,
-        "created_at": datetime.datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S UTC"),
+        "created_at": utc_now_text(),
     }
     entries = load_json_file(DECODE_RESULTS_INDEX_PATH, [])
     entries.insert(0, entry)
@@ -4598,6 +1997,17 @@ def scan_stored_log(log_id):
     entry = get_stored_log_entry(log_id)
     if not entry:
         raise ValueError("Log file not found.")
+    try:
+        stat = os.stat(entry["path"])
+    except OSError:
+        raise ValueError("Log file not found.")
+    scan_key = (entry["id"], stat.st_mtime_ns, stat.st_size)
+    with CACHE_LOCK:
+        cached_token = STORED_SCAN_TOKENS.get(scan_key)
+        cached = SCAN_CACHE.get(cached_token) if cached_token else None
+        if cached and time.monotonic() - cached["ts"] <= SCAN_CACHE_TTL:
+            cached["ts"] = time.monotonic()
+            return cached_token, entry
     with open(entry["path"], "rb") as handle:
         parsed, gateways, devaddrs, scan_errors = scan_logfile(handle)
     if scan_errors:
@@ -4616,6 +2026,10 @@ def scan_stored_log(log_id):
     if not parsed:
         raise ValueError("No valid uplinks found.")
     scan_token = store_scan_result(parsed, gateways, devaddrs, entry["filename"], entry["id"])
+    with CACHE_LOCK:
+        for key in [key for key, token in STORED_SCAN_TOKENS.items() if key[0] == entry["id"] or token not in SCAN_CACHE]:
+            STORED_SCAN_TOKENS.pop(key, None)
+        STORED_SCAN_TOKENS[scan_key] = scan_token
     return scan_token, entry
 
 
@@ -4627,21 +2041,30 @@ def save_credentials(credentials):
     save_json_file(CREDENTIALS_PATH, credentials)
 
 
+def is_hex32(value):
+    if len(value) != 32:
+        return False
+    try:
+        return len(bytes.fromhex(value)) == 16
+    except ValueError:
+        return False
+
+
 def normalize_skey(value, label):
-    cleaned = clean_hex(value).upper()
-    if len(cleaned) != 32:
+    cleaned = clean_hex_upper(value)
+    if not is_hex32(cleaned):
         raise ValueError(f"{label} must be 16 bytes (32 hex chars).")
     return cleaned
 
 
 def normalize_devaddr(value):
-    cleaned = clean_hex(value).upper()
+    cleaned = clean_hex_upper(value)
     if len(cleaned) != 8:
         raise ValueError("DevAddr must be 4 bytes (8 hex chars).")
     return cleaned
 
 
-def generate_logfile_bytes(form_values):
+def generate_logfile_frames(form_values):
     gateway_eui = form_values["gateway_eui"].strip()
     if not gateway_eui:
         raise ValueError("Gateway EUI is required.")
@@ -4682,49 +2105,52 @@ def generate_logfile_bytes(form_values):
     if not start_time_raw:
         raise ValueError("Start time is required.")
     try:
-        start_time = datetime.datetime.fromisoformat(start_time_raw)
+        start_time = datetime.datetime.fromisoformat(start_time_raw).replace(tzinfo=None)
     except ValueError as exc:
         raise ValueError("Start time must be in YYYY-MM-DDTHH:MM format.") from exc
 
     out_file = form_values["out_file"].strip() or "generated_log.jsonl"
 
-    output = io.StringIO()
-    for i in range(num_frames):
-        fcnt = fcnt_start + i
-        fport = parse_int(form_values.get("fport", "1"), "FPort", minimum=1, maximum=223)
-        phy = make_test_log.build_abp_uplink(
-            devaddr_le=devaddr_le,
-            nwk_skey=nwk_skey,
-            app_skey=app_skey,
-            fcnt=fcnt,
-            app_payload=app_payload,
-            fport=fport,
-            confirmed=False,
-        )
+    fport = parse_int(form_values.get("fport", "1"), "FPort", minimum=1, maximum=223)
 
-        base64_payload = base64.b64encode(phy).decode("ascii")
-        timestamp = start_time + datetime.timedelta(seconds=i * interval_seconds)
-        rxpk = {
-            "time": timestamp.strftime("%Y-%m-%dT%H:%M:%SZ"),
-            "tmst": 1000000 + i * 1000,
-            "freq": freq_mhz,
-            "chan": 0,
-            "rfch": 0,
-            "stat": 1,
-            "modu": "LORA",
-            "datr": datarate,
-            "codr": coding_rate,
-            "rssi": -60 - (i % 20),
-            "lsnr": 5.5 - (i % 10) * 0.1,
-            "size": len(phy),
-            "data": base64_payload,
-        }
-        rec = {"gatewayEui": gateway_eui, "rxpk": rxpk}
-        output.write(json.dumps(rec) + "\n")
+    frame_head = b'{"gatewayEui":%s,"rxpk":{"time":"' % json_dumps(gateway_eui)
+    frame_radio = b'"freq":%s,"chan":0,"rfch":0,"stat":1,"modu":"LORA","datr":%s,"codr":%s,' % (
+        json_dumps(freq_mhz),
+        json_dumps(datarate),
+        json_dumps(coding_rate),
+    )
+    frame_template = (
+        frame_head.replace(b"%", b"%%")
+        + b'%sZ","tmst":%d,'
+        + frame_radio.replace(b"%", b"%%")
+        + b'"rssi":%d,"lsnr":%s,"size":%d,"data":"%s"}}\n'
+    )
+    lsnr_values = [json_dumps(5.5 - step * 0.1) for step in range(10)]
+    interval = datetime.timedelta(seconds=interval_seconds)
+    uplinks = make_test_log.build_abp_uplink_batch(
+        devaddr_le=devaddr_le,
+        nwk_skey=nwk_skey,
+        app_skey=app_skey,
+        fcnt_start=fcnt_start,
+        num_frames=num_frames,
+        app_payload=app_payload,
+        fport=fport,
+        confirmed=False,
+    )
+
+    def iter_frames():
+        for i, phy in enumerate(uplinks):
+            timestamp = start_time + interval * i
+            yield frame_template % (
+                timestamp.isoformat(timespec="seconds").encode("ascii"),
+                1000000 + i * 1000,
+                -60 - (i % 20),
+                lsnr_values[i % 10],
+                len(phy),
+                binascii.b2a_base64(phy, newline=False),
+            )
 
-    buffer = io.BytesIO(output.getvalue().encode("utf-8"))
-    buffer.seek(0)
-    return buffer, out_file
+    return iter_frames(), out_file
 
 
 def parse_int(value, field, minimum=None, maximum=None):
@@ -4750,14 +2176,20 @@ def hex_to_bytes(value, label):
     return raw
 
 
-def parse_uplink(rxpk):
-    data = rxpk.get("data")
-    if not data:
-        raise ValueError("Missing rxpk.data payload.")
+@functools.lru_cache(maxsize=4096)
+def decode_phy_payload(data):
     try:
-        phy = base64.b64decode(data, validate=True)
+        return base64.b64decode(data, validate=True)
     except binascii.Error as exc:
         raise ValueError("rxpk.data is not valid base64.") from exc
+
+
+def parse_uplink(rxpk, phy=None):
+    if phy is None:
+        data = rxpk.get("data")
+        if not data or not isinstance(data, str):
+            raise ValueError("Missing rxpk.data payload.")
+        phy = decode_phy_payload(data)
     if len(phy) < 12:
         raise ValueError("PHYPayload too short.")
 
@@ -4771,7 +2203,7 @@ def parse_uplink(rxpk):
         raise ValueError("MACPayload too short.")
 
     devaddr_le = mac_payload[0:4]
-    devaddr = devaddr_le[::-1].hex().upper()
+    devaddr = f"{int.from_bytes(devaddr_le, 'little'):08X}"
     fctrl = mac_payload[4]
     fcnt = int.from_bytes(mac_payload[5:7], "little")
     fopts_len = fctrl & 0x0F
@@ -4801,6 +2233,24 @@ def parse_uplink(rxpk):
     }
 
 
+@functools.lru_cache(maxsize=4096)
+def format_epoch_utc(ts):
+    try:
+        return datetime.datetime.fromtimestamp(ts, datetime.timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+    except (OverflowError, OSError, ValueError):
+        return ""
+
+
+def format_send_time_ms(send_time_ms):
+    if send_time_ms is None or send_time_ms == "":
+        return "-"
+    try:
+        dt = datetime.datetime.fromtimestamp(send_time_ms / 1000, datetime.timezone.utc)
+    except (TypeError, OverflowError, OSError, ValueError):
+        return "-"
+    return f"{dt:%H:%M:%S}.{dt.microsecond // 1000:03d}"
+
+
 def format_unix_utc(timestamp):
     if timestamp is None or timestamp == "":
         return ""
@@ -4808,10 +2258,7 @@ def format_unix_utc(timestamp):
         ts = int(timestamp)
     except (TypeError, ValueError):
         return ""
-    try:
-        return datetime.datetime.utcfromtimestamp(ts).strftime("%Y-%m-%dT%H:%M:%SZ")
-    except (OverflowError, OSError, ValueError):
-        return ""
+    return format_epoch_utc(ts)
 
 
 def unpack_port29_messages(payload):
@@ -4867,8 +2314,8 @@ def load_field_meta():
     if not os.path.exists(FIELD_META_PATH):
         return {}
     try:
-        with open(FIELD_META_PATH, "r", encoding="utf-8") as handle:
-            data = json.load(handle)
+        with open(FIELD_META_PATH, "rb") as handle:
+            data = json_loads(handle.read())
     except (OSError, json.JSONDecodeError):
         return {}
     return data if isinstance(data, dict) else {}
@@ -4920,69 +2367,84 @@ FIELD_META = load_field_meta()
 def lorawan_decrypt_payload(key, devaddr_le, fcnt, payload, direction=0):
     if not payload:
         return b""
-    cipher = make_aes_cipher(key)
-    out = bytearray()
-    block_count = (len(payload) + 15) // 16
-    for i in range(block_count):
-        a_block = bytearray(16)
-        a_block[0] = 0x01
-        a_block[5] = direction & 0x01
-        a_block[6:10] = devaddr_le
-        a_block[10:14] = fcnt.to_bytes(4, "little")
-        a_block[15] = i + 1
-        s_block = cipher.encrypt(bytes(a_block))
-        start = i * 16
-        end = start + 16
-        block = payload[start:end]
-        for j, b in enumerate(block):
-            out.append(b ^ s_block[j])
-    return bytes(out)
+    nonce = bytes((0x01, 0, 0, 0, 0, direction & 0x01)) + bytes(devaddr_le) + fcnt.to_bytes(4, "little") + b"\x00"
+    counter_blocks = b"".join(nonce + bytes((i,)) for i in range(1, (len(payload) + 15) // 16 + 1))
+    keystream = make_aes_cipher(bytes(key)).encrypt(counter_blocks)
+    size = len(payload)
+    mixed = int.from_bytes(payload, "big") ^ int.from_bytes(keystream[:size], "big")
+    return mixed.to_bytes(size, "big")
 
 
+@functools.lru_cache(maxsize=256)
 def make_aes_cipher(key):
-    try:
-        from Crypto.Cipher import AES
-    except ImportError as exc:
-        raise RuntimeError("PyCryptodome is required for LoRaWAN decryption.") from exc
+    if AES is None:
+        raise RuntimeError("PyCryptodome is required for LoRaWAN decryption.")
     return AES.new(key, AES.MODE_ECB)
 
 
-def extract_devaddr(rxpk):
+def extract_phy_devaddr(rxpk):
     data = rxpk.get("data")
-    if not data:
+    if not data or not isinstance(data, str):
         raise ValueError("Missing rxpk.data payload.")
     try:
-        payload = base64.b64decode(data, validate=True)
+        phy = base64.b64decode(data, validate=True)
     except binascii.Error as exc:
         raise ValueError("rxpk.data is not valid base64.") from exc
-    if len(payload) < 5:
+    if len(phy) < 5:
         raise ValueError("PHYPayload too short to contain a DevAddr.")
-    devaddr_le = payload[1:5]
-    return devaddr_le[::-1].hex().upper()
+    return phy, f"{int.from_bytes(phy[1:5], 'little'):08X}"
+
+
+class ScanFrames:
+    __slots__ = ("gateway_table", "gateway_ids", "rxpks", "phys")
+
+    def __init__(self):
+        self.gateway_table = []
+        self.gateway_ids = array.array("I")
+        self.rxpks = []
+        self.phys = []
+
+    def __len__(self):
+        return len(self.rxpks)
+
+    def append(self, gateway_index, rxpk, phy):
+        self.gateway_ids.append(gateway_index)
+        self.rxpks.append(rxpk)
+        self.phys.append(phy)
+
+    def iter_frames(self, start=0):
+        table = self.gateway_table
+        gateway_euis = (table[index] for index in itertools.islice(self.gateway_ids, start, None))
+        return zip(
+            gateway_euis,
+            itertools.islice(self.rxpks, start, None),
+            itertools.islice(self.phys, start, None),
+        )
 
 
 def scan_logfile(stream):
-    parsed = []
-    gateways = set()
-    devaddrs = set()
+    parsed = ScanFrames()
+    gateways = {}
+    devaddrs = {}
     errors = []
 
-    for line_no, raw_line in enumerate(stream, start=1):
-        if isinstance(raw_line, str):
-            raw_line = raw_line.encode("utf-8")
-        try:
-            line = raw_line.decode("utf-8").strip()
-        except UnicodeDecodeError:
-            errors.append(f"Line {line_no}: invalid UTF-8 encoding.")
-            continue
-
+    data = stream.read()
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    for line_no, raw_line in enumerate(data.split(b"\n"), start=1):
+        line = raw_line.strip()
         if not line:
             continue
 
         try:
-            rec = json.loads(line)
-        except json.JSONDecodeError as exc:
-            errors.append(f"Line {line_no}: JSON decode error ({exc}).")
+            rec = json_loads(line)
+        except ValueError as exc:
+            try:
+                line.decode("utf-8")
+            except UnicodeDecodeError:
+                errors.append(f"Line {line_no}: invalid UTF-8 encoding.")
+            else:
+                errors.append(f"Line {line_no}: JSON decode error ({exc}).")
             continue
 
         if not isinstance(rec, dict):
@@ -4991,45 +2453,70 @@ def scan_logfile(stream):
 
         gateway_eui = rec.get("gatewayEui") or rec.get("gateway_eui")
         rxpk = rec.get("rxpk")
-        if not gateway_eui or not isinstance(rxpk, dict):
+        if not gateway_eui or not isinstance(gateway_eui, str) or not isinstance(rxpk, dict):
             errors.append(f"Line {line_no}: missing gatewayEui or rxpk.")
             continue
 
-        try:
-            normalize_gateway_eui(gateway_eui)
-        except ValueError as exc:
-            errors.append(f"Line {line_no}: {exc}")
-            continue
+        gateway_index = gateways.get(gateway_eui)
+        if gateway_index is None:
+            try:
+                normalize_gateway_eui(gateway_eui)
+            except ValueError as exc:
+                errors.append(f"Line {line_no}: {exc}")
+                continue
 
         try:
-            devaddr = extract_devaddr(rxpk)
+            phy, devaddr = extract_phy_devaddr(rxpk)
         except ValueError as exc:
             errors.append(f"Line {line_no}: {exc}")
             continue
 
-        gateways.add(gateway_eui)
-        devaddrs.add(devaddr)
-        parsed.append({"gateway_eui": gateway_eui, "rxpk": rxpk})
+        if gateway_index is None:
+            gateway_index = gateways[gateway_eui] = len(parsed.gateway_table)
+            parsed.gateway_table.append(gateway_eui)
+        devaddrs[devaddr] = None
+        parsed.append(gateway_index, rxpk, phy)
 
     return parsed, sorted(gateways), sorted(devaddrs), errors
 
 
-def prune_scan_cache(now=None):
-    if not SCAN_CACHE:
-        return
-    now = time.time() if now is None else now
-    expired = [token for token, entry in SCAN_CACHE.items() if now - entry["ts"] > SCAN_CACHE_TTL]
-    for token in expired:
-        del SCAN_CACHE[token]
+CACHE_PRUNE_INTERVAL = 5
+CACHE_LAST_PRUNED = {}
 
 
-def prune_decode_cache(now=None):
-    if not DECODE_CACHE:
+def prune_cache(cache, ttl, max_entries, now=None):
+    if not cache:
+        return
+    now = time.monotonic() if now is None else now
+    cache_id = id(cache)
+    if len(cache) <= max_entries and now - CACHE_LAST_PRUNED.get(cache_id, 0.0) < CACHE_PRUNE_INTERVAL:
         return
-    now = time.time() if now is None else now
-    expired = [token for token, entry in DECODE_CACHE.items() if now - entry["ts"] > DECODE_CACHE_TTL]
+    CACHE_LAST_PRUNED[cache_id] = now
+    expired = [
+        token
+        for token, entry in list(cache.items())
+        if now - entry["ts"] > ttl and entry.get("status") != "running"
+    ]
     for token in expired:
-        del DECODE_CACHE[token]
+        del cache[token]
+    overflow = len(cache) - max_entries
+    if overflow > 0:
+        idle = [token for token, entry in cache.items() if entry.get("status") != "running"]
+        for token in sorted(idle, key=lambda key: cache[key]["ts"])[:overflow]:
+            del cache[token]
+
+
+def get_cache_entry(cache, token, ttl, lock):
+    with lock:
+        entry = cache.get(token)
+        if not entry:
+            return None
+        now = time.monotonic()
+        if now - entry["ts"] > ttl and entry.get("status") != "running":
+            cache.pop(token, None)
+            return None
+        entry["ts"] = now
+        return entry
 
 
 def set_decode_progress(progress_id, user_id, completed, total, done=False):
@@ -5051,15 +2538,6 @@ def get_decode_progress(progress_id, user_id):
     return entry
 
 
-def prune_replay_cache(now=None):
-    if not REPLAY_CACHE:
-        return
-    now = time.time() if now is None else now
-    expired = [token for token, entry in REPLAY_CACHE.items() if now - entry["ts"] > REPLAY_CACHE_TTL]
-    for token in expired:
-        del REPLAY_CACHE[token]
-
-
 def resolve_back_url(default_url):
     referrer = request.referrer or ""
     if not referrer:
@@ -5084,6 +2562,34 @@ def resolve_back_url(default_url):
     return referrer
 
 
+def replay_cell_text(value):
+    if value is None or value == "":
+        return "-"
+    return escape_html(value)
+
+
+def render_replay_log_row(log_line):
+    def attr(key):
+        value = log_line.get(key)
+        return "" if value is None else escape_html(value)
+
+    return (
+        f"<tr class=\"{attr('css')}\" data-index=\"{attr('index')}\" data-status=\"{attr('status')}\" "
+        f"data-send-time-ms=\"{attr('send_time_ms')}\" data-gateway=\"{attr('gateway')}\" "
+        f"data-fcnt=\"{attr('fcnt')}\" data-freq=\"{attr('freq')}\" data-size=\"{attr('size')}\" "
+        f"data-message=\"{attr('message')}\">"
+        f"<td>{replay_cell_text(log_line.get('index'))}</td>"
+        f"<td>{replay_cell_text(log_line.get('status'))}</td>"
+        f"<td class=\"send-time-cell\">{replay_cell_text(log_line.get('send_time_str'))}</td>"
+        f"<td>{replay_cell_text(log_line.get('gateway'))}</td>"
+        f"<td>{replay_cell_text(log_line.get('fcnt'))}</td>"
+        f"<td>{replay_cell_text(log_line.get('freq'))}</td>"
+        f"<td>{replay_cell_text(log_line.get('size'))}</td>"
+        f"<td>{replay_cell_text(log_line.get('message'))}</td>"
+        "</tr>"
+    )
+
+
 def store_replay_job(
     total,
     host,
@@ -5095,10 +2601,9 @@ def store_replay_job(
     log_lines=None,
     override_rxpk=False,
 ):
-    prune_replay_cache()
     token = secrets.token_urlsafe(16)
-    REPLAY_CACHE[token] = {
-        "ts": time.time(),
+    entry = {
+        "ts": time.monotonic(),
         "status": "running",
         "total": total,
         "sent": sent,
@@ -5108,73 +2613,89 @@ def store_replay_job(
         "delay_ms": delay_ms,
         "start_index": start_index,
         "current_index": start_index,
-        "log_lines": list(log_lines or []),
+        "log_lines": collections.deque(log_lines or [], maxlen=REPLAY_LOG_MAX_LINES),
+        "log_html": collections.deque(
+            (render_replay_log_row(line) for line in log_lines or []), maxlen=REPLAY_LOG_MAX_LINES
+        ),
+        "log_count": len(log_lines or []),
         "override_rxpk": bool(override_rxpk),
+        "lock": threading.Condition(),
     }
+    with REPLAY_LOCK:
+        prune_cache(REPLAY_CACHE, REPLAY_CACHE_TTL, REPLAY_CACHE_MAX_ENTRIES - 1)
+        REPLAY_CACHE[token] = entry
     return token
 
 
 def get_replay_job(token):
-    prune_replay_cache()
-    return REPLAY_CACHE.get(token)
+    return get_cache_entry(REPLAY_CACHE, token, REPLAY_CACHE_TTL, REPLAY_LOCK)
 
 
-def update_replay_job(token, **updates):
-    with REPLAY_LOCK:
-        entry = REPLAY_CACHE.get(token)
-        if not entry:
-            return
+def update_replay_job(token, **updates):
+    entry = REPLAY_CACHE.get(token)
+    if not entry:
+        return
+    with entry["lock"]:
         entry.update(updates)
-        entry["ts"] = time.time()
+        entry["ts"] = time.monotonic()
+        entry["lock"].notify_all()
 
 
-def append_replay_log(token, log_line, sent=None, errors=None, status=None):
-    with REPLAY_LOCK:
-        entry = REPLAY_CACHE.get(token)
-        if not entry:
-            return
+def append_replay_log(token, log_line, sent=None, errors=None, status=None, current_index=None):
+    entry = REPLAY_CACHE.get(token)
+    if not entry:
+        return
+    log_line["send_time_str"] = format_send_time_ms(log_line.get("send_time_ms"))
+    row_html = render_replay_log_row(log_line)
+    with entry["lock"]:
         entry["log_lines"].append(log_line)
+        entry["log_html"].append(row_html)
+        entry["log_count"] += 1
         if sent is not None:
             entry["sent"] = sent
         if errors is not None:
             entry["errors"] = errors
         if status is not None:
             entry["status"] = status
-        entry["ts"] = time.time()
+        if current_index is not None:
+            entry["current_index"] = current_index
+        entry["ts"] = time.monotonic()
+        entry["lock"].notify_all()
 
 
 def store_scan_result(parsed, gateways, devaddrs, filename, stored_log_id=""):
-    prune_scan_cache()
     token = secrets.token_urlsafe(16)
-    SCAN_CACHE[token] = {
+    entry = {
         "parsed": parsed,
         "gateways": gateways,
         "devaddrs": devaddrs,
         "filename": filename,
         "stored_log_id": stored_log_id,
-        "ts": time.time(),
+        "ts": time.monotonic(),
     }
+    with CACHE_LOCK:
+        prune_cache(SCAN_CACHE, SCAN_CACHE_TTL, SCAN_CACHE_MAX_ENTRIES - 1)
+        SCAN_CACHE[token] = entry
     return token
 
 
 def get_scan_result(token):
-    prune_scan_cache()
-    entry = SCAN_CACHE.get(token)
+    entry = get_cache_entry(SCAN_CACHE, token, SCAN_CACHE_TTL, CACHE_LOCK)
     if not entry:
         return None
     return entry["parsed"], entry["gateways"], entry["devaddrs"], entry["filename"], entry.get("stored_log_id", "")
 
 
 def store_decode_result(rows):
-    prune_decode_cache()
     token = secrets.token_urlsafe(16)
-    DECODE_CACHE[token] = {"rows": rows, "ts": time.time()}
+    with CACHE_LOCK:
+        prune_cache(DECODE_CACHE, DECODE_CACHE_TTL, DECODE_CACHE_MAX_ENTRIES - 1)
+        DECODE_CACHE[token] = {"rows": rows, "ts": time.monotonic()}
     return token
 
 
 def get_decode_result(token):
-    prune_decode_cache()
-    entry = DECODE_CACHE.get(token)
+    entry = get_cache_entry(DECODE_CACHE, token, DECODE_CACHE_TTL, CACHE_LOCK)
     if not entry:
         return None
     return entry["rows"]
@@ -5193,45 +2714,182 @@ def format_list(label, items, limit=10):
 JS_DECODER_RUNNER = r"""
 const fs = require("fs");
 const vm = require("vm");
+const readline = require("readline");
 
 const path = process.argv[1];
-const fport = parseInt(process.argv[2], 10) || 0;
-const b64 = process.argv[3] || "";
-const buf = Buffer.from(b64, "base64");
-const bytes = Array.from(buf.values());
-
-const code = fs.readFileSync(path, "utf8");
-const sandbox = { console: console };
-vm.createContext(sandbox);
-vm.runInContext(code, sandbox);
-
-let result;
-if (typeof sandbox.Decoder === "function") {
-  result = { data: sandbox.Decoder(bytes, fport) };
-} else if (typeof sandbox.decodeUplink === "function") {
-  result = sandbox.decodeUplink({ bytes: bytes, fPort: fport });
-} else if (typeof sandbox.decode === "function") {
-  result = sandbox.decode(bytes, fport);
-} else {
-  throw new Error("Decoder file must export decodeUplink(), Decoder(), or decode().");
+const maxContexts = 16;
+const sandboxConsole = new console.Console(process.stderr);
+const contexts = new Map();
+let script = null;
+
+function loadSandbox(runId) {
+  let context = contexts.get(runId);
+  if (context === undefined) {
+    if (script === null) {
+      script = new vm.Script(fs.readFileSync(path, "utf8"), { filename: path });
+    }
+    context = vm.createContext({ console: sandboxConsole });
+    script.runInContext(context);
+    contexts.set(runId, context);
+    if (contexts.size > maxContexts) {
+      contexts.delete(contexts.keys().next().value);
+    }
+  }
+  return context;
+}
+
+function decodeOne(runId, fport, b64) {
+  const sandbox = loadSandbox(runId);
+  const bytes = Array.from(Buffer.from(b64, "base64").values());
+
+  let result;
+  if (typeof sandbox.Decoder === "function") {
+    result = { data: sandbox.Decoder(bytes, fport) };
+  } else if (typeof sandbox.decodeUplink === "function") {
+    result = sandbox.decodeUplink({ bytes: bytes, fPort: fport });
+  } else if (typeof sandbox.decode === "function") {
+    result = sandbox.decode(bytes, fport);
+  } else {
+    throw new Error("Decoder file must export decodeUplink(), Decoder(), or decode().");
+  }
+  return result === undefined ? null : result;
 }
 
-process.stdout.write(JSON.stringify(result === undefined ? null : result));
+readline.createInterface({ input: process.stdin }).on("line", (line) => {
+  const [runId, portText, b64 = ""] = line.split(" ");
+  let reply;
+  try {
+    reply = JSON.stringify({ result: decodeOne(runId, parseInt(portText, 10) || 0, b64) });
+  } catch (err) {
+    reply = JSON.stringify({ error: String((err && err.stack) || err) });
+  }
+  process.stdout.write(reply + "\n");
+});
 """
+JS_DECODER_WORKERS = {}
+JS_DECODER_WORKERS_LOCK = threading.Lock()
+
+
+class JsDecoderWorker:
+    def __init__(self, path):
+        self.path = path
+        self.mtime = os.path.getmtime(path)
+        self.lock = threading.Lock()
+        self.process = None
+        self.retired = False
+        self.run_ids = itertools.count(1)
+
+    def start(self):
+        try:
+            self.process = subprocess.Popen(
+                ["node", "-e", JS_DECODER_RUNNER, self.path],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+                bufsize=1,
+            )
+        except FileNotFoundError as exc:
+            raise ValueError("Node.js is required to run JS decoders.") from exc
+
+    def stop(self):
+        with self.lock:
+            self.retired = True
+            self.stop_process()
+
+    def stop_process(self):
+        process = self.process
+        self.process = None
+        if process is None:
+            return
+        try:
+            process.stdin.close()
+        except OSError:
+            pass
+        try:
+            process.wait(timeout=1)
+        except subprocess.TimeoutExpired:
+            process.kill()
+
+    def new_run(self):
+        with self.lock:
+            return next(self.run_ids)
+
+    def decode(self, run_id, fport, b64_payload):
+        with self.lock:
+            if self.process is None or self.process.poll() is not None:
+                self.start()
+            try:
+                self.process.stdin.write(f"{run_id} {fport} {b64_payload}\n")
+                self.process.stdin.flush()
+                line = self.process.stdout.readline()
+            except OSError:
+                line = ""
+            if not line:
+                self.stop_process()
+                raise ValueError("Decoder process exited unexpectedly.")
+            if self.retired:
+                self.stop_process()
+        reply = json_loads(line)
+        if "error" in reply:
+            raise ValueError(reply["error"] or "Unknown decoder error.")
+        return reply.get("result")
+
+
+def get_js_decoder_worker(path):
+    mtime = os.path.getmtime(path)
+    with JS_DECODER_WORKERS_LOCK:
+        old_worker = JS_DECODER_WORKERS.get(path)
+        if old_worker is not None and old_worker.mtime == mtime:
+            return old_worker
+        worker = JsDecoderWorker(path)
+        JS_DECODER_WORKERS[path] = worker
+    if old_worker is not None:
+        old_worker.stop()
+    return worker
+
+
+def stop_js_decoder_workers():
+    with JS_DECODER_WORKERS_LOCK:
+        workers = list(JS_DECODER_WORKERS.values())
+        JS_DECODER_WORKERS.clear()
+    for worker in workers:
+        worker.stop()
+
+
+atexit.register(stop_js_decoder_workers)
+
+
+DECODER_LIST_CACHE = {}
+
+
+def dir_mtime_ns(directory):
+    try:
+        return os.stat(directory).st_mtime_ns
+    except FileNotFoundError:
+        return None
 
 
 def list_decoders():
     ensure_data_dirs()
+    key = (
+        dir_mtime_ns(BUILTIN_DECODER_DIR),
+        dir_mtime_ns(DECODER_DIR) if DECODER_FILE_EXECUTION_ENABLED else None,
+    )
+    cached = DECODER_LIST_CACHE.get("entry")
+    if cached and cached[0] == key:
+        return cached[1]
     decoders = [{"id": "raw", "label": "Raw payload (hex)", "source": "builtin"}]
-    for filename in sorted(os.listdir(BUILTIN_DECODER_DIR)):
+    for filename in sorted(list_dir_files(BUILTIN_DECODER_DIR)):
         if filename.lower().endswith(".js"):
             decoder_id = f"builtin:{filename}"
             decoders.append({"id": decoder_id, "label": filename, "source": "builtin"})
     if DECODER_FILE_EXECUTION_ENABLED:
-        for filename in sorted(os.listdir(DECODER_DIR)):
+        for filename in sorted(list_dir_files(DECODER_DIR)):
             if filename.lower().endswith(".js"):
                 decoder_id = f"file:{filename}"
                 decoders.append({"id": decoder_id, "label": filename, "source": "upload"})
+    DECODER_LIST_CACHE["entry"] = (key, decoders)
     return decoders
 
 
@@ -5245,6 +2903,8 @@ def load_decoder(decoder_id):
     def load_js_decoder(path):
         if not os.path.exists(path):
             raise ValueError("Decoder file not found.")
+        worker = get_js_decoder_worker(path)
+        run_id = worker.new_run()
 
         def decode(payload, fport, devaddr, rxpk):
             if fport is None:
@@ -5252,22 +2912,7 @@ def load_decoder(decoder_id):
             else:
                 fport_value = int(fport)
             b64_payload = base64.b64encode(payload).decode("ascii")
-            try:
-                result = subprocess.run(
-                    ["node", "-e", JS_DECODER_RUNNER, path, str(fport_value), b64_payload],
-                    capture_output=True,
-                    text=True,
-                    check=True,
-                )
-            except FileNotFoundError as exc:
-                raise ValueError("Node.js is required to run JS decoders.") from exc
-            except subprocess.CalledProcessError as exc:
-                err = exc.stderr.strip() or "Unknown decoder error."
-                raise ValueError(err) from exc
-            output = result.stdout.strip()
-            if not output:
-                return None
-            return json.loads(output)
+            return worker.decode(run_id, fport_value, b64_payload)
 
         return decode
 
@@ -5306,6 +2951,57 @@ def resolve_decoder_path(decoder_id):
     raise ValueError("Unknown decoder selection.")
 
 
+INLINE_TEMPLATES = {"base.html": BASE_HTML, "simple_page.html": SIMPLE_PAGE_HTML}
+COMPILED_TEMPLATES = {}
+
+
+def configure_template_env():
+    env = app.jinja_env
+    env.loader = ChoiceLoader([DictLoader(INLINE_TEMPLATES), env.loader])
+    try:
+        os.makedirs(JINJA_CACHE_DIR, mode=0o700, exist_ok=True)
+    except OSError:
+        return
+    env.bytecode_cache = FileSystemBytecodeCache(JINJA_CACHE_DIR)
+
+
+configure_template_env()
+
+
+def compile_inline_template(source):
+    template = COMPILED_TEMPLATES.get(source)
+    if template is None:
+        name = f"inline-{hashlib.sha1(source.encode('utf-8')).hexdigest()}.html"
+        INLINE_TEMPLATES[name] = source
+        template = app.jinja_env.get_template(name)
+        COMPILED_TEMPLATES[source] = template
+    return template
+
+
+def render_cached_template(source, **context):
+    template = compile_inline_template(source)
+    app.update_template_context(context)
+    return template.render(context)
+
+
+for _template_source in (
+    NAV_HTML,
+    HTML,
+    REPLAY_HTML,
+    SIMPLE_PAGE_HTML,
+    DECODERS_PAGE_HTML,
+    FILE_VIEWER_HTML,
+    INTEGRATIONS_PAGE_HTML,
+    ABOUT_PAGE_HTML,
+    LOGIN_HTML,
+    CHANGE_PASSWORD_HTML,
+    DECODE_HTML,
+    DEVICE_KEYS_HTML,
+    GENERATOR_HTML,
+):
+    compile_inline_template(_template_source)
+
+
 def nav_context(active_page, logo_url):
     csrf_token = get_csrf_token()
     context = {
@@ -5321,10 +3017,30 @@ def nav_context(active_page, logo_url):
         "show_menu": current_user.is_authenticated,
         "csrf_token": csrf_token,
     }
-    nav_html = render_template_string(NAV_HTML, logo_url=logo_url, **context)
+    user_id = current_user.id if current_user.is_authenticated else None
+    nav_html = render_nav_html(active_page, logo_url, user_id, csrf_token, request.script_root)
     return {**context, "nav_html": nav_html}
 
 
+@functools.lru_cache(maxsize=256)
+def render_nav_html(active_page, logo_url, user_id, csrf_token, script_root):
+    return render_cached_template(
+        NAV_HTML,
+        logo_url=logo_url,
+        active_page=active_page,
+        start_url=url_for("index"),
+        devices_url=url_for("device_keys"),
+        users_url=url_for("users_page"),
+        files_url=url_for("files_page"),
+        decoders_url=url_for("decoders_page"),
+        integrations_url=url_for("integrations_page"),
+        about_url=url_for("about_page"),
+        logout_url=url_for("logout"),
+        show_menu=user_id is not None,
+        csrf_token=csrf_token,
+    )
+
+
 def render_main_page(
     result_lines=None,
     result_class="",
@@ -5344,16 +3060,14 @@ def render_main_page(
         values["host"] = form_values.get("host", values["host"])
         values["port"] = form_values.get("port", values["port"])
         values["delay_ms"] = form_values.get("delay_ms", values["delay_ms"])
-    logo_url = url_for("static", filename="company_logo.png")
-    return render_template_string(
+    logo_url = page_static_urls()["logo_url"]
+    return render_cached_template(
         HTML,
-        style_block=STYLE_BLOCK,
-        script_block=SCRIPT_BLOCK,
-        logo_url=logo_url,
-        favicon_url=url_for("static", filename="favicon.ico"),
+        **page_static_urls(),
         replay_url=url_for("replay"),
         replay_page_url=url_for("replay"),
         scan_url=url_for("scan"),
+        upload_url=url_for("upload_log_stream"),
         decode_url=url_for("decode"),
         form_values=values,
         result_lines=result_lines or [],
@@ -5396,15 +3110,13 @@ def render_replay_page(
             values["override_rxpk"] = override_raw.strip().lower() in ("1", "true", "yes", "on")
         else:
             values["override_rxpk"] = bool(override_raw)
-    logo_url = url_for("static", filename="company_logo.png")
-    return render_template_string(
+    logo_url = page_static_urls()["logo_url"]
+    return render_cached_template(
         REPLAY_HTML,
-        style_block=STYLE_BLOCK,
-        script_block=SCRIPT_BLOCK,
-        logo_url=logo_url,
-        favicon_url=url_for("static", filename="favicon.ico"),
+        **page_static_urls(),
         replay_url=url_for("replay"),
         replay_status_url=url_for("replay_status"),
+        replay_events_url=url_for("replay_events"),
         replay_stop_url=url_for("replay_stop"),
         replay_resume_url=url_for("replay_resume"),
         form_values=values,
@@ -5423,32 +3135,36 @@ def render_replay_page(
     )
 
 
-def render_simple_page(title, subtitle, body_html, active_page, page_title=None):
-    logo_url = url_for("static", filename="company_logo.png")
+@functools.lru_cache(maxsize=16)
+def render_static_fragment(source, script_root):
+    return render_cached_template(source, **build_page_static_urls(script_root))
+
+
+SIMPLE_PAGE_TITLE_ICONS = {
+    "start": "home",
+    "devices": "memory",
+    "users": "group",
+    "files": "folder",
+    "decoders": "code",
+    "integrations": "hub",
+    "about": "info",
+}
+
+
+def render_simple_page(title, subtitle, body_html="", active_page="", page_title=None, template=SIMPLE_PAGE_HTML, **context):
+    static_urls = page_static_urls()
     back_url = resolve_back_url(url_for("index"))
-    title_icons = {
-        "start": "home",
-        "devices": "memory",
-        "users": "group",
-        "files": "folder",
-        "decoders": "code",
-        "integrations": "hub",
-        "about": "info",
-    }
-    title_icon = title_icons.get(active_page)
-    return render_template_string(
-        SIMPLE_PAGE_HTML,
-        style_block=STYLE_BLOCK,
-        script_block=SCRIPT_BLOCK,
-        logo_url=logo_url,
-        favicon_url=url_for("static", filename="favicon.ico"),
+    return render_cached_template(
+        template,
+        **static_urls,
+        **context,
         title=title,
-        title_icon=title_icon,
+        title_icon=SIMPLE_PAGE_TITLE_ICONS.get(active_page),
         subtitle=subtitle,
         body_html=body_html,
         page_title=page_title or title,
         back_url=back_url,
-        **nav_context(active_page, logo_url),
+        **nav_context(active_page, static_urls["logo_url"]),
     )
 
 
@@ -5459,7 +3175,7 @@ def render_generator_page(
     generated_scan_token="",
 ):
     values = form_values if form_values is not None else get_generator_form_values()
-    logo_url = url_for("static", filename="company_logo.png")
+    logo_url = page_static_urls()["logo_url"]
     download_url = ""
     replay_url = ""
     decode_url = ""
@@ -5469,12 +3185,9 @@ def render_generator_page(
         replay_url = url_for("replay")
         decode_url = url_for("decode")
         filename = generated_entry.get("filename", "")
-    return render_template_string(
+    return render_cached_template(
         GENERATOR_HTML,
-        style_block=STYLE_BLOCK,
-        script_block=SCRIPT_BLOCK,
-        logo_url=logo_url,
-        favicon_url=url_for("static", filename="favicon.ico"),
+        **page_static_urls(),
         generator_url=url_for("generate_log_page"),
         form_values=values,
         error_message=error_message,
@@ -5484,14 +3197,45 @@ def render_generator_page(
         generated_filename=filename,
         replay_url=replay_url,
         decode_url=decode_url,
-        freq_options=EU868_FREQ_OPTIONS,
-        datarate_options=EU868_DATARATE_OPTIONS,
-        coding_rate_options=EU868_CODING_RATE_OPTIONS,
-        payload_examples=PAYLOAD_EXAMPLES,
+        freq_options_html=render_select_options(EU868_FREQ_OPTIONS_HTML, values.get("freq_mhz")),
+        datarate_options_html=render_select_options(EU868_DATARATE_OPTIONS_HTML, values.get("datarate")),
+        coding_rate_options_html=render_select_options(EU868_CODING_RATE_OPTIONS_HTML, values.get("coding_rate")),
+        payload_example_options_html=PAYLOAD_EXAMPLE_OPTIONS_HTML,
         **nav_context("files", logo_url),
     )
 
 
+DECODE_ROW_CELL_KEYS = ("index", "status", "devaddr", "fcnt", "fport", "time", "time_unix", "time_utc")
+
+
+def render_decode_tbody(rows, columns):
+    escape = escape_html
+    cell_keys = DECODE_ROW_CELL_KEYS
+    column_keys = [column["key"] for column in columns]
+    parts = []
+    append = parts.append
+    for row in rows:
+        get = row.get
+        payload_hex = get("payload_hex") or ""
+        flat = get("decoded_flat") or {}
+        cells = "".join([f"<td>{escape(get(key, ''))}</td>" for key in cell_keys])
+        decoded_cells = "".join([f"<td>{escape(flat.get(key, ''))}</td>" for key in column_keys])
+        append(
+            f"<tr class=\"{escape(get('css', ''))}\" data-index=\"{escape(get('index', ''))}\" "
+            f"data-status=\"{escape(get('status', ''))}\" data-devaddr=\"{escape(get('devaddr', ''))}\" "
+            f"data-fcnt=\"{escape(get('fcnt', ''))}\" data-fport=\"{escape(get('fport', ''))}\" "
+            f"data-time=\"{escape(get('time', ''))}\" data-time-unix=\"{escape(get('time_unix', ''))}\" "
+            f"data-time-utc=\"{escape(get('time_utc', ''))}\" data-payload=\"{escape(payload_hex)}\" "
+            f"data-decoded-pretty=\"{escape(get('decoded_preview', ''))}\">"
+            f"{cells}{decoded_cells}"
+            "<td><button type=\"button\" class=\"cell-action\" data-detail-trigger>"
+            f"Payload ({len(payload_hex) // 2} bytes)</button></td>"
+            "<td><button type=\"button\" class=\"cell-action\" data-detail-trigger>Decoded view</button></td>"
+            "</tr>"
+        )
+    return "".join(parts)
+
+
 def render_decode_page(
     scan_token,
     devaddrs,
@@ -5510,13 +3254,10 @@ def render_decode_page(
     export_csv_url = url_for("export_results", fmt="csv", token=export_token) if export_token else ""
     export_json_url = url_for("export_results", fmt="json", token=export_token) if export_token else ""
     analyze_url = url_for("analyze_results", token=export_token, scan_token=scan_token) if export_token else ""
-    logo_url = url_for("static", filename="company_logo.png")
-    return render_template_string(
+    logo_url = page_static_urls()["logo_url"]
+    return render_cached_template(
         DECODE_HTML,
-        style_block=STYLE_BLOCK,
-        script_block=SCRIPT_BLOCK,
-        logo_url=logo_url,
-        favicon_url=url_for("static", filename="favicon.ico"),
+        **page_static_urls(),
         decode_url=url_for("decode"),
         decode_progress_url=url_for("decode_progress"),
         keys_url=url_for("device_keys"),
@@ -5529,6 +3270,7 @@ def render_decode_page(
         decoders=decoders or [],
         selected_decoder=selected_decoder,
         decode_results=decode_results,
+        decode_tbody_html=render_decode_tbody(decode_results or [], decode_columns or []),
         decode_columns=decode_columns or [],
         selected_filename=selected_filename,
         export_csv_url=export_csv_url,
@@ -5553,13 +3295,10 @@ def render_device_keys_page(
     decode_url = url_for("decode")
     if scan_token:
         decode_url = f"{decode_url}?scan_token={scan_token}"
-    logo_url = url_for("static", filename="company_logo.png")
-    return render_template_string(
+    logo_url = page_static_urls()["logo_url"]
+    return render_cached_template(
         DEVICE_KEYS_HTML,
-        style_block=STYLE_BLOCK,
-        script_block=SCRIPT_BLOCK,
-        logo_url=logo_url,
-        favicon_url=url_for("static", filename="favicon.ico"),
+        **page_static_urls(),
         decode_url=decode_url,
         keys_url=url_for("device_keys"),
         summary_lines=summary_lines or [],
@@ -5612,13 +3351,10 @@ def login():
                 return redirect(url_for("index"))
             audit_log("login_failed", {"username": username, "reason": "invalid_credentials"})
             error_message = "Invalid username or password."
-    logo_url = url_for("static", filename="company_logo.png")
-    return render_template_string(
+    logo_url = page_static_urls()["logo_url"]
+    return render_cached_template(
         LOGIN_HTML,
-        style_block=STYLE_BLOCK,
-        script_block=SCRIPT_BLOCK,
-        logo_url=logo_url,
-        favicon_url=url_for("static", filename="favicon.ico"),
+        **page_static_urls(),
         login_url=url_for("login"),
         error_message=error_message,
         configured=configured,
@@ -5646,13 +3382,10 @@ def change_password():
             set_auth_password(current_user.id, new_password)
             audit_log("password_changed", {"username": current_user.id})
             return redirect(url_for("index"))
-    logo_url = url_for("static", filename="company_logo.png")
-    return render_template_string(
+    logo_url = page_static_urls()["logo_url"]
+    return render_cached_template(
         CHANGE_PASSWORD_HTML,
-        style_block=STYLE_BLOCK,
-        script_block=SCRIPT_BLOCK,
-        logo_url=logo_url,
-        favicon_url=url_for("static", filename="favicon.ico"),
+        **page_static_urls(),
         change_password_url=url_for("change_password"),
         error_message=error_message,
         success_message=success_message,
@@ -5690,7 +3423,7 @@ def users_page():
             users[username] = {
                 "password_hash": generate_password_hash(password),
                 "must_change": True,
-                "created_at": datetime.datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S UTC"),
+                "created_at": utc_now_text(),
             }
             save_users(users)
             audit_log("user_created", {"username": username})
@@ -5735,6 +3468,7 @@ def users_page():
     sorted_users = sorted(users.items(), key=lambda item: item[0].lower())
     user_rows = []
     for username, entry in sorted_users:
+        username_html = escape_html(username)
         must_change = "Yes" if entry.get("must_change") else "No"
         can_edit_admin = current_user.id == "admin"
         reset_disabled = username == "admin" and not can_edit_admin
@@ -5746,7 +3480,7 @@ def users_page():
                 f"<form method=\"POST\" action=\"{url_for('users_page')}\">"
                 f"{csrf_input}"
                 f"<input type=\"hidden\" name=\"action\" value=\"delete_user\">"
-                f"<input type=\"hidden\" name=\"username\" value=\"{html.escape(username)}\">"
+                f"<input type=\"hidden\" name=\"username\" value=\"{username_html}\">"
                 f"<button type=\"submit\" class=\"danger-button danger-text\">"
                 f"<span class=\"material-icons\" aria-hidden=\"true\">delete</span>"
                 f"<span>Remove</span></button>"
@@ -5758,7 +3492,7 @@ def users_page():
             f"<div class=\"key-grid user-grid\">"
             f"<div>"
             f"<label>Username</label>"
-            f"<div class=\"hint user-name\" data-user-name=\"{html.escape(username)}\">{html.escape(username)}</div>"
+            f"<div class=\"hint user-name\" data-user-name=\"{username_html}\">{username_html}</div>"
             f"</div>"
             f"<div>"
             f"<label>Must change password</label>"
@@ -5766,7 +3500,7 @@ def users_page():
             f"</div>"
             f"<div>"
             f"<div class=\"users-password-row\">"
-            f"<button type=\"button\" class=\"secondary-button\" data-password-reset=\"{html.escape(username)}\" "
+            f"<button type=\"button\" class=\"secondary-button\" data-password-reset=\"{username_html}\" "
             f"{'disabled' if reset_disabled else ''}>Change password</button>"
             f"</div>"
             f"</div>"
@@ -5778,7 +3512,7 @@ def users_page():
 
     result_html = ""
     if summary_lines:
-        summary_items = "".join(f"<div>{html.escape(line)}</div>" for line in summary_lines)
+        summary_items = "".join(f"<div>{escape_html(line)}</div>" for line in summary_lines)
         result_html = f"<div class=\"result {result_class}\">{summary_items}</div>"
 
     body_html = f"""
@@ -5882,9 +3616,9 @@ def files_page():
     if stored_logs:
         items = []
         for log in stored_logs:
-            log_id = html.escape(log["id"])
-            filename = html.escape(log["filename"])
-            uploaded_at = html.escape(log["uploaded_at"])
+            log_id = escape_html(log["id"])
+            filename = escape_html(log["filename"])
+            uploaded_at = escape_html(log["uploaded_at"])
             view_url = url_for("view_log_file", log_id=log["id"])
             download_url = url_for("download_log_file", log_id=log["id"])
             decode_url = url_for("start_decode_from_file", log_id=log["id"])
@@ -5894,8 +3628,8 @@ def files_page():
             if saved_entries:
                 saved_items = []
                 for saved in saved_entries:
-                    created_at = html.escape(saved.get("created_at", ""))
-                    decoder_id = html.escape(saved.get("decoder_id", ""))
+                    created_at = escape_html(saved.get("created_at", ""))
+                    decoder_id = escape_html(saved.get("decoder_id", ""))
                     decoder_meta = f"<span class=\"decoder-meta\">{decoder_id}</span>" if decoder_id else ""
                     analyze_url = url_for("analyze_results", saved_id=saved.get("id", ""))
                     export_csv_url = url_for("export_saved_results", fmt="csv", saved_id=saved.get("id", ""))
@@ -5971,14 +3705,14 @@ def files_page():
         <div class="logfile-option">
           <h3>Upload a log file</h3>
           <div class="hint">Upload a new JSONL log and scan it right away.</div>
-          <form method="POST" action="{url_for('scan')}" enctype="multipart/form-data" data-scan-url="{url_for('scan')}">
+          <form method="POST" action="{url_for('scan')}" enctype="multipart/form-data" data-scan-url="{url_for('scan')}" data-upload-url="{url_for('upload_log_stream')}">
             {csrf_input}
             <input id="logfile" type="file" name="logfile" style="display: none;" aria-hidden="true">
             <input type="hidden" name="redirect_to" value="files">
-            <div class="file-drop" data-file-drop>
+            <div id="file_drop" class="file-drop" data-file-drop>
               <div class="file-text">
                 <strong>Click to choose or drag & drop</strong>
-                <div class="file-selected" data-file-selected>No file selected</div>
+                <div id="file_selected" class="file-selected" data-file-selected>No file selected</div>
               </div>
             </div>
           </form>
@@ -6006,7 +3740,6 @@ def decoders_page():
     summary_lines = []
     result_class = "success"
     action = request.form.get("action", "").strip()
-    csrf_input = get_csrf_input()
     uploads_enabled = DECODER_UPLOADS_ENABLED
     file_execution_enabled = DECODER_FILE_EXECUTION_ENABLED
     if request.method == "POST" and action == "upload_decoder":
@@ -6024,7 +3757,7 @@ def decoders_page():
                     summary_lines = ["Please choose a decoder file to upload."]
                     result_class = "error"
                 else:
-                    filename = secure_filename(decoder_file.filename)
+                    filename = safe_filename(decoder_file.filename)
                     if not filename.lower().endswith(".js"):
                         summary_lines = ["Decoder file must be a .js file."]
                         result_class = "error"
@@ -6063,141 +3796,27 @@ def decoders_page():
                         summary_lines = ["Decoder file not found."]
                         result_class = "error"
 
-    decoders = list_decoders()
-    if decoders:
-        items = []
-        for decoder in decoders:
-            label = html.escape(decoder["label"])
-            source = html.escape(decoder["source"])
-            decoder_id = html.escape(decoder["id"])
-            view_url = url_for("view_decoder", decoder_id=decoder["id"])
-            actions_html = ""
-            if decoder["id"] == "raw":
-                actions_html = ""
-            else:
-                delete_button = ""
-                if decoder["id"].startswith("file:") and uploads_enabled:
-                    delete_button = (
-                        f"<button type=\"button\" class=\"danger-button danger-text\" "
-                        f"data-delete-decoder=\"{decoder_id}\" "
-                        f"title=\"Remove decoder\" aria-label=\"Remove decoder\">"
-                        f"<span class=\"material-icons\" aria-hidden=\"true\">delete</span>"
-                        f"<span>Remove</span></button>"
-                    )
-                actions_html = (
-                    f"<div class=\"decoder-actions\">"
-                    f"<a class=\"secondary-button\" href=\"{view_url}\">"
-                    f"<span class=\"material-icons\" aria-hidden=\"true\">visibility</span>View</a>"
-                    f"{delete_button}"
-                    f"</div>"
-                )
-            if decoder["id"] == "raw":
-                name_html = f"<span class=\"decoder-link\">{label}</span>"
-            else:
-                name_html = f"<a class=\"decoder-link\" href=\"{view_url}\">{label}</a>"
-            items.append(
-                f"<li class=\"decoder-item\">"
-                f"<div>"
-                f"{name_html}"
-                f"<span class=\"decoder-meta\">({source})</span>"
-                f"</div>"
-                f"{actions_html}"
-                f"</li>"
-            )
-        decoder_html = f"<ul class=\"decoder-list\">{''.join(items)}</ul>"
-    else:
-        decoder_html = "<div class=\"hint\">No decoders available yet.</div>"
-
-    result_html = ""
-    if summary_lines:
-        summary_items = "".join(f"<div>{html.escape(line)}</div>" for line in summary_lines)
-        result_html = f"<div class=\"result {result_class}\">{summary_items}</div>"
-
-    decoder_notice = ""
-    if not file_execution_enabled:
-        decoder_notice = "<div class=\"hint\">Uploaded decoders are disabled for this deployment.</div>"
-    upload_section = ""
-    if uploads_enabled:
-        upload_section = f"""
-      <div class="section-divider"></div>
-      <form method="POST" action="{url_for('decoders_page')}" enctype="multipart/form-data">
-        {csrf_input}
-        <input type="hidden" name="action" value="upload_decoder">
-        <div class="field-group">
-          <div class="field-header">
-            <label for="decoder_file">Add a decoder</label>
-          </div>
-          <input id="decoder_file" name="decoder_file" type="file" accept=".js">
-          <div class="hint">JS decoders should define <code>Decoder(bytes, port)</code> or <code>decodeUplink({{ bytes, fPort }})</code>.</div>
-        </div>
-        <div class="form-actions">
-          <button type="submit" class="primary-button"><span class="material-icons" aria-hidden="true">upload</span>Upload decoder</button>
-        </div>
-      </form>
-        """
-    else:
-        upload_section = "<div class=\"section-divider\"></div><div class=\"hint\">Decoder uploads are disabled for this deployment.</div>"
-
-    body_html = f"""
-      {result_html}
-      <form method="POST" action="{url_for('decoders_page')}" data-decoder-delete-form>
-        {csrf_input}
-        <input type="hidden" name="action" value="delete_decoder">
-        <input type="hidden" name="delete_decoder_id" value="" data-decoder-delete-input>
-      </form>
-      <div class="field-group">
-        <div class="field-header">
-          <label>Available decoders</label>
-        </div>
-        <div class="hint">Click a decoder to review its JavaScript.</div>
-        {decoder_notice}
-        {decoder_html}
-      </div>
-      {upload_section}
-    """
     return render_simple_page(
         title="Decoders",
         subtitle="Upload and select payload decoders for log files.",
-        body_html=body_html,
         active_page="decoders",
+        template=DECODERS_PAGE_HTML,
+        decoders=list_decoders(),
+        view_decoder_url=url_for("view_decoder"),
+        summary_lines=summary_lines,
+        result_class=result_class,
+        uploads_enabled=uploads_enabled,
+        file_execution_enabled=file_execution_enabled,
     )
 
 
 @app.route("/integrations", methods=["GET"])
 @login_required
 def integrations_page():
-    body_html = f"""
-      <div class="logfile-options">
-        <div class="logfile-option integration-block">
-          <h3>EarthRanger (HTTP)</h3>
-          <div class="hint">Send decoded uplinks to EarthRanger via HTTP integration.</div>
-          <div class="option-actions">
-            <button type="button" class="secondary-button"><span class="material-icons" aria-hidden="true">add</span>Add integration</button>
-            <button type="button" class="secondary-button"><span class="material-icons" aria-hidden="true">settings</span>Manage</button>
-          </div>
-        </div>
-        <div class="logfile-option integration-block">
-          <h3>InfluxDB</h3>
-          <div class="hint">Stream decoded uplinks into an InfluxDB bucket.</div>
-          <div class="option-actions">
-            <button type="button" class="secondary-button"><span class="material-icons" aria-hidden="true">add</span>Add integration</button>
-            <button type="button" class="secondary-button"><span class="material-icons" aria-hidden="true">settings</span>Manage</button>
-          </div>
-        </div>
-        <div class="logfile-option integration-block">
-          <h3>MQTT</h3>
-          <div class="hint">Publish decoded uplinks to an MQTT broker.</div>
-          <div class="option-actions">
-            <button type="button" class="secondary-button"><span class="material-icons" aria-hidden="true">add</span>Add integration</button>
-            <button type="button" class="secondary-button"><span class="material-icons" aria-hidden="true">settings</span>Manage</button>
-          </div>
-        </div>
-      </div>
-    """
     return render_simple_page(
         title="Integrations",
         subtitle="Connect log playback to external tools and services.",
-        body_html=body_html,
+        body_html=render_static_fragment(INTEGRATIONS_PAGE_HTML, request.script_root),
         active_page="integrations",
     )
 
@@ -6220,7 +3839,7 @@ def view_decoder():
         return render_simple_page(
             title="Decoder Viewer",
             subtitle="Unable to load decoder.",
-            body_html=f"<div class=\"result error\">{html.escape(str(exc))}</div>",
+            body_html=f"<div class=\"result error\">{escape_html(str(exc))}</div>",
             active_page="decoders",
             page_title="Decoder Viewer",
         )
@@ -6234,30 +3853,24 @@ def view_decoder():
         )
     with open(path, "r", encoding="utf-8") as handle:
         content = handle.read()
-    body_html = f"""
-      <div class="field-group">
-        <div class="field-header">
-          <label>{html.escape(os.path.basename(path))}</label>
-        </div>
-        <pre class="code-block">{html.escape(content)}</pre>
-      </div>
-      <div class="form-actions">
-        <a class="secondary-button" href="{url_for('decoders_page')}"><span class="material-icons" aria-hidden="true">arrow_back</span>Back to Decoders</a>
-      </div>
-    """
     return render_simple_page(
         title="Decoder Viewer",
         subtitle="Review the decoder JavaScript before using it.",
-        body_html=body_html,
         active_page="decoders",
         page_title="Decoder Viewer",
+        template=FILE_VIEWER_HTML,
+        file_label=os.path.basename(path),
+        content=content,
+        list_url=url_for("decoders_page"),
+        list_label="Back to Decoders",
     )
 
 
 @app.route("/files/view", methods=["GET"])
 @login_required
 def view_log_file():
-    log_id = request.args.get("log_id", "").strip()
+    args = request.args
+    log_id = args.get("log_id", "").strip()
     entry = get_stored_log_entry(log_id) if log_id else None
     if not entry:
         return render_simple_page(
@@ -6269,33 +3882,28 @@ def view_log_file():
         )
     audit_log("log_viewed", {"log_id": entry.get("id"), "filename": entry.get("filename")})
     path = entry["path"]
+    if args.get("raw") == "1":
+        return send_file(path, mimetype="text/plain", conditional=True)
     max_bytes = 200000
-    with open(path, "rb") as handle:
-        content_bytes = handle.read(max_bytes + 1)
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        content_bytes = os.read(fd, max_bytes + 1)
+    finally:
+        os.close(fd)
     truncated = len(content_bytes) > max_bytes
-    content_bytes = content_bytes[:max_bytes]
-    content = content_bytes.decode("utf-8", errors="replace")
-    note = ""
-    if truncated:
-        note = "<div class=\"hint\">Preview truncated to 200 KB.</div>"
-    body_html = f"""
-      <div class="field-group">
-        <div class="field-header">
-          <label>{html.escape(entry["filename"])}</label>
-        </div>
-        {note}
-        <pre class="code-block">{html.escape(content)}</pre>
-      </div>
-      <div class="form-actions">
-        <a class="secondary-button" href="{url_for('files_page')}"><span class="material-icons" aria-hidden="true">arrow_back</span>Back to Files</a>
-      </div>
-    """
+    content = content_bytes[:max_bytes].decode("utf-8", errors="replace")
     return render_simple_page(
         title="Log File Viewer",
         subtitle="Review the stored log file content.",
-        body_html=body_html,
         active_page="files",
         page_title="Log File Viewer",
+        template=FILE_VIEWER_HTML,
+        file_label=entry["filename"],
+        truncated_note="Preview truncated to 200 KB." if truncated else "",
+        full_url=url_for("view_log_file", log_id=entry["id"], raw=1) if truncated else "",
+        content=content,
+        list_url=url_for("files_page"),
+        list_label="Back to Files",
     )
 
 
@@ -6307,7 +3915,21 @@ def download_log_file():
     if not entry or not os.path.exists(entry["path"]):
         return "Log file not found.", 404
     audit_log("log_downloaded", {"log_id": entry.get("id"), "filename": entry.get("filename")})
-    return send_file(entry["path"], as_attachment=True, download_name=entry["filename"])
+    if X_ACCEL_REDIRECT_PREFIX:
+        response = app.response_class(mimetype="application/octet-stream")
+        response.headers["X-Accel-Redirect"] = X_ACCEL_REDIRECT_PREFIX + urllib.parse.quote_from_bytes(
+            os.path.basename(entry["path"]).encode("utf-8")
+        )
+        response.headers.set("Content-Disposition", "attachment", filename=entry["filename"])
+        return response
+    return send_file(
+        entry["path"],
+        mimetype="application/octet-stream",
+        as_attachment=True,
+        download_name=entry["filename"],
+        conditional=True,
+        etag=True,
+    )
 
 
 @app.route("/files/delete", methods=["POST"])
@@ -6328,7 +3950,7 @@ def start_decode_from_file():
     try:
         scan_token, _entry = scan_stored_log(log_id)
     except ValueError as exc:
-        body_html = f"<div class=\"result error\">{html.escape(str(exc))}</div>"
+        body_html = f"<div class=\"result error\">{escape_html(str(exc))}</div>"
         return render_simple_page(
             title="Files",
             subtitle="Review stored log files and generate samples.",
@@ -6347,7 +3969,7 @@ def start_replay_from_file():
     try:
         scan_token, _entry = scan_stored_log(log_id)
     except ValueError as exc:
-        body_html = f"<div class=\"result error\">{html.escape(str(exc))}</div>"
+        body_html = f"<div class=\"result error\">{escape_html(str(exc))}</div>"
         return render_simple_page(
             title="Files",
             subtitle="Review stored log files and generate samples.",
@@ -6359,35 +3981,55 @@ def start_replay_from_file():
     return redirect(url_for("replay", scan_token=scan_token))
 
 
+def build_rxpk_preview(rxpk, limit=100):
+    if not isinstance(rxpk, dict):
+        text = str(rxpk) if rxpk is not None else ""
+    else:
+        data = rxpk.get("data")
+        if isinstance(data, str) and len(data) > 60:
+            rxpk = {**rxpk, "data": data[:60] + "..."}
+        try:
+            text = json_dumps(rxpk).decode("utf-8")
+        except Exception:
+            text = str(rxpk)
+    return text[:limit] + "..." if len(text) > limit else text
+
+
 def run_replay_job(token, parsed, host, port, delay_ms, start_index=0, sent=0, errors=0):
+    entry = get_replay_job(token)
+    if not entry:
+        return
+    with entry["lock"]:
+        override_rxpk = entry.get("override_rxpk")
     sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
     total = len(parsed)
+    try:
+        sock.connect((host, port))
+        send_packet = sock.send
+    except OSError:
+        def send_packet(packet):
+            return sock.sendto(packet, (host, port))
 
     try:
-        for idx, rec in enumerate(parsed[start_index:], start=start_index + 1):
-            entry = get_replay_job(token)
-            if not entry or entry.get("status") != "running":
+        for idx, (gateway_eui, rxpk, phy) in enumerate(parsed.iter_frames(start_index), start=start_index + 1):
+            with entry["lock"]:
+                running = entry["status"] == "running"
+            if not running:
                 break
-            gateway_eui = rec["gateway_eui"]
-            rxpk = rec["rxpk"]
-            if entry.get("override_rxpk"):
+            if override_rxpk:
                 # Copy so we do not mutate cached scan data.
                 rxpk = {**rxpk, **REPLAY_RXPK_OVERRIDES}
             send_attempted = False
+            try:
+                fcnt = parse_uplink(rxpk, phy)["fcnt"]
+            except Exception:
+                fcnt = ""
 
             try:
                 packet = build_push_data(gateway_eui, rxpk)
             except Exception as exc:
                 errors += 1
-                try:
-                    rxpk_serialized = json.dumps(rxpk)
-                except Exception:
-                    rxpk_serialized = str(rxpk) if rxpk is not None else ""
-                rxpk_preview = rxpk_serialized[:100] + "..." if len(rxpk_serialized) > 100 else rxpk_serialized
-                try:
-                    fcnt = parse_uplink(rxpk)["fcnt"]
-                except Exception:
-                    fcnt = ""
+                rxpk_preview = build_rxpk_preview(rxpk)
                 append_replay_log(
                     token,
                     {
@@ -6401,21 +4043,20 @@ def run_replay_job(token, parsed, host, port, delay_ms, start_index=0, sent=0, e
                         "message": f"Build error: {exc} -- {rxpk_preview}",
                         "css": "err",
                     },
+                    current_index=idx,
                     sent=sent,
                     errors=errors,
                 )
-                update_replay_job(token, current_index=idx, sent=sent, errors=errors)
                 continue
 
             try:
-                sock.sendto(packet, (host, port))
+                try:
+                    send_packet(packet)
+                except ConnectionRefusedError:
+                    send_packet(packet)
                 send_attempted = True
                 sent += 1
                 send_time_ms = int(time.time() * 1000)
-                try:
-                    fcnt = parse_uplink(rxpk)["fcnt"]
-                except Exception:
-                    fcnt = ""
                 freq = rxpk.get("freq", "?")
                 size = rxpk.get("size", len(packet))
                 datr = rxpk.get("datr", "?")
@@ -6440,6 +4081,7 @@ def run_replay_job(token, parsed, host, port, delay_ms, start_index=0, sent=0, e
                         ),
                         "css": "ok",
                     },
+                    current_index=idx,
                     sent=sent,
                     errors=errors,
                 )
@@ -6447,15 +4089,7 @@ def run_replay_job(token, parsed, host, port, delay_ms, start_index=0, sent=0, e
                 send_attempted = True
                 errors += 1
                 send_time_ms = int(time.time() * 1000)
-                try:
-                    rxpk_serialized = json.dumps(rxpk)
-                except Exception:
-                    rxpk_serialized = str(rxpk) if rxpk is not None else ""
-                rxpk_preview = rxpk_serialized[:100] + "..." if len(rxpk_serialized) > 100 else rxpk_serialized
-                try:
-                    fcnt = parse_uplink(rxpk)["fcnt"]
-                except Exception:
-                    fcnt = ""
+                rxpk_preview = build_rxpk_preview(rxpk)
                 append_replay_log(
                     token,
                     {
@@ -6469,20 +4103,22 @@ def run_replay_job(token, parsed, host, port, delay_ms, start_index=0, sent=0, e
                         "message": f"Send error: {exc} -- {rxpk_preview}",
                         "css": "err",
                     },
+                    current_index=idx,
                     sent=sent,
                     errors=errors,
                 )
 
             if send_attempted and delay_ms > 0 and idx < total:
                 time.sleep(delay_ms / 1000.0)
-            update_replay_job(token, current_index=idx, sent=sent, errors=errors)
     finally:
         sock.close()
-        entry = get_replay_job(token)
-        status = entry.get("status") if entry else "done"
-        if status == "running":
-            status = "done"
-        update_replay_job(token, status=status, sent=sent, errors=errors)
+        with entry["lock"]:
+            if entry["status"] == "running":
+                entry["status"] = "done"
+            entry["sent"] = sent
+            entry["errors"] = errors
+            entry["ts"] = time.monotonic()
+            entry["lock"].notify_all()
 
 
 @app.route("/files/scan", methods=["GET"])
@@ -6492,7 +4128,7 @@ def start_scan_from_file():
     try:
         scan_token, _entry = scan_stored_log(log_id)
     except ValueError as exc:
-        body_html = f"<div class=\"result error\">{html.escape(str(exc))}</div>"
+        body_html = f"<div class=\"result error\">{escape_html(str(exc))}</div>"
         return render_simple_page(
             title="Files",
             subtitle="Review stored log files and generate samples.",
@@ -6507,36 +4143,40 @@ def start_scan_from_file():
 @app.route("/about", methods=["GET"])
 @login_required
 def about_page():
-    logo_url = url_for("static", filename="company_logo.png")
-    body_html = f"""
-      <div class="logfile-options">
-        <div class="logfile-option">
-          <h3>About Smart Parks</h3>
-          <div style="display: flex; align-items: center; gap: 0.8rem; margin: 0.6rem 0;">
-            <img src="{logo_url}" alt="Smart Parks logo" style="width: 52px; height: auto;">
-            <div class="hint">Protect Wildlife with Passion and Technology.</div>
-          </div>
-          <div class="hint">Smart Parks is a conservation technology organization focused on protecting wildlife and empowering rangers with resilient field tools.</div>
-          <div class="hint">Their solutions combine on-animal sensors, ranger communications, and real-time monitoring to support anti-poaching and animal welfare across protected areas.</div>
-          <div class="option-actions">
-            <a class="secondary-button" href="https://www.smartparks.org" target="_blank" rel="noopener"><span class="material-icons" aria-hidden="true">open_in_new</span>www.smartparks.org</a>
-          </div>
-        </div>
-        <div class="logfile-option">
-          <h3>About the App</h3>
-          <div class="hint">OpenCollar LP0 Replay tool helps replay, decrypt, and decode LoRaWAN uplinks captured as Semtech UDP JSONL logs.</div>
-          <div class="hint">Use it to validate uplink pipelines, tune forwarders, and inspect payloads during field tests.</div>
-        </div>
-      </div>
-    """
     return render_simple_page(
         title="About",
         subtitle="Product info and organization details.",
-        body_html=body_html,
+        body_html=render_static_fragment(ABOUT_PAGE_HTML, request.script_root),
         active_page="about",
     )
 
 
+@app.route("/api/uploads", methods=["PUT"])
+@login_required
+def upload_log_stream():
+    user_id = get_user_id()
+    allowed, retry_after = check_rate_limit("upload", user_id)
+    if not allowed:
+        response = json_response({"error": f"Rate limit exceeded. Try again in {retry_after} seconds."}, 429)
+        response.headers["Retry-After"] = str(retry_after)
+        return response
+    filename = urllib.parse.unquote(request.headers.get("X-Filename", "")).strip()
+    if not filename:
+        return json_response({"error": "Missing X-Filename header."}, 400)
+    ok, message = check_user_log_quota(user_id, new_bytes=request.content_length)
+    if not ok:
+        return json_response({"error": message}, 400)
+    entry = store_uploaded_stream(request.stream, filename, user_id)
+    audit_log(
+        "log_uploaded",
+        {"log_id": entry["id"], "filename": entry["filename"], "size": entry.get("size", 0)},
+    )
+    ok, message = enforce_user_log_quota_after_store(user_id, entry)
+    if not ok:
+        return json_response({"error": message}, 400)
+    return json_response({"log_id": entry["id"], "filename": entry["filename"], "size": entry.get("size", 0)})
+
+
 @app.route("/scan", methods=["POST"])
 @login_required
 def scan():
@@ -6656,34 +4296,90 @@ def scan():
     )
 
 
+def build_replay_status(entry, since=0):
+    count = entry["log_count"]
+    new_count = min(max(count - max(since, 0), 0), len(entry["log_lines"]))
+    lines = list(itertools.islice(reversed(entry["log_lines"]), new_count))[::-1]
+    html_rows = list(itertools.islice(reversed(entry["log_html"]), new_count))[::-1]
+    return {
+        "status": entry["status"],
+        "total": entry["total"],
+        "sent": entry["sent"],
+        "errors": entry["errors"],
+        "host": entry["host"],
+        "port": entry["port"],
+        "delay_ms": entry["delay_ms"],
+        "lines": lines,
+        "html": "".join(html_rows),
+        "count": count,
+    }
+
+
 @app.route("/replay/status", methods=["GET"])
 @login_required
 def replay_status():
-    token = request.args.get("token", "").strip()
+    args = request.args
+    token = args.get("token", "").strip()
     if not token:
-        return jsonify({"error": "missing_token"}), 400
+        return json_response({"error": "missing_token"}, 400)
     entry = get_replay_job(token)
     if not entry:
-        return jsonify({"error": "not_found"}), 404
-    since_raw = request.args.get("since", "0").strip()
+        return json_response({"error": "not_found"}, 404)
+    since_raw = args.get("since", "0").strip()
     try:
         since = int(since_raw)
     except ValueError:
         since = 0
-    with REPLAY_LOCK:
-        lines = entry["log_lines"][since:]
-        payload = {
-            "status": entry["status"],
-            "total": entry["total"],
-            "sent": entry["sent"],
-            "errors": entry["errors"],
-            "host": entry["host"],
-            "port": entry["port"],
-            "delay_ms": entry["delay_ms"],
-            "lines": lines,
-            "count": len(entry["log_lines"]),
-        }
-    return jsonify(payload)
+    with entry["lock"]:
+        payload = build_replay_status(entry, since)
+    return json_response(payload, conditional=True)
+
+
+@app.route("/replay/events", methods=["GET"])
+@login_required
+def replay_events():
+    args = request.args
+    token = args.get("token", "").strip()
+    if not token:
+        return json_response({"error": "missing_token"}, 400)
+    entry = get_replay_job(token)
+    if not entry:
+        return json_response({"error": "not_found"}, 404)
+    since_raw = request.headers.get("Last-Event-ID") or args.get("since", "0")
+    try:
+        since = int(since_raw.strip())
+    except ValueError:
+        since = 0
+
+    def stream():
+        count = since
+        deadline = time.monotonic() + REPLAY_EVENTS_MAX_SECONDS
+        last_state = None
+        while True:
+            with entry["lock"]:
+                state = (entry["log_count"], entry["status"], entry["sent"], entry["errors"])
+                if state == last_state and entry["status"] == "running":
+                    entry["lock"].wait(timeout=REPLAY_EVENTS_KEEPALIVE_SECONDS)
+                    state = (entry["log_count"], entry["status"], entry["sent"], entry["errors"])
+                payload = build_replay_status(entry, count) if state != last_state else None
+            if payload is None:
+                yield ": keepalive\n\n"
+            else:
+                last_state = state
+                count = payload["count"]
+                yield f"id: {count}\ndata: {json_dumps(payload).decode('utf-8')}\n\n"
+                if payload["status"] != "running":
+                    return
+            if time.monotonic() > deadline:
+                return
+
+    if REPLAY_EVENTS_MAX_STREAMS <= 0 or not REPLAY_EVENTS_SLOTS.acquire(blocking=False):
+        return json_response({"error": "too_many_streams"}, 503)
+    response = app.response_class(stream(), mimetype="text/event-stream")
+    response.call_on_close(REPLAY_EVENTS_SLOTS.release)
+    response.headers["Cache-Control"] = "no-cache"
+    response.headers["X-Accel-Buffering"] = "no"
+    return response
 
 
 @app.route("/replay/stop", methods=["POST"])
@@ -6727,14 +4423,15 @@ def replay_resume():
         return redirect(url_for("replay", scan_token=scan_token))
 
     parsed, _gateways, _devaddrs, _selected_filename, _stored_log_id = cached
-    start_index = min(int(entry.get("current_index", 0)), len(parsed))
-    host = entry.get("host", "127.0.0.1")
-    port = int(entry.get("port", 1700))
-    delay_ms = int(entry.get("delay_ms", 500))
-    override_rxpk = bool(entry.get("override_rxpk", False))
-    sent = int(entry.get("sent", 0))
-    errors = int(entry.get("errors", 0))
-    log_lines = list(entry.get("log_lines", []))
+    with entry["lock"]:
+        start_index = min(int(entry.get("current_index", 0)), len(parsed))
+        host = entry.get("host", "127.0.0.1")
+        port = int(entry.get("port", 1700))
+        delay_ms = int(entry.get("delay_ms", 500))
+        override_rxpk = bool(entry.get("override_rxpk", False))
+        sent = int(entry.get("sent", 0))
+        errors = int(entry.get("errors", 0))
+        log_lines = list(entry.get("log_lines", []))
 
     job_token = store_replay_job(
         len(parsed),
@@ -6993,7 +4690,7 @@ def decode():
                                 export_token=export_token,
                                 back_url=back_url,
                             )
-                    entry["updated_at"] = datetime.datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S UTC")
+                    entry["updated_at"] = utc_now_text()
                     credentials[devaddr] = entry
                     save_credentials(credentials)
                     summary_lines = [f"Device {devaddr} saved."]
@@ -7066,7 +4763,7 @@ def decode():
                     summary_lines = ["Please choose a decoder file to upload."]
                     result_class = "error"
                 else:
-                    filename = secure_filename(decoder_file.filename)
+                    filename = safe_filename(decoder_file.filename)
                     if not filename.lower().endswith(".js"):
                         summary_lines = ["Decoder file must be a .js file."]
                         result_class = "error"
@@ -7106,9 +4803,7 @@ def decode():
                 errors = 0
                 total_items = len(parsed)
                 set_decode_progress(progress_id, user_id, 0, total_items, done=False)
-                for idx, rec in enumerate(parsed, start=1):
-                    rxpk = rec["rxpk"]
-                    gateway_eui = rec["gateway_eui"]
+                for idx, (gateway_eui, rxpk, phy) in enumerate(parsed.iter_frames(), start=1):
                     time_str = rxpk.get("time", "")
                     freq = rxpk.get("freq", "")
                     devaddr = ""
@@ -7116,7 +4811,7 @@ def decode():
                     fport = ""
 
                     try:
-                        uplink = parse_uplink(rxpk)
+                        uplink = parse_uplink(rxpk, phy)
                         devaddr = uplink["devaddr"]
                         fcnt = uplink["fcnt"]
                         fport = uplink["fport"] if uplink["fport"] is not None else ""
@@ -7155,7 +4850,7 @@ def decode():
                                             decoded_data = decoded_raw.get("data")
                                         else:
                                             decoded_data = decoded_raw
-                                    decoded_preview = json.dumps(decoded_data, ensure_ascii=True)
+                                    decoded_preview = json.dumps(decoded_data, ensure_ascii=True, indent=2)
                                     ok += 1
                                 except Exception as exc:
                                     status = "Error"
@@ -7204,7 +4899,7 @@ def decode():
                                 decoded_data = decoded_raw.get("data")
                             else:
                                 decoded_data = decoded_raw
-                            decoded_preview = json.dumps(decoded_data, ensure_ascii=True)
+                            decoded_preview = json.dumps(decoded_data, ensure_ascii=True, indent=2)
                             decoded_flat = flatten_decoded(decoded_data)
                             for key in decoded_flat.keys():
                                 if key not in seen_columns:
@@ -7306,23 +5001,25 @@ def decode_progress():
     user_id = get_user_id()
     progress_id = request.args.get("progress_id", "").strip()
     if not progress_id:
-        return jsonify({"error": "missing_progress_id"}), 400
+        return json_response({"error": "missing_progress_id"}, 400)
     entry = get_decode_progress(progress_id, user_id)
     if not entry:
-        return jsonify({"error": "not_found"}), 404
-    return jsonify(
+        return json_response({"error": "not_found"}, 404)
+    return json_response(
         {
             "completed": entry.get("completed", 0),
             "total": entry.get("total", 0),
             "done": entry.get("done", False),
-        }
+        },
+        conditional=True,
     )
 
 
 @app.route("/devices", methods=["GET", "POST"])
 @login_required
 def device_keys():
-    scan_token = request.form.get("scan_token") or request.args.get("scan_token", "")
+    args = request.args
+    scan_token = request.form.get("scan_token") or args.get("scan_token", "")
     scan_token = scan_token.strip()
     back_url = resolve_back_url(url_for("index"))
     credentials = load_credentials()
@@ -7331,7 +5028,7 @@ def device_keys():
     scan_summary_lines = []
     scan_filename = ""
 
-    if request.args.get("show_scan") and scan_token:
+    if args.get("show_scan") and scan_token:
         cached = get_scan_result(scan_token)
         if cached:
             parsed, gateways, devaddrs, scan_filename, _stored_log_id = cached
@@ -7370,10 +5067,16 @@ def device_keys():
     if action == "save_keys":
         updated = 0
         errors = []
+        form_updates = {}
+        for key, value in request.form.items():
+            field, _, devaddr = key.partition("_")
+            if field in ("name", "nwk", "app") and devaddr:
+                form_updates.setdefault(devaddr, {})[field] = value.strip()
         for devaddr in list(credentials.keys()):
-            name_val = request.form.get(f"name_{devaddr}", "").strip()
-            nwk_val = request.form.get(f"nwk_{devaddr}", "").strip()
-            app_val = request.form.get(f"app_{devaddr}", "").strip()
+            fields = form_updates.get(devaddr, {})
+            name_val = fields.get("name", "")
+            nwk_val = fields.get("nwk", "")
+            app_val = fields.get("app", "")
             entry = credentials.get(devaddr, {})
             if name_val:
                 entry["name"] = name_val
@@ -7386,7 +5089,7 @@ def device_keys():
                         entry["app_skey"] = normalize_skey(app_val, f"AppSKey for {devaddr}")
                     except ValueError as exc:
                         errors.append(str(exc))
-            entry["updated_at"] = datetime.datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S UTC")
+            entry["updated_at"] = utc_now_text()
             credentials[devaddr] = entry
             updated += 1
         if errors:
@@ -7433,7 +5136,7 @@ def device_keys():
                                 scan_token=scan_token,
                                 back_url=back_url,
                             )
-                    entry["updated_at"] = datetime.datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S UTC")
+                    entry["updated_at"] = utc_now_text()
                     credentials[devaddr] = entry
                     save_credentials(credentials)
                     summary_lines = [f"Device {devaddr} saved."]
@@ -7495,6 +5198,29 @@ def build_export_rows(rows):
     return export_rows
 
 
+CSV_CHUNK_SIZE = 64 * 1024
+
+
+def iter_csv_chunks(export_rows):
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=list(export_rows[0].keys()))
+    writer.writeheader()
+    for export_row in export_rows:
+        writer.writerow(export_row)
+        if buffer.tell() >= CSV_CHUNK_SIZE:
+            yield buffer.getvalue().encode("utf-8")
+            buffer.seek(0)
+            buffer.truncate(0)
+    if buffer.tell():
+        yield buffer.getvalue().encode("utf-8")
+
+
+def csv_download_response(export_rows, download_name):
+    response = app.response_class(iter_csv_chunks(export_rows), mimetype="text/csv")
+    response.headers.set("Content-Disposition", "attachment", filename=download_name)
+    return response
+
+
 @app.route("/export/<fmt>", methods=["GET"])
 @login_required
 def export_results(fmt):
@@ -7508,19 +5234,12 @@ def export_results(fmt):
         return "No export data available.", 404
 
     if fmt == "json":
-        buffer = io.BytesIO(json.dumps(export_rows, indent=2).encode("utf-8"))
+        buffer = io.BytesIO(json_dumps(export_rows, indent=True))
         buffer.seek(0)
         return send_file(buffer, mimetype="application/json", as_attachment=True, download_name="decoded_payloads.json")
 
     if fmt == "csv":
-        buffer = io.StringIO()
-        fieldnames = list(export_rows[0].keys())
-        writer = csv.DictWriter(buffer, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(export_rows)
-        csv_bytes = io.BytesIO(buffer.getvalue().encode("utf-8"))
-        csv_bytes.seek(0)
-        return send_file(csv_bytes, mimetype="text/csv", as_attachment=True, download_name="decoded_payloads.csv")
+        return csv_download_response(export_rows, "decoded_payloads.csv")
 
     return "Unsupported export format.", 400
 
@@ -7537,9 +5256,9 @@ def export_saved_results(fmt):
     if not export_rows:
         return "No export data available.", 404
 
-    base_name = secure_filename(entry.get("filename") or "decoded_payloads") or "decoded_payloads"
+    base_name = safe_filename(entry.get("filename") or "decoded_payloads") or "decoded_payloads"
     if fmt == "json":
-        buffer = io.BytesIO(json.dumps(export_rows, indent=2).encode("utf-8"))
+        buffer = io.BytesIO(json_dumps(export_rows, indent=True))
         buffer.seek(0)
         return send_file(
             buffer,
@@ -7549,19 +5268,7 @@ def export_saved_results(fmt):
         )
 
     if fmt == "csv":
-        buffer = io.StringIO()
-        fieldnames = list(export_rows[0].keys())
-        writer = csv.DictWriter(buffer, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(export_rows)
-        csv_bytes = io.BytesIO(buffer.getvalue().encode("utf-8"))
-        csv_bytes.seek(0)
-        return send_file(
-            csv_bytes,
-            mimetype="text/csv",
-            as_attachment=True,
-            download_name=f"decoded_{base_name}.csv",
-        )
+        return csv_download_response(export_rows, f"decoded_{base_name}.csv")
 
     return "Unsupported export format.", 400
 
@@ -7569,9 +5276,10 @@ def export_saved_results(fmt):
 @app.route("/analyze", methods=["GET"])
 @login_required
 def analyze_results():
-    token = request.args.get("token", "").strip()
-    saved_id = request.args.get("saved_id", "").strip()
-    scan_token = request.args.get("scan_token", "").strip()
+    args = request.args
+    token = args.get("token", "").strip()
+    saved_id = args.get("saved_id", "").strip()
+    scan_token = args.get("scan_token", "").strip()
     rows = None
     source_filename = ""
 
@@ -7613,8 +5321,8 @@ def analyze_results():
     if not source_filename:
         source_filename = "Decoded results"
 
-    analyze_payload = json.dumps(rows or [], ensure_ascii=True).replace("</", "<\\/")
-    field_meta_payload = json.dumps(FIELD_META or {}, ensure_ascii=True).replace("</", "<\\/")
+    analyze_payload = json_dumps(rows or []).decode("utf-8").replace("</", "<\\/")
+    field_meta_payload = json_dumps(FIELD_META or {}).decode("utf-8").replace("</", "<\\/")
     body_html = f"""
       <style>
         .card .subtitle {{ margin-bottom: 1rem; }}
@@ -9473,8 +7181,9 @@ def analyze_results():
 def generate_log_page():
     user_id = get_user_id()
     if request.method == "GET":
-        log_id = request.args.get("log_id", "").strip()
-        scan_token = request.args.get("scan_token", "").strip()
+        args = request.args
+        log_id = args.get("log_id", "").strip()
+        scan_token = args.get("scan_token", "").strip()
         generated_entry = get_stored_log_entry(log_id) if log_id else None
         return render_generator_page(
             generated_entry=generated_entry,
@@ -9491,16 +7200,15 @@ def generate_log_page():
 
     form_values = get_generator_form_values(request.form)
     try:
-        log_buffer, filename = generate_logfile_bytes(form_values)
+        frames, filename = generate_logfile_frames(form_values)
     except ValueError as exc:
         return render_generator_page(form_values=form_values, error_message=str(exc))
 
-    size_hint = log_buffer.getbuffer().nbytes
-    ok, message = check_user_log_quota(user_id, new_bytes=size_hint)
+    ok, message = check_user_log_quota(user_id)
     if not ok:
         return render_generator_page(form_values=form_values, error_message=message)
 
-    entry = store_generated_log(log_buffer, filename, user_id)
+    entry = store_generated_log(frames, filename, user_id)
     ok, message = enforce_user_log_quota_after_store(user_id, entry)
     if not ok:
         return render_generator_page(form_values=form_values, error_message=message)
@@ -9560,7 +7268,7 @@ def build_push_data(gateway_eui_hex: str, rxpk: dict) -> bytes:
 
     # Body
     body_obj = {"rxpk": [rxpk]}
-    body = json.dumps(body_obj, separators=(",", ":")).encode("utf-8")
+    body = json_dumps(body_obj)
 
     return bytes(header) + body
 
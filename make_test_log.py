@@ -191,6 +191,77 @@ def build_abp_uplink(
     return phy_payload
 
 
+def _cmac_subkeys(cipher) -> tuple[int, int]:
+    """
+    Derive the AES-CMAC subkeys K1/K2 (RFC 4493) as integers.
+    """
+    mask = (1 << 128) - 1
+    l_val = int.from_bytes(cipher.encrypt(bytes(16)), "big")
+    k1 = ((l_val << 1) & mask) ^ (0x87 if l_val >> 127 else 0)
+    k2 = ((k1 << 1) & mask) ^ (0x87 if k1 >> 127 else 0)
+    return k1, k2
+
+
+def _cmac_digest(cipher, k1: int, k2: int, msg: bytes) -> bytes:
+    """
+    AES-CMAC of msg using an already keyed ECB cipher and precomputed subkeys.
+    """
+    if msg and len(msg) % 16 == 0:
+        last_key = k1
+        padded = msg
+    else:
+        last_key = k2
+        padded = msg + b"\x80" + bytes(15 - len(msg) % 16)
+    state = 0
+    last = len(padded) - 16
+    for start in range(0, last, 16):
+        block = int.from_bytes(padded[start:start + 16], "big") ^ state
+        state = int.from_bytes(cipher.encrypt(block.to_bytes(16, "big")), "big")
+    block = int.from_bytes(padded[last:], "big") ^ state ^ last_key
+    return cipher.encrypt(block.to_bytes(16, "big"))
+
+
+def build_abp_uplink_batch(
+    devaddr_le: bytes,
+    nwk_skey: bytes,
+    app_skey: bytes,
+    fcnt_start: int,
+    num_frames: int,
+    app_payload: bytes,
+    fport: int = 1,
+    confirmed: bool = False,
+):
+    """
+    Yield num_frames consecutive ABP uplinks, identical to build_abp_uplink,
+    expanding the AES key schedules and CMAC subkeys only once.
+    """
+    mhdr = bytes([0x80 if confirmed else 0x40])
+    fport_b = bytes([fport & 0xFF])
+    direction = 0  # uplink
+    s_cipher = AES.new(nwk_skey if fport == 0 else app_skey, AES.MODE_ECB)
+    mic_cipher = AES.new(nwk_skey, AES.MODE_ECB)
+    k1, k2 = _cmac_subkeys(mic_cipher)
+    num_blocks = (len(app_payload) + 15) // 16
+    a_prefix = bytes([0x01, 0, 0, 0, 0, direction]) + devaddr_le
+    b0_prefix = bytes([0x49, 0, 0, 0, 0, direction]) + devaddr_le
+    payload_int = int.from_bytes(app_payload, "big")
+    size = len(app_payload)
+
+    for fcnt in range(fcnt_start, fcnt_start + num_frames):
+        fcnt_le = (fcnt & 0xFFFFFFFF).to_bytes(4, "little")
+        fhdr = devaddr_le + b"\x00" + fcnt_le[:2]
+        if size:
+            keystream = s_cipher.encrypt(
+                b"".join(a_prefix + fcnt_le + bytes([0, block_index & 0xFF]) for block_index in range(1, num_blocks + 1))
+            )
+            enc_frmpayload = (payload_int ^ int.from_bytes(keystream[:size], "big")).to_bytes(size, "big")
+        else:
+            enc_frmpayload = b""
+        msg = mhdr + fhdr + fport_b + enc_frmpayload
+        b0 = b0_prefix + fcnt_le + bytes([0, len(msg) & 0xFF])
+        yield msg + _cmac_digest(mic_cipher, k1, k2, b0 + msg)[:4]
+
+
 # ----------------------------------------------------------
 # MAIN: generate logfile
 # ----------------------------------------------------------
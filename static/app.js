@@ -0,0 +1,1154 @@
+function randomHex(byteLength) {
+  const array = new Uint8Array(byteLength);
+  if (window.crypto && window.crypto.getRandomValues) {
+    window.crypto.getRandomValues(array);
+  } else {
+    for (let i = 0; i < array.length; i++) {
+      array[i] = Math.floor(Math.random() * 256);
+    }
+  }
+  return Array.from(array, (byte) =>
+    byte.toString(16).padStart(2, "0")
+  ).join("").toUpperCase();
+}
+
+function generateField(fieldId, type) {
+  let value = "";
+  switch (type) {
+    case "gateway_eui":
+      value = randomHex(8);
+      break;
+    case "devaddr":
+      value = randomHex(4);
+      break;
+    case "skey":
+      value = randomHex(16);
+      break;
+    default:
+      return;
+  }
+  const input = document.getElementById(fieldId);
+  if (input) {
+    input.value = value;
+  }
+}
+
+function generatePassword(length = 16) {
+  const chars = "ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz23456789!@#$%";
+  const array = new Uint8Array(length);
+  if (window.crypto && window.crypto.getRandomValues) {
+    window.crypto.getRandomValues(array);
+  } else {
+    for (let i = 0; i < array.length; i++) {
+      array[i] = Math.floor(Math.random() * chars.length);
+    }
+  }
+  let out = "";
+  for (let i = 0; i < array.length; i++) {
+    out += chars[array[i] % chars.length];
+  }
+  return out;
+}
+function copyField(fieldId) {
+  const input = document.getElementById(fieldId);
+  if (!input) return;
+  input.select();
+  input.setSelectionRange(0, 99999);
+if (navigator.clipboard && navigator.clipboard.writeText) {
+  navigator.clipboard.writeText(input.value || "");
+} else {
+  document.execCommand("copy");
+}
+}
+
+function initSortableTable(section) {
+  if (!section) return;
+  const table = section.querySelector("[data-sortable-table]");
+  if (!table) return;
+  const tbody = table.querySelector("tbody");
+  const numericColumns = new Set(
+    (table.dataset.numericKeys || "").split(",").filter(Boolean)
+  );
+  const rowData = Array.from(tbody.rows).map((row) => {
+    const data = {};
+    Object.keys(row.dataset || {}).forEach((key) => {
+      const value = (row.dataset[key] || "").toLowerCase();
+      data[key] = numericColumns.has(key) ? parseFloat(value) || 0 : value;
+    });
+    return { element: row, data };
+  });
+  const collator = new Intl.Collator(undefined, { sensitivity: "base" });
+
+  let sortKey = table.dataset.defaultSortKey || null;
+  let sortDir = 1;
+  let pendingFrame = null;
+  const orderCache = new Map();
+
+  const limitSelect = section.querySelector("[data-table-limit]");
+
+  function apply() {
+    pendingFrame = null;
+    const cacheKey = sortKey ? `${sortKey}:${sortDir}` : "";
+    let rows = orderCache.get(cacheKey);
+    if (!rows) {
+      rows = rowData.slice();
+      if (sortKey) {
+        const numeric = numericColumns.has(sortKey);
+        rows.sort((a, b) => {
+          if (numeric) {
+            return sortDir * ((a.data[sortKey] || 0) - (b.data[sortKey] || 0));
+          }
+          return sortDir * collator.compare(a.data[sortKey] || "", b.data[sortKey] || "");
+        });
+      }
+      orderCache.set(cacheKey, rows);
+    }
+
+    let limit = rows.length;
+    if (limitSelect && limitSelect.value !== "all") {
+      const parsed = parseInt(limitSelect.value, 10);
+      if (!isNaN(parsed)) {
+        limit = Math.min(parsed, rows.length);
+      }
+    }
+
+    const fragment = document.createDocumentFragment();
+    for (let i = 0; i < limit; i += 1) {
+      fragment.appendChild(rows[i].element);
+    }
+    tbody.textContent = "";
+    tbody.appendChild(fragment);
+  }
+
+  function scheduleApply() {
+    if (pendingFrame === null) {
+      pendingFrame = window.requestAnimationFrame(apply);
+    }
+  }
+
+  let sortedButton = null;
+  table.tHead?.addEventListener("click", (event) => {
+    const button = event.target.closest("[data-sort-key]");
+    if (!button) return;
+    const key = button.dataset.sortKey;
+    if (sortKey === key) {
+      sortDir *= -1;
+    } else {
+      sortKey = key;
+      sortDir = 1;
+    }
+    if (sortedButton && sortedButton !== button) {
+      sortedButton.className = "";
+    }
+    button.className = sortDir === 1 ? "sorted-asc" : "sorted-desc";
+    sortedButton = button;
+    scheduleApply();
+  });
+
+  if (limitSelect) {
+    limitSelect.addEventListener("change", scheduleApply);
+  }
+
+  apply();
+}
+
+function whenVisible(element, callback) {
+  if (!element) return;
+  if (!("IntersectionObserver" in window)) {
+    callback();
+    return;
+  }
+  const observer = new IntersectionObserver((entries) => {
+    if (entries.some((entry) => entry.isIntersecting)) {
+      observer.disconnect();
+      callback();
+    }
+  });
+  observer.observe(element);
+}
+
+function initTruncatedCell(cell) {
+  const full = cell.dataset.full || "";
+  if (!full || full.length <= 80) {
+    cell.textContent = full;
+    return;
+  }
+  const preview = full.slice(0, 80) + "…";
+  cell.textContent = preview;
+  cell.classList.add("truncate-cell");
+  cell.addEventListener("click", () => {
+    const isExpanded = cell.classList.toggle("expanded");
+    cell.textContent = isExpanded ? full : preview;
+  });
+}
+
+function initTruncation(section) {
+  if (!section) return;
+  const cells = section.getElementsByClassName("truncate");
+  for (let i = 0; i < cells.length; i++) {
+    initTruncatedCell(cells[i]);
+  }
+}
+
+function initDetailOverlay(section, refs) {
+  if (!section) return;
+  const overlay = refs.detailOverlay;
+  if (!overlay) return;
+  const title = document.getElementById("detail_title");
+  const meta = document.getElementById("detail_meta");
+  const payload = document.getElementById("detail_payload");
+  const decoded = document.getElementById("detail_decoded");
+  const closeBtn = document.getElementById("detail_close");
+  const metaFields = [
+    ["status", "Status"],
+    ["devaddr", "DevAddr"],
+    ["fcnt", "FCnt"],
+    ["fport", "FPort"],
+    ["time", "Time parsed"],
+    ["timeUnix", "Timestamp"],
+    ["timeUtc", "Time (UTC)"],
+  ];
+  const metaValues = {};
+  metaFields.forEach(([key, label]) => {
+    const item = document.createElement("div");
+    const strong = document.createElement("strong");
+    strong.textContent = `${label}:`;
+    const value = document.createElement("span");
+    metaValues[key] = value;
+    item.append(strong, " ", value);
+    meta.appendChild(item);
+  });
+
+  const close = () => {
+    overlay.hidden = true;
+  };
+  closeBtn?.addEventListener("click", close);
+  overlay.addEventListener("click", (event) => {
+    if (event.target === overlay) {
+      close();
+    }
+  });
+
+  section.addEventListener("click", (event) => {
+    const btn = event.target.closest("[data-detail-trigger]");
+    if (!btn) return;
+    const row = btn.closest("tr");
+    if (!row) return;
+    const data = row.dataset;
+    title.textContent = `Packet #${data.index || "?"}`;
+    metaFields.forEach(([key]) => {
+      metaValues[key].textContent = data[key] || "-";
+    });
+    payload.textContent = data.payload || "";
+    decoded.textContent = data.decodedPretty || "";
+    overlay.hidden = false;
+  });
+}
+
+function initFileList() {
+  const list = document.querySelector("[data-file-list]");
+  if (!list) return;
+  const items = Array.from(list.querySelectorAll("[data-file-item]"));
+  const searchInput = document.querySelector("[data-file-search]");
+  const sortSelect = document.querySelector("[data-file-sort]");
+  let emptyState = list.querySelector("[data-file-empty]");
+
+  const parseDate = (value) => {
+    if (!value) return 0;
+    const cleaned = value.replace(" UTC", "Z").replace(" ", "T");
+    const parsed = Date.parse(cleaned);
+    return Number.isFinite(parsed) ? parsed : 0;
+  };
+
+  const getName = (item) => (item.dataset.fileName || "").toLowerCase();
+  const getDate = (item) => parseDate(item.dataset.fileDate || "");
+
+  const applyList = () => {
+    const term = (searchInput?.value || "").toLowerCase().trim();
+    const sortValue = sortSelect?.value || "date_desc";
+    let filtered = items.filter((item) => {
+      if (!term) return true;
+      return getName(item).includes(term);
+    });
+
+    filtered = filtered.sort((a, b) => {
+      if (sortValue === "name_asc") {
+        return getName(a).localeCompare(getName(b));
+      }
+      if (sortValue === "name_desc") {
+        return getName(b).localeCompare(getName(a));
+      }
+      if (sortValue === "date_asc") {
+        return getDate(a) - getDate(b);
+      }
+      return getDate(b) - getDate(a);
+    });
+
+    const fragment = document.createDocumentFragment();
+    filtered.forEach((item) => fragment.appendChild(item));
+    list.innerHTML = "";
+    list.appendChild(fragment);
+
+    if (!filtered.length) {
+      if (!emptyState) {
+        emptyState = document.createElement("div");
+        emptyState.className = "hint";
+        emptyState.dataset.fileEmpty = "true";
+        emptyState.textContent = "No matching files.";
+      }
+      list.appendChild(emptyState);
+    }
+  };
+
+  searchInput?.addEventListener("input", applyList);
+  sortSelect?.addEventListener("change", applyList);
+  applyList();
+}
+
+function formatTimeParts(value, length) {
+  return String(value).padStart(length, "0");
+}
+
+function formatSendTime(msValue) {
+  if (msValue === undefined || msValue === null || msValue === "") {
+    return "-";
+  }
+  const msNumber = Number(msValue);
+  if (!Number.isFinite(msNumber)) {
+    return "-";
+  }
+  const date = new Date(msNumber);
+  if (Number.isNaN(date.getTime())) {
+    return "-";
+  }
+  return (
+    `${formatTimeParts(date.getUTCHours(), 2)}:` +
+    `${formatTimeParts(date.getUTCMinutes(), 2)}:` +
+    `${formatTimeParts(date.getUTCSeconds(), 2)}.` +
+    `${formatTimeParts(date.getUTCMilliseconds(), 3)}`
+  );
+}
+
+function initReplayStream(refs) {
+  const container = refs.replayStream;
+  if (!container) return;
+  const token = container.dataset.replayToken || "";
+  const statusUrl = container.dataset.replayStatusUrl || "";
+  const eventsUrl = container.dataset.replayEventsUrl || "";
+  if (!token || !statusUrl) return;
+
+  const statusBlock = document.getElementById("replay_status_text");
+  const progressFill = document.getElementById("replay_progress");
+  const progressText = document.getElementById("replay_progress_text");
+  const metaTarget = document.getElementById("replay_target");
+  const etaText = document.getElementById("replay_eta");
+  const logBody = refs.replayLogBody;
+  const stopButton = document.getElementById("stop_replay");
+  const resumeButton = document.getElementById("resume_replay");
+  const restartButton = document.getElementById("restart_replay");
+  let etaFrame = null;
+  let etaTick = null;
+
+  let received = 0;
+  let done = false;
+
+  const formatDuration = (ms) => {
+    const totalSeconds = Math.max(0, Math.ceil(ms / 1000));
+    const hours = Math.floor(totalSeconds / 3600);
+    const minutes = Math.floor((totalSeconds % 3600) / 60);
+    const seconds = totalSeconds % 60;
+    if (hours > 0) {
+      return `${hours}:${formatTimeParts(minutes, 2)}:${formatTimeParts(seconds, 2)}`;
+    }
+    return `${minutes}:${formatTimeParts(seconds, 2)}`;
+  };
+
+  const stopEta = () => {
+    if (etaFrame) {
+      cancelAnimationFrame(etaFrame);
+      etaFrame = null;
+    }
+    etaTick = null;
+  };
+
+  const updateEta = (data) => {
+    if (!etaText) return;
+    stopEta();
+    if (data.status !== "running") {
+      etaText.textContent = "ETA 0:00";
+      return;
+    }
+    const delayMs = Number(data.delay_ms) || 0;
+    const total = data.total || 0;
+    const processed = (data.sent || 0) + (data.errors || 0);
+    const remaining = Math.max(0, total - processed);
+    if (!delayMs || remaining === 0) {
+      etaText.textContent = "ETA 0:00";
+      return;
+    }
+    const targetTime = Date.now() + remaining * delayMs;
+    let lastText = "";
+    const render = () => {
+      const text = `ETA ${formatDuration(targetTime - Date.now())}`;
+      if (text !== lastText) {
+        lastText = text;
+        etaText.textContent = text;
+      }
+    };
+    const tick = () => {
+      render();
+      etaFrame = document.visibilityState === "visible" ? requestAnimationFrame(tick) : null;
+    };
+    tick();
+    etaTick = tick;
+  };
+
+  document.addEventListener("visibilitychange", () => {
+    if (document.visibilityState === "visible" && etaTick && !etaFrame && !done) {
+      etaTick();
+    }
+  });
+
+  const rendered = new Map();
+  const setText = (el, text) => {
+    if (el && rendered.get(el) !== text) {
+      rendered.set(el, text);
+      el.textContent = text;
+    }
+  };
+
+  const setButtonState = (button, baseClass, active) => {
+    if (!button) return;
+    const className = active ? baseClass : `${baseClass} is-hidden`;
+    if (button.className !== className) {
+      button.className = className;
+    }
+    if (button.disabled === active) {
+      button.disabled = !active;
+    }
+  };
+
+  const updateStatus = (data) => {
+    const total = data.total || 0;
+    const sent = data.sent || 0;
+    const errors = data.errors || 0;
+    const processed = sent + errors;
+    const percent = total ? Math.min(100, Math.round((processed / total) * 100)) : 0;
+
+    if (progressFill && rendered.get(progressFill) !== percent) {
+      rendered.set(progressFill, percent);
+      progressFill.style.width = `${percent}%`;
+    }
+    setText(progressText, `Sent ${sent} of ${total} · Errors ${errors}`);
+    setText(metaTarget, `Target ${data.host || "?"}:${data.port || "?"} · Delay ${data.delay_ms || 0} ms`);
+    if (statusBlock) {
+      let tone = "info";
+      let text = `Replaying... Sent ${sent} of ${total}.`;
+      if (data.status === "done") {
+        tone = errors === 0 ? "success" : "error";
+        text = `Replay done. Sent ${sent}, errors ${errors}.`;
+      } else if (data.status === "stopped") {
+        tone = "error";
+        text = `Replay stopped. Sent ${sent}, errors ${errors}.`;
+      }
+      const className = `result ${tone} replay-status`;
+      if (statusBlock.className !== className) {
+        statusBlock.className = className;
+      }
+      setText(statusBlock, text);
+    }
+    setButtonState(stopButton, "stop-replay-button", data.status === "running");
+    setButtonState(resumeButton, "resume-replay-button", data.status === "stopped");
+    setButtonState(restartButton, "restart-replay-button", data.status === "stopped" || data.status === "done");
+    updateEta(data);
+  };
+
+  const rowTemplate = document.createElement("template");
+  rowTemplate.innerHTML =
+    '<tr><td></td><td></td><td class="send-time-cell"></td><td></td><td></td><td></td><td></td><td></td></tr>';
+  const rowFields = [
+    ["index", "index"],
+    ["status", "status"],
+    ["sendTimeMs", "send_time_ms"],
+    ["gateway", "gateway"],
+    ["fcnt", "fcnt"],
+    ["freq", "freq"],
+    ["size", "size"],
+    ["message", "message"],
+  ];
+  const cellText = (value) => (value === undefined || value === null || value === "" ? "-" : value);
+
+  const buildRow = (line) => {
+    const row = rowTemplate.content.firstElementChild.cloneNode(true);
+    row.className = line.css || "";
+    for (let i = 0; i < rowFields.length; i++) {
+      row.dataset[rowFields[i][0]] = line[rowFields[i][1]] ?? "";
+    }
+    const cells = row.children;
+    cells[0].textContent = cellText(line.index);
+    cells[1].textContent = cellText(line.status);
+    cells[2].textContent = line.send_time_str || formatSendTime(line.send_time_ms);
+    cells[3].textContent = cellText(line.gateway);
+    cells[4].textContent = cellText(line.fcnt);
+    cells[5].textContent = cellText(line.freq);
+    cells[6].textContent = cellText(line.size);
+    cells[7].textContent = cellText(line.message);
+    return row;
+  };
+
+  const appendLines = (lines) => {
+    if (!logBody || !Array.isArray(lines) || lines.length === 0) return;
+    const fragment = document.createDocumentFragment();
+    lines.forEach((line) => fragment.appendChild(buildRow(line)));
+    logBody.appendChild(fragment);
+  };
+
+  const VIRTUAL_ROWS = 500;
+  const OVERSCAN = 20;
+  const allLines = [];
+  let virtual = false;
+  let rowHeight = 32;
+  let windowKey = "";
+  let windowFrame = null;
+
+  const spacerRow = (height) => {
+    const row = document.createElement("tr");
+    row.className = "virtual-spacer";
+    const cell = document.createElement("td");
+    cell.colSpan = rowFields.length;
+    cell.style.cssText = `height:${height}px;padding:0;border:0`;
+    row.appendChild(cell);
+    return row;
+  };
+
+  const renderWindow = () => {
+    windowFrame = null;
+    if (!logBody || !virtual) return;
+    const total = allLines.length;
+    const bodyTop = logBody.getBoundingClientRect().top + window.scrollY;
+    const visible = Math.ceil(window.innerHeight / rowHeight);
+    const first = Math.min(total, Math.max(0, Math.floor((window.scrollY - bodyTop) / rowHeight) - OVERSCAN));
+    const last = Math.min(total, first + visible + OVERSCAN * 2);
+    const key = `${first}:${last}:${total}`;
+    if (key === windowKey) return;
+    windowKey = key;
+    const fragment = document.createDocumentFragment();
+    if (first > 0) {
+      fragment.appendChild(spacerRow(first * rowHeight));
+    }
+    for (let i = first; i < last; i++) {
+      fragment.appendChild(buildRow(allLines[i]));
+    }
+    if (last < total) {
+      fragment.appendChild(spacerRow((total - last) * rowHeight));
+    }
+    logBody.replaceChildren(fragment);
+  };
+
+  const scheduleWindow = () => {
+    if (virtual && windowFrame === null) {
+      windowFrame = requestAnimationFrame(renderWindow);
+    }
+  };
+  window.addEventListener("scroll", scheduleWindow, { passive: true });
+  window.addEventListener("resize", scheduleWindow, { passive: true });
+
+  const appendRows = (data) => {
+    for (let i = 0; i < data.lines.length; i++) {
+      allLines.push(data.lines[i]);
+    }
+    if (!virtual && allLines.length > VIRTUAL_ROWS && logBody) {
+      rowHeight = logBody.rows[0]?.offsetHeight || rowHeight;
+      virtual = true;
+    }
+    if (virtual) {
+      renderWindow();
+    } else if (typeof data.html === "string" && logBody) {
+      logBody.insertAdjacentHTML("beforeend", data.html);
+    } else {
+      appendLines(data.lines);
+    }
+  };
+
+  const batch = {
+    reads: [],
+    writes: [],
+    frame: null,
+    flush() {
+      if (this.frame !== null) return;
+      this.frame = requestAnimationFrame(() => {
+        this.frame = null;
+        this.reads.splice(0).forEach((fn) => fn());
+        this.writes.splice(0).forEach((fn) => fn());
+      });
+    },
+  };
+
+  let lastSignature = "";
+
+  const applyData = (data) => {
+    if (typeof data.count === "number") {
+      received = data.count;
+    }
+    if (data.status === "done" || data.status === "stopped") {
+      done = true;
+    }
+    const hasLines = Array.isArray(data.lines) && data.lines.length > 0;
+    const signature = `${data.count}|${data.sent}|${data.errors}|${data.status}`;
+    if (signature === lastSignature && !hasLines) {
+      return;
+    }
+    lastSignature = signature;
+    let pinned = false;
+    if (hasLines) {
+      batch.reads.push(() => {
+        const root = document.documentElement;
+        pinned = window.scrollY + window.innerHeight >= root.scrollHeight - 40;
+      });
+    }
+    batch.writes.push(() => {
+      if (hasLines) {
+        appendRows(data);
+      }
+      updateStatus(data);
+      if (pinned) {
+        window.scrollTo(0, document.documentElement.scrollHeight);
+      }
+    });
+    batch.flush();
+  };
+
+  let pollTimer = null;
+  let pollPaused = false;
+  const schedulePoll = (interval) => {
+    if (done) return;
+    if (document.visibilityState === "hidden") {
+      pollPaused = true;
+      return;
+    }
+    pollTimer = window.setTimeout(poll, interval);
+  };
+  const pollInterval = (data, changed) => {
+    const base = Math.max(200, Math.min(Number(data.delay_ms) || 600, 2000));
+    return changed ? base : Math.min(base * 2, 4000);
+  };
+
+  const poll = () => {
+    pollTimer = null;
+    if (done) return;
+    const url = new URL(statusUrl, window.location.origin);
+    url.searchParams.set("token", token);
+    url.searchParams.set("since", String(received));
+    fetch(url.toString(), { cache: "no-cache" })
+      .then((response) => {
+        if (!response.ok) {
+          throw new Error("Replay status request failed.");
+        }
+        return response.json();
+      })
+      .then((data) => {
+        if (data.error) {
+          throw new Error(data.error);
+        }
+        const previous = received;
+        applyData(data);
+        schedulePoll(pollInterval(data, received !== previous));
+      })
+      .catch(() => {
+        schedulePoll(1200);
+      });
+  };
+
+  document.addEventListener("visibilitychange", () => {
+    if (document.visibilityState === "visible" && pollPaused && !pollTimer) {
+      pollPaused = false;
+      poll();
+    }
+  });
+
+  const listen = () => {
+    const url = new URL(eventsUrl, window.location.origin);
+    url.searchParams.set("token", token);
+    url.searchParams.set("since", String(received));
+    const source = new EventSource(url.toString());
+    let opened = false;
+    source.onopen = () => {
+      opened = true;
+    };
+    source.onmessage = (event) => {
+      let data = null;
+      try {
+        data = JSON.parse(event.data);
+      } catch (error) {
+        return;
+      }
+      applyData(data);
+      if (done) {
+        source.close();
+      }
+    };
+    source.onerror = () => {
+      if (done) {
+        source.close();
+        return;
+      }
+      if (!opened || source.readyState === EventSource.CLOSED) {
+        source.close();
+        poll();
+      }
+    };
+  };
+
+  if (eventsUrl && "EventSource" in window) {
+    listen();
+  } else {
+    poll();
+  }
+}
+
+document.addEventListener("DOMContentLoaded", () => {
+  const byId = (id) => document.getElementById(id);
+  const bySelector = (selector) => document.querySelector(selector);
+  const refs = Object.freeze({
+    logSection: byId("log_section"),
+    decodeSection: byId("decode_section"),
+    detailOverlay: byId("detail_overlay"),
+    replayStream: byId("replay_stream"),
+    replayLogBody: byId("replay_log_body"),
+    drop: byId("file_drop"),
+    overlay: byId("loading_overlay"),
+    fileInput: byId("logfile"),
+    selected: byId("file_selected"),
+    payloadSelect: byId("payload_example"),
+    payloadInput: byId("app_payload_hex"),
+    fportInput: byId("fport"),
+    decodeOverlay: byId("decode_overlay"),
+    scanOverlay: bySelector("[data-scan-overlay]"),
+    generatedOverlay: bySelector("[data-generated-overlay]"),
+    passwordModal: bySelector("[data-password-modal]"),
+    deleteForm: bySelector("[data-delete-form]"),
+    decoderDeleteForm: bySelector("[data-decoder-delete-form]"),
+    fileDeleteForm: bySelector("[data-file-delete-form]"),
+    menuToggle: bySelector("[data-menu-toggle]"),
+    menuPanel: byId("site-menu"),
+  });
+  const { logSection, decodeSection } = refs;
+  if (logSection && !logSection.dataset.liveReplay) {
+    whenVisible(logSection, () => {
+      initTruncation(logSection);
+      initSortableTable(logSection);
+    });
+  }
+  whenVisible(decodeSection, () => {
+    initTruncation(decodeSection);
+    initSortableTable(decodeSection);
+    initDetailOverlay(decodeSection, refs);
+  });
+  initFileList();
+  initReplayStream(refs);
+  const toggleVisibility = (button) => {
+    const input = document.getElementById(button.dataset.toggleVisibility);
+    if (!input) return;
+    const isHidden = input.type === "password";
+    input.type = isHidden ? "text" : "password";
+    button.setAttribute("aria-pressed", isHidden ? "true" : "false");
+    button.title = isHidden ? "Hide key" : "Show key";
+  };
+  const { drop, overlay, selected, payloadSelect, payloadInput, fportInput } = refs;
+  const form = drop?.closest("form");
+  const input = refs.fileInput;
+
+  if (payloadSelect && payloadInput && fportInput) {
+    payloadSelect.addEventListener("change", () => {
+      const opt = payloadSelect.selectedOptions[0];
+      const payload = opt?.value;
+      const port = opt?.dataset.port;
+      if (payload) {
+        payloadInput.value = payload;
+      }
+      if (port) {
+        fportInput.value = port;
+      }
+    });
+  }
+
+  if (drop && input && selected) {
+    const updateLabel = () => {
+      if (input.files && input.files.length > 0) {
+        selected.textContent = input.files.length === 1 ? input.files[0].name : `${input.files.length} files selected`;
+      }
+    };
+    const autoScan = () => {
+      if (!input.files || input.files.length === 0) {
+        return;
+      }
+      const scanUrl = form?.dataset.scanUrl;
+      if (!form || !scanUrl) {
+        return;
+      }
+      form.action = scanUrl;
+      const uploadUrl = form.dataset.uploadUrl;
+      if (!uploadUrl || input.files.length !== 1 || !window.fetch) {
+        form.submit();
+        return;
+      }
+      const file = input.files[0];
+      const csrfToken = form.querySelector('input[name="csrf_token"]')?.value || "";
+      if (overlay) overlay.hidden = false;
+      fetch(uploadUrl, {
+        method: "PUT",
+        credentials: "same-origin",
+        headers: {
+          "Content-Type": "application/octet-stream",
+          "X-CSRF-Token": csrfToken,
+          "X-Filename": encodeURIComponent(file.name),
+        },
+        body: file,
+      })
+        .then((response) => (response.ok ? response.json() : Promise.reject(response)))
+        .then((data) => {
+          if (form.querySelector('input[name="redirect_to"]')?.value === "files") {
+            window.location.reload();
+            return;
+          }
+          input.value = "";
+          const storedSelect = form.querySelector('select[name="stored_log_id"]');
+          if (storedSelect) {
+            storedSelect.add(new Option(data.filename, data.log_id, true, true));
+          } else {
+            const hidden = document.createElement("input");
+            hidden.type = "hidden";
+            hidden.name = "stored_log_id";
+            hidden.value = data.log_id;
+            form.appendChild(hidden);
+          }
+          form.submit();
+        })
+        .catch(() => {
+          form.submit();
+        });
+    };
+
+    drop.addEventListener("click", () => input.click());
+
+    const handleDrag = (e) => {
+      e.preventDefault();
+      e.stopPropagation();
+      if (e.type === "dragenter" || e.type === "dragover") {
+        drop.classList.add("dragover");
+        return;
+      }
+      if (e.type === "drop" && e.dataTransfer?.files?.length) {
+        input.files = e.dataTransfer.files;
+        updateLabel();
+        autoScan();
+      }
+      drop.classList.remove("dragover");
+    };
+    ["dragenter", "dragover", "dragleave", "drop"].forEach((evt) => drop.addEventListener(evt, handleDrag));
+
+    input.addEventListener("change", () => {
+      updateLabel();
+      autoScan();
+    });
+    updateLabel();
+  }
+
+  if (overlay) {
+    document.querySelectorAll("form").forEach((formEl) => {
+      formEl.addEventListener("submit", (event) => {
+        const submitter = event.submitter;
+        if (submitter && submitter.dataset.showLoader === "true") {
+          overlay.hidden = false;
+        }
+      });
+    });
+  }
+
+  const decodeOverlay = refs.decodeOverlay;
+  if (decodeOverlay) {
+    const progressUrl = decodeOverlay.dataset.decodeProgressUrl || "";
+    const progressFill = document.getElementById("decode_progress");
+    const progressText = document.getElementById("decode_progress_text");
+    const progressPercent = document.getElementById("decode_progress_percent");
+    const makeProgressId = () => {
+      if (window.crypto?.randomUUID) return window.crypto.randomUUID();
+      return `p_${Date.now()}_${Math.random().toString(16).slice(2)}`;
+    };
+    let decodePollTimer = null;
+    const stopDecodePoll = () => {
+      if (decodePollTimer) {
+        clearInterval(decodePollTimer);
+        decodePollTimer = null;
+      }
+    };
+    const startDecodePoll = (progressId) => {
+      if (!progressUrl || !progressId) return;
+      const poll = async () => {
+        try {
+          const response = await fetch(`${progressUrl}?progress_id=${encodeURIComponent(progressId)}`, {
+            credentials: "same-origin",
+            cache: "no-cache"
+          });
+          if (!response.ok) return;
+          const data = await response.json();
+          const total = Number(data.total) || 0;
+          const completed = Number(data.completed) || 0;
+          const percent = total ? Math.min(100, Math.max(0, Math.round((completed / total) * 100))) : 0;
+          if (progressFill) {
+            const hue = Math.max(140, 215 - Math.round(percent * 0.6));
+            progressFill.style.width = `${percent}%`;
+            progressFill.style.background = `linear-gradient(90deg, hsl(${hue}, 85%, 45%), hsl(${hue + 15}, 85%, 55%))`;
+          }
+          if (progressPercent) progressPercent.textContent = `${percent}%`;
+          if (progressText) {
+            progressText.textContent = total
+              ? `Decoding ${completed} of ${total}`
+              : "Decoding…";
+          }
+        } catch (err) {
+          stopDecodePoll();
+        }
+      };
+      stopDecodePoll();
+      decodePollTimer = window.setInterval(poll, 500);
+      poll();
+    };
+    document.querySelectorAll("form").forEach((formEl) => {
+      formEl.addEventListener("submit", (event) => {
+        const submitter = event.submitter;
+        if (submitter && submitter.dataset.showDecodeLoader === "true") {
+          event.preventDefault();
+          const progressId = makeProgressId();
+          const progressInput = formEl.querySelector("[data-decode-progress-id]");
+          if (progressInput) progressInput.value = progressId;
+          if (progressFill) progressFill.style.width = "0%";
+          if (progressText) progressText.textContent = "Decoding…";
+          if (progressPercent) progressPercent.textContent = "0%";
+          decodeOverlay.hidden = false;
+          startDecodePoll(progressId);
+          const actionUrl = formEl.getAttribute("action") || window.location.href;
+          fetch(actionUrl, {
+            method: formEl.method || "POST",
+            body: new FormData(formEl),
+            credentials: "same-origin"
+          }).then((response) => response.text())
+            .then((html) => {
+              stopDecodePoll();
+              document.open();
+              document.write(html);
+              document.close();
+            })
+            .catch(() => {
+              stopDecodePoll();
+              if (progressText) progressText.textContent = "Decode failed. Please retry.";
+            });
+        }
+      });
+    });
+  }
+
+  const scanOverlay = refs.scanOverlay;
+  if (scanOverlay) {
+    const closeBtn = scanOverlay.querySelector("[data-scan-close]");
+    const close = () => {
+      scanOverlay.hidden = true;
+    };
+    closeBtn?.addEventListener("click", close);
+    scanOverlay.addEventListener("click", (event) => {
+      if (event.target === scanOverlay) {
+        close();
+      }
+    });
+  }
+
+  const generatedOverlay = refs.generatedOverlay;
+  if (generatedOverlay) {
+    const downloadUrl = generatedOverlay.dataset.generatedDownloadUrl || "";
+    const downloadName = generatedOverlay.dataset.generatedFilename || "";
+    if (downloadUrl) {
+      const directLink = document.createElement("a");
+      directLink.href = downloadUrl;
+      if (downloadName) {
+        directLink.download = downloadName;
+      }
+      directLink.click();
+    }
+    const closeBtn = generatedOverlay.querySelector("[data-generated-close]");
+    const close = () => {
+      generatedOverlay.hidden = true;
+    };
+    closeBtn?.addEventListener("click", close);
+    generatedOverlay.addEventListener("click", (event) => {
+      if (event.target === generatedOverlay) {
+        close();
+      }
+    });
+  }
+
+  let openPasswordModal = null;
+  const passwordModal = refs.passwordModal;
+  if (passwordModal) {
+    const closeBtn = passwordModal.querySelector("[data-password-close]");
+    const usernameField = passwordModal.querySelector("[data-password-username]");
+    const userLabel = passwordModal.querySelector("[data-password-user]");
+    const passwordInput = passwordModal.querySelector("[data-password-input]");
+    const generateBtn = passwordModal.querySelector("[data-password-generate]");
+    const copyBtn = passwordModal.querySelector("[data-password-copy]");
+
+    const open = (username) => {
+      if (usernameField) usernameField.value = username;
+      if (userLabel) userLabel.textContent = username;
+      if (passwordInput) passwordInput.value = "";
+      passwordModal.hidden = false;
+    };
+
+    const close = () => {
+      passwordModal.hidden = true;
+    };
+
+    openPasswordModal = open;
+
+    generateBtn?.addEventListener("click", () => {
+      if (!passwordInput) return;
+      passwordInput.value = generatePassword(16);
+    });
+
+    copyBtn?.addEventListener("click", () => {
+      if (!passwordInput) return;
+      passwordInput.select();
+      passwordInput.setSelectionRange(0, 99999);
+      if (navigator.clipboard && navigator.clipboard.writeText) {
+        navigator.clipboard.writeText(passwordInput.value || "");
+      } else {
+        document.execCommand("copy");
+      }
+    });
+
+    closeBtn?.addEventListener("click", close);
+    passwordModal.addEventListener("click", (event) => {
+      if (event.target === passwordModal) {
+        close();
+      }
+    });
+  }
+
+  document.querySelectorAll(".field-controls").forEach((controls) => {
+    if (passwordModal && passwordModal.contains(controls)) {
+      return;
+    }
+    const input = controls.querySelector("[data-password-input]");
+    if (!input) return;
+    const generateBtn = controls.querySelector("[data-password-generate]");
+    const copyBtn = controls.querySelector("[data-password-copy]");
+    generateBtn?.addEventListener("click", () => {
+      input.value = generatePassword(16);
+    });
+    copyBtn?.addEventListener("click", () => {
+      input.select();
+      input.setSelectionRange(0, 99999);
+      if (navigator.clipboard && navigator.clipboard.writeText) {
+        navigator.clipboard.writeText(input.value || "");
+      } else {
+        document.execCommand("copy");
+      }
+    });
+  });
+
+  document.querySelectorAll("[data-user-name]").forEach((el) => {
+    const name = el.dataset.userName || "";
+    let hash = 0;
+    for (let i = 0; i < name.length; i++) {
+      hash = ((hash << 5) - hash) + name.charCodeAt(i);
+      hash |= 0;
+    }
+    const hue = Math.abs(hash) % 360;
+    el.style.color = `hsl(${hue}, 68%, 36%)`;
+  });
+
+  const tempPasswordInput = document.querySelector("[data-temp-password]");
+  const tempGenerateBtn = document.querySelector("[data-temp-generate]");
+  const tempCopyBtn = document.querySelector("[data-temp-copy]");
+  if (tempPasswordInput && tempGenerateBtn) {
+    tempGenerateBtn.addEventListener("click", () => {
+      tempPasswordInput.value = generatePassword(16);
+    });
+  }
+  if (tempPasswordInput && tempCopyBtn) {
+    tempCopyBtn.addEventListener("click", () => {
+      tempPasswordInput.select();
+      tempPasswordInput.setSelectionRange(0, 99999);
+      if (navigator.clipboard && navigator.clipboard.writeText) {
+        navigator.clipboard.writeText(tempPasswordInput.value || "");
+      } else {
+        document.execCommand("copy");
+      }
+    });
+  }
+
+  const submitDelete = (deleteForm, inputSelector, value, message) => {
+    if (!deleteForm || !value) return;
+    if (!confirm(message)) {
+      return;
+    }
+    const deleteInput = deleteForm.querySelector(inputSelector);
+    if (deleteInput) {
+      deleteInput.value = value;
+    }
+    deleteForm.submit();
+  };
+
+  document.addEventListener("click", (event) => {
+    const button = event.target.closest(
+      "[data-toggle-visibility],[data-password-reset],[data-delete-devaddr],[data-delete-decoder],[data-delete-file]"
+    );
+    if (!button) return;
+    const data = button.dataset;
+    if (data.toggleVisibility !== undefined) {
+      toggleVisibility(button);
+    } else if (data.passwordReset !== undefined) {
+      if (openPasswordModal && data.passwordReset) {
+        openPasswordModal(data.passwordReset);
+      }
+    } else if (data.deleteDevaddr !== undefined) {
+      submitDelete(refs.deleteForm, "[data-delete-input]", data.deleteDevaddr, `Remove device ${data.deleteDevaddr}?`);
+    } else if (data.deleteDecoder !== undefined) {
+      submitDelete(refs.decoderDeleteForm, "[data-decoder-delete-input]", data.deleteDecoder, "Remove this decoder?");
+    } else if (data.deleteFile !== undefined) {
+      submitDelete(refs.fileDeleteForm, "[data-file-delete-input]", data.deleteFile, "Remove this log file?");
+    }
+  });
+
+  const { menuToggle, menuPanel } = refs;
+  if (menuToggle && menuPanel) {
+    const closeMenu = () => {
+      menuPanel.hidden = true;
+      menuToggle.classList.remove("open");
+      menuToggle.setAttribute("aria-expanded", "false");
+    };
+    const openMenu = () => {
+      menuPanel.hidden = false;
+      menuToggle.classList.add("open");
+      menuToggle.setAttribute("aria-expanded", "true");
+    };
+    menuToggle.addEventListener("click", () => {
+      if (menuPanel.hidden) {
+        openMenu();
+      } else {
+        closeMenu();
+      }
+    });
+    menuPanel.addEventListener("click", (event) => {
+      if (event.target.closest("a")) {
+        closeMenu();
+      }
+    });
+    document.addEventListener("click", (event) => {
+      if (menuPanel.hidden) return;
+      if (menuPanel.contains(event.target) || menuToggle.contains(event.target)) {
+        return;
+      }
+      closeMenu();
+    });
+  }
+});